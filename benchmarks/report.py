@@ -0,0 +1,87 @@
+import json
+import math
+from collections import defaultdict
+from typing import Dict, List
+
+
+def percentile(sorted_values: List[float], ratio: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = max(math.ceil(ratio * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
+
+
+class BenchRecorder:
+    """
+    엔드포인트별 지연 시간(ms)과 오류 수 수집
+    """
+
+    def __init__(self):
+        self._latencies: Dict[str, List[float]] = defaultdict(list)
+        self._errors: Dict[str, int] = defaultdict(int)
+        self._status_codes: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record(self, endpoint: str, status_code: int, elapsed_ms: float) -> None:
+        self._latencies[endpoint].append(elapsed_ms)
+        self._status_codes[endpoint][status_code] += 1
+        if status_code >= 400:
+            self._errors[endpoint] += 1
+
+    def summary(self, elapsed_seconds: float) -> Dict[str, Dict]:
+        endpoints = {}
+        all_latencies: List[float] = []
+        for endpoint, latencies in sorted(self._latencies.items()):
+            all_latencies.extend(latencies)
+            endpoints[endpoint] = self._stats(latencies, elapsed_seconds)
+            endpoints[endpoint]["errors"] = self._errors[endpoint]
+            endpoints[endpoint]["status_codes"] = dict(self._status_codes[endpoint])
+
+        overall = self._stats(all_latencies, elapsed_seconds)
+        overall["errors"] = sum(self._errors.values())
+        return {"elapsed_seconds": round(elapsed_seconds, 3), "overall": overall, "endpoints": endpoints}
+
+    @staticmethod
+    def _stats(latencies: List[float], elapsed_seconds: float) -> Dict:
+        ordered = sorted(latencies)
+        return {
+            "requests": len(ordered),
+            "rps": round(len(ordered) / elapsed_seconds, 2) if elapsed_seconds else 0.0,
+            "p50_ms": round(percentile(ordered, 0.50), 3),
+            "p95_ms": round(percentile(ordered, 0.95), 3),
+            "p99_ms": round(percentile(ordered, 0.99), 3),
+            "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+        }
+
+
+def format_summary(summary: Dict) -> str:
+    header = f"{'endpoint':<14}{'requests':>10}{'rps':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'errors':>8}"
+    lines = [header, "-" * len(header)]
+    rows = list(summary["endpoints"].items()) + [("overall", summary["overall"])]
+    for endpoint, stats in rows:
+        lines.append(
+            f"{endpoint:<14}{stats['requests']:>10}{stats['rps']:>10.1f}{stats['p50_ms']:>10.2f}"
+            f"{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}{stats['errors']:>8}"
+        )
+    return "\n".join(lines)
+
+
+def compare_with_baseline(summary: Dict, baseline_path: str, threshold: float) -> List[str]:
+    """
+    기준 결과 대비 p95/p99 증가율 또는 rps 감소율이 threshold 를 넘는 항목 목록
+    """
+    with open(baseline_path, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    regressions = []
+    targets = {"overall": (summary["overall"], baseline["overall"])}
+    for endpoint, stats in summary["endpoints"].items():
+        if endpoint in baseline["endpoints"]:
+            targets[endpoint] = (stats, baseline["endpoints"][endpoint])
+
+    for endpoint, (current, previous) in targets.items():
+        for key in ("p95_ms", "p99_ms"):
+            if previous[key] and (current[key] - previous[key]) / previous[key] > threshold:
+                regressions.append(f"{endpoint} {key}: {previous[key]} -> {current[key]}")
+        if previous["rps"] and (previous["rps"] - current["rps"]) / previous["rps"] > threshold:
+            regressions.append(f"{endpoint} rps: {previous['rps']} -> {current['rps']}")
+    return regressions
@@ -0,0 +1,127 @@
+"""
+예약 API 부하 테스트 / 벤치마크
+
+앱을 프로세스 안에서(ASGI) 직접 호출하므로 네트워크/uvicorn 비용 없이 핸들러~DB 구간을 측정합니다.
+- DB: 로컬 MySQL 컨테이너 (benchmarks/docker-compose.yml)
+- SSM: APP_ENV=development 로 실행해 환경 변수에서 DB 설정/JWT 시크릿을 읽음 (AWS 호출 없음)
+- JWT: USER_JWT_SECRET 으로 벤치마크용 사용자 토큰을 직접 발급
+
+사용 예)
+    docker compose -f benchmarks/docker-compose.yml up -d
+    python -m benchmarks.run --requests 5000 --concurrency 32 --output bench_baseline.json
+    python -m benchmarks.run --requests 5000 --concurrency 32 --baseline bench_baseline.json
+    python -m benchmarks.run --replay recorded_traffic.jsonl --baseline bench_baseline.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from time import perf_counter
+
+
+# 앱 모듈을 불러오기 전에 개발 환경 설정 적용 (모듈 로드 시점에 읽는 설정이 있음)
+os.environ.setdefault("APP_ENV", "development")
+os.environ.setdefault("REGION_NAME", "ap-northeast-2")
+os.environ.setdefault("RESERVATION_DB_HOST", "127.0.0.1:3307")
+os.environ.setdefault("RESERVATION_DB_NAME", "spaceplaceDB")
+os.environ.setdefault("RESERVATION_DB_USERNAME", "root")
+os.environ.setdefault("RESERVATION_DB_PASSWORD", "1234")
+os.environ.setdefault("USER_JWT_SECRET", "BENCHMARK_JWT_SECRET")
+# 가상 사용자 수가 적어 사용자별 요청 제한에 걸리지 않도록 기본 비활성화
+os.environ.setdefault("RATE_LIMIT_PER_SECOND", "0")
+
+import httpx
+
+from benchmarks.report import BenchRecorder, compare_with_baseline, format_summary
+from benchmarks.scenarios import BenchState, ReplayTraffic, SyntheticTraffic, make_token
+
+
+async def _worker(client, traffic, state, recorder, tokens, remaining) -> None:
+    while True:
+        if remaining[0] <= 0:
+            return
+        remaining[0] -= 1
+
+        request = traffic.next(state)
+        token = tokens.get(request.user_id)
+        if token is None:
+            token = tokens[request.user_id] = make_token(request.user_id, os.environ["USER_JWT_SECRET"])
+
+        started_at = perf_counter()
+        response = await client.request(
+            request.method,
+            request.path,
+            json=request.json,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        recorder.record(request.endpoint, response.status_code, (perf_counter() - started_at) * 1000)
+
+        if request.captures_order_number and response.status_code == 200:
+            state.pending_orders.append((response.json()["order_number"], request.user_id))
+
+
+async def run_benchmark(args) -> dict:
+    from main import app, lifespan
+
+    if args.replay:
+        traffic = ReplayTraffic(args.replay)
+    else:
+        traffic = SyntheticTraffic(users=args.users, spaces=args.spaces, seed=args.seed)
+
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            tokens = {}
+
+            # 워밍업: 캐시/커넥션 풀 준비 (결과에 포함하지 않음)
+            await asyncio.gather(*(
+                _worker(client, traffic, BenchState(), BenchRecorder(), tokens, [args.warmup // args.concurrency])
+                for _ in range(args.concurrency)
+            ))
+
+            state = BenchState()
+            recorder = BenchRecorder()
+            remaining = [args.requests]
+            started_at = perf_counter()
+            await asyncio.gather(*(
+                _worker(client, traffic, state, recorder, tokens, remaining)
+                for _ in range(args.concurrency)
+            ))
+            return recorder.summary(perf_counter() - started_at)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="예약 API 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000, help="측정 요청 수")
+    parser.add_argument("--warmup", type=int, default=200, help="워밍업 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--users", type=int, default=50, help="가상 사용자 수")
+    parser.add_argument("--spaces", type=int, default=20, help="가상 공간 수")
+    parser.add_argument("--seed", type=int, default=0, help="트래픽 생성 시드")
+    parser.add_argument("--replay", help="재생할 요청 기록(JSONL)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON 경로")
+    parser.add_argument("--threshold", type=float, default=0.10, help="회귀로 판단할 변화율 (기본 10%%)")
+    args = parser.parse_args()
+
+    summary = asyncio.run(run_benchmark(args))
+    print(format_summary(summary))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(summary, file, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        regressions = compare_with_baseline(summary, args.baseline, args.threshold)
+        if regressions:
+            print("\n기준 대비 성능 저하:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print("\n기준 대비 성능 저하 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+import json
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import count
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from jose import jwt
+
+
+API_PREFIX = "/api/v1/reservations"
+
+# 기본 트래픽 비율 (운영 환경의 목록 폴링 위주 패턴)
+DEFAULT_MIX: Dict[str, float] = {
+    "list": 0.70,
+    "ready": 0.10,
+    "payment_id": 0.08,
+    "approve": 0.08,
+    "fail": 0.04,
+}
+
+
+@dataclass
+class BenchRequest:
+    endpoint: str
+    method: str
+    path: str
+    user_id: str
+    json: Optional[Dict[str, Any]] = None
+    # 응답으로 받은 주문번호를 후속 요청(payment_id/approve/fail)에서 사용하기 위한 표시
+    captures_order_number: bool = False
+
+
+@dataclass
+class BenchState:
+    """
+    시나리오 진행 중 생성된 PENDING 주문번호 풀: (주문번호, 예약한 user_id)
+    """
+    pending_orders: List[Tuple[str, str]] = field(default_factory=list)
+
+    def take_pending(self) -> Optional[Tuple[str, str]]:
+        if not self.pending_orders:
+            return None
+        return self.pending_orders.pop(random.randrange(len(self.pending_orders)))
+
+
+def make_token(user_id: str, secret: str) -> str:
+    now = datetime.now().timestamp()
+    return jwt.encode({"user_id": user_id, "iat": now, "exp": now + 3600}, secret, algorithm="HS256")
+
+
+class SyntheticTraffic:
+    """
+    DEFAULT_MIX 비율로 요청 생성
+    - 예약 생성은 공간/시간 슬롯이 겹치지 않도록 실행마다 고유한 시간대를 사용
+    - payment_id/approve/fail 은 앞서 생성한 PENDING 주문번호를 사용 (없으면 생성 요청으로 대체)
+      예약한 사용자가 직접 보내 소유자 목록 캐시 무효화 경로를 측정
+    """
+
+    def __init__(self, users: int, spaces: int, mix: Dict[str, float] = None, seed: int = 0):
+        self._random = random.Random(seed)
+        self._users = [f"bench-user-{index}" for index in range(users)]
+        self._spaces = [f"bench-space-{index}" for index in range(spaces)]
+        self._mix = mix or DEFAULT_MIX
+        self._slot_sequence = count()
+        self._base_time = datetime.now().replace(minute=0, second=0, microsecond=0) + timedelta(days=365)
+
+    def next(self, state: BenchState) -> BenchRequest:
+        endpoint = self._random.choices(list(self._mix), weights=list(self._mix.values()))[0]
+        user_id = self._random.choice(self._users)
+
+        if endpoint in ("payment_id", "approve", "fail"):
+            pending = state.take_pending()
+            if pending is None:
+                return self._ready(user_id)
+            order_number, owner_id = pending
+            if endpoint == "payment_id":
+                state.pending_orders.append(pending)
+                return BenchRequest(
+                    endpoint, "PATCH", f"{API_PREFIX}/kakao/ready", owner_id,
+                    json={"order_number": order_number, "payment_id": self._random.randint(1, 1_000_000)}
+                )
+            return BenchRequest(endpoint, "PATCH", f"{API_PREFIX}/kakao/{endpoint}", owner_id, json={"order_number": order_number})
+
+        if endpoint == "ready":
+            return self._ready(user_id)
+
+        return BenchRequest("list", "GET", f"{API_PREFIX}?limit={self._random.choice((10, 20, 100))}", user_id)
+
+    def _ready(self, user_id: str) -> BenchRequest:
+        start_time = self._base_time + timedelta(hours=next(self._slot_sequence))
+        space_id = self._random.choice(self._spaces)
+        return BenchRequest(
+            "ready", "POST", f"{API_PREFIX}/kakao/ready", user_id,
+            json={
+                "space_id": space_id,
+                "space_name": space_id,
+                "user_name": user_id,
+                "start_time": start_time.isoformat(sep=" "),
+                "end_time": (start_time + timedelta(hours=1)).isoformat(sep=" "),
+            },
+            captures_order_number=True
+        )
+
+
+class ReplayTraffic:
+    """
+    기록된 요청(JSONL)을 순서대로 재생
+    한 줄 형식: {"endpoint": "list", "method": "GET", "path": "/api/v1/reservations?limit=10", "user_id": "u1", "json": {...}}
+    """
+
+    def __init__(self, path: str):
+        with open(path, "r", encoding="utf-8") as file:
+            self._records = [json.loads(line) for line in file if line.strip()]
+        if not self._records:
+            raise ValueError(f"{path} 에 재생할 요청이 없습니다.")
+        self._iterator: Iterator[Dict[str, Any]] = iter(())
+
+    def next(self, state: BenchState) -> BenchRequest:
+        record = next(self._iterator, None)
+        if record is None:
+            self._iterator = iter(self._records)
+            record = next(self._iterator)
+        return BenchRequest(
+            endpoint=record.get("endpoint") or f"{record['method']} {record['path'].split('?')[0]}",
+            method=record["method"],
+            path=record["path"],
+            user_id=record.get("user_id", "bench-user-0"),
+            json=record.get("json"),
+            captures_order_number=record.get("method") == "POST" and record["path"].endswith("/kakao/ready"),
+        )
@@ -6,5 +6,18 @@ echo "[default]" > ~/.aws/config
 echo "region = ap-northeast-2" >> ~/.aws/config
 echo "output = json" >> ~/.aws/config
 
+# 워커 수: WEB_CONCURRENCY (기본 1, auto 면 컨테이너 CPU 제한 기준, utils/worker_config.py)
+# 목록/현황 캐시와 read-your-writes 는 워커 프로세스 단위라 워커를 늘리면 워커 사이에서는 보장되지 않음
+# 계산에 실패해 출력이 비면 1
+WORKERS=$(python -m utils.worker_config)
+export WEB_CONCURRENCY=${WORKERS:-1}
+
+# 멀티 워커 모드에서는 워커별 Prometheus 메트릭을 파일로 모아 /metrics 에서 합산
+if [ "$WEB_CONCURRENCY" -gt 1 ]; then
+    export PROMETHEUS_MULTIPROC_DIR=${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus_multiproc}
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
 # uvicorn 서버 시작
-exec uvicorn main:app --host 0.0.0.0 --port 80
\ No newline at end of file
+exec uvicorn main:app --host 0.0.0.0 --port 80 --workers "$WEB_CONCURRENCY"
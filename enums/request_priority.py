@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class RequestPriority(Enum):
+    """
+    과부하 시 요청 처리 우선순위 (낮은 순서부터 먼저 거절)
+    """
+    LOW = "low"             # 목록/내보내기/통계 등 조회
+    NORMAL = "normal"       # 예약 생성
+    CRITICAL = "critical"   # 결제 콜백 (결제 준비 번호, 승인/실패/취소)
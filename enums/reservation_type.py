@@ -10,4 +10,14 @@ class ReservationStatus(Enum):
     PENDING = auto()
     COMPLETED = auto()
     FAILED = auto()
-    CANCELED = auto
+    CANCELED = auto()
+
+    def allowed_sources(self) -> tuple:
+        """
+        이 상태로 전이할 수 있는 현재 상태 목록
+        - PENDING -> COMPLETED / FAILED / CANCELED
+        - 같은 상태로의 재요청(결제 콜백 재시도)은 허용
+        """
+        if self is ReservationStatus.PENDING:
+            return (ReservationStatus.PENDING,)
+        return (ReservationStatus.PENDING, self)
@@ -2,29 +2,54 @@ from contextlib import asynccontextmanager
 import os
 from typing import Dict
 from dotenv import load_dotenv
+
+# 앱 모듈은 import 시점에 환경 변수로 설정을 읽으므로(로그 샘플링, 요청 제한, 캐시 TTL 등) 가장 먼저 .env 로드
+load_dotenv('.env.development' if os.getenv('APP_ENV') == 'development' else '.env.production')
+
 from fastapi import Depends, FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from routers.reservation import reservation_router
+from services.aws_service import get_aws_service
+from services.pending_sweeper import get_pending_sweeper
+from utils.aws_client_registry import get_aws_client_registry
 from utils.database_config import DatabaseConfig
 from utils.logger import Logger
+from utils.metrics import mark_worker_dead
+from utils.query_trace import QueryTraceMiddleware
+from utils.startup_timer import StartupTimer
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # 애플리케이션 시작될 때 실행할 코드
-    env_type = '.env.development' if os.getenv('APP_ENV') == 'development' else '.env.production'
-    load_dotenv(env_type)
-
-    database = DatabaseConfig().create_database()
-    await database.initialize()
+    # 애플리케이션 시작될 때 실행할 코드 (.env 는 모듈 상단에서 로드)
+    # 멀티 워커 모드에서는 워커마다 실행됨
+    # - 클라이언트/시크릿/커넥션 풀은 워커별로 생성 (fork 이후라 공유하지 않음)
+    # - 스키마 마이그레이션은 advisory lock 으로 한 워커(파드)만 실행
+    # 첫 요청이 boto3 클라이언트 생성/시크릿 조회 비용을 부담하지 않도록 미리 준비
+    startup_timer = StartupTimer()
+    with startup_timer.step("aws_clients"):
+        get_aws_client_registry().warm_up(["ssm"])
+    with startup_timer.step("jwt_secret"):
+        get_aws_service().get_jwt_secret()
+    with startup_timer.step("db_config"):
+        database = DatabaseConfig().create_database()
+    with startup_timer.step("db_initialize"):
+        await database.initialize()
+    app.state.startup_timings = startup_timer.report()
+
+    # 만료된 PENDING 예약 정리 (여러 파드/워커 중 잠금을 얻은 곳에서만 실행)
+    pending_sweeper = get_pending_sweeper()
+    pending_sweeper.start()
 
     yield
 
     # 애플리케이션 종료될 때 실행할 코드 (필요 시 추가)
+    await pending_sweeper.stop()
     await database.close()
+    mark_worker_dead(os.getpid())
 
 
 app = FastAPI(lifespan=lifespan, title="예약 API", version="ver.1")
@@ -36,6 +61,9 @@ async def health_check(logger: Logger = Depends(Logger.setup_logger)) -> dict:
     logger.info("health check")
     return {"status" : "ok"}
 
+# 요청 단위 SQL 쿼리 수/시간 집계 (Server-Timing 헤더)
+app.add_middleware(QueryTraceMiddleware)
+
 FastAPIInstrumentor.instrument_app(app)
 
 instrumentator = Instrumentator()
@@ -12,4 +12,4 @@ CREATE TABLE IF NOT EXISTS reservation (
     start_time DATETIME,
     end_time DATETIME,
     INDEX idx_reservation_order_number (order_number)
-);
\ No newline at end of file
+);
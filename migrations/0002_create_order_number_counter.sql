@@ -0,0 +1,5 @@
+-- 초(prefix)별 주문번호 발급 카운터
+CREATE TABLE IF NOT EXISTS order_number_counter (
+    order_prefix CHAR(14) PRIMARY KEY,
+    last_value INT NOT NULL
+);
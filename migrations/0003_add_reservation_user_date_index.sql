@@ -0,0 +1,4 @@
+-- 예약 목록 keyset 페이지네이션용
+ALTER TABLE reservation
+    ADD INDEX idx_reservation_user_date (user_id, reservation_date, id),
+    ALGORITHM=INPLACE, LOCK=NONE;
@@ -0,0 +1,8 @@
+-- 예약 중복(겹침) 확인용
+ALTER TABLE reservation
+    ADD INDEX idx_reservation_space_time (space_id, start_time, end_time),
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+ALTER TABLE reservation
+    ADD INDEX idx_reservation_space_use_date (space_id, use_date),
+    ALGORITHM=INPLACE, LOCK=NONE;
@@ -0,0 +1,6 @@
+-- 예약 생성 시 (공간, 날짜) 단위 잠금
+CREATE TABLE IF NOT EXISTS reservation_lock (
+    space_id VARCHAR(255) NOT NULL,
+    lock_date DATE NOT NULL,
+    PRIMARY KEY (space_id, lock_date)
+);
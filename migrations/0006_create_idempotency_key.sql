@@ -0,0 +1,10 @@
+-- POST /kakao/ready 의 Idempotency-Key 별 최초 주문번호
+CREATE TABLE IF NOT EXISTS idempotency_key (
+    user_id VARCHAR(255) NOT NULL,
+    idem_key VARCHAR(255) NOT NULL,
+    request_hash CHAR(64) NOT NULL,
+    order_number VARCHAR(20) NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, idem_key),
+    INDEX idx_idempotency_key_created_at (created_at)
+);
@@ -0,0 +1,4 @@
+-- 만료된 PENDING 예약 정리(sweeper)용
+ALTER TABLE reservation
+    ADD INDEX idx_reservation_status_date (r_status, reservation_date),
+    ALGORITHM=INPLACE, LOCK=NONE;
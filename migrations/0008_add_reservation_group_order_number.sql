@@ -0,0 +1,8 @@
+-- 반복/다중 슬롯 예약: 한 번의 결제로 묶인 예약들의 대표 주문번호
+ALTER TABLE reservation
+    ADD COLUMN group_order_number VARCHAR(20) NULL AFTER order_number,
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+ALTER TABLE reservation
+    ADD INDEX idx_reservation_group_order_number (group_order_number),
+    ALGORITHM=INPLACE, LOCK=NONE;
@@ -0,0 +1,28 @@
+-- 공간/이용일/상태별 예약 집계 (대시보드 조회용)
+-- 이용일: use_date(일 단위 예약) 또는 start_time(시간 단위 예약)의 날짜
+-- booked_minutes: 일 단위 예약은 1440분, 시간 단위 예약은 이용 시간(분)
+CREATE TABLE IF NOT EXISTS reservation_daily_rollup (
+    space_id VARCHAR(255) NOT NULL,
+    day DATE NOT NULL,
+    r_status ENUM('PENDING', 'COMPLETED', 'FAILED', 'CANCELED') NOT NULL,
+    reservation_count INT NOT NULL DEFAULT 0,
+    booked_minutes INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (space_id, day, r_status)
+);
+
+-- 기존 예약으로 초기 집계
+INSERT INTO reservation_daily_rollup (space_id, day, r_status, reservation_count, booked_minutes)
+SELECT
+    space_id,
+    DATE(COALESCE(use_date, start_time)),
+    r_status,
+    COUNT(*),
+    SUM(CASE WHEN use_date IS NOT NULL THEN 1440 ELSE TIMESTAMPDIFF(MINUTE, start_time, end_time) END)
+FROM reservation
+WHERE space_id IS NOT NULL
+    AND r_status IS NOT NULL
+    AND (use_date IS NOT NULL OR (start_time IS NOT NULL AND end_time IS NOT NULL))
+GROUP BY space_id, DATE(COALESCE(use_date, start_time)), r_status
+ON DUPLICATE KEY UPDATE
+    reservation_count = VALUES(reservation_count),
+    booked_minutes = VALUES(booked_minutes);
@@ -1,4 +1,5 @@
 from datetime import datetime, time
+from typing import Optional
 from sqlmodel import Field, SQLModel
 
 from enums.reservation_type import ReservationStatus
@@ -7,6 +8,7 @@ from enums.reservation_type import ReservationStatus
 class Reservation(SQLModel, table=True):
     id: int = Field(default=None, primary_key=True)
     order_number: str
+    group_order_number: Optional[str] = None
     space_id: str
     space_name: str
     user_id: str
@@ -1,24 +1,50 @@
-from typing import Any, Callable, Dict
+import random
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional
 
+from fastapi import HTTPException
 from fastapi.routing import APIRoute
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import Response, StreamingResponse
 
+from utils.log_config import REDACTED_HEADERS, get_log_config
 from utils.logger import Logger
 
 
 class LoggingAPIRoute(APIRoute):
+    """
+    요청 1건당 로그 1건(요청/응답/처리시간)을 남기는 라우트
+    - 라우트별 샘플링 (오류 응답은 항상 기록)
+    - 본문은 샘플링된 요청만 최대 길이까지 기록
+    - 헤더는 허용 목록만 기록하고 인증 정보는 가림
+    - 스트리밍 응답은 버퍼링하지 않고 그대로 전달
+    """
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._logger = Logger.setup_logger() 
-        
+        self._logger = Logger.setup_logger()
+        self._log_config = get_log_config()
+        self._sample_rate = self._log_config.sample_rate_for(self.methods, self.path)
+
     def get_route_handler(self) -> Callable:
         original_route_handler = super().get_route_handler()
 
         async def custom_route_handler(request: Request) -> Response:
-            await self._request_log(request)
-            response: Response = await original_route_handler(request)
-            self._response_log(request, response, self._logger)
+            sampled = self._sample_rate >= 1 or random.random() < self._sample_rate
+            request_body = await self._read_request_body(request) if sampled else None
+
+            started_at = perf_counter()
+            try:
+                response: Response = await original_route_handler(request)
+            except HTTPException as e:
+                self._log(request, e.status_code, started_at, sampled, request_body, None)
+                raise
+            except Exception:
+                self._log(request, 500, started_at, sampled, request_body, None)
+                raise
+
+            response_body = self._response_body(response) if sampled else None
+            self._log(request, response.status_code, started_at, sampled, request_body, response_body)
             return response
 
         return custom_route_handler
@@ -26,34 +52,63 @@ class LoggingAPIRoute(APIRoute):
     @staticmethod
     def _has_json_body(request: Request) -> bool:
         if (
-            request.method in ("POST", "PUT", "PATCH") and 
+            request.method in ("POST", "PUT", "PATCH") and
             request.headers.get("content-type") == "application/json"
 				):
             return True
         return False
 
-    async def _request_log(self, request: Request) -> None:
-        extra: Dict[str, Any] = {
-            "httpMethod": request.method,
-            "url": request.url.path,
-            "headers": request.headers,
-            "queryParams": request.query_params,
-        }
+    async def _read_request_body(self, request: Request) -> Optional[str]:
+        if not self._has_json_body(request):
+            return None
+        # FastAPI가 같은 Request 객체에서 본문을 다시 읽으므로 캐시된 값이 재사용됨
+        return self._truncate(await request.body())
 
-        if self._has_json_body(request):
-            request_body = await request.body()
-            extra["body"] = request_body.decode("UTF-8")
+    def _response_body(self, response: Response) -> Optional[str]:
+        if isinstance(response, StreamingResponse):
+            return "<streaming>"
+        body = getattr(response, "body", None)
+        return self._truncate(body) if body else None
 
-        self._logger.info(f"요청 URL: {extra['httpMethod']} {extra['url']}", extra=extra)
-        self._logger.info(f"쿼리 파라미터: {extra['queryParams']}", extra=extra)
-        self._logger.info(f"요청 데이터: {extra.get('body', '')}", extra=extra)
+    def _truncate(self, body: bytes) -> str:
+        limit = self._log_config.body_max_bytes
+        text = body[:limit].decode("UTF-8", errors="replace")
+        if len(body) > limit:
+            text += f"...(+{len(body) - limit} bytes)"
+        return text
 
-    @staticmethod
-    def _response_log(request: Request, response: Response, logger: Logger) -> Dict[str, str]:
-        extra: Dict[str, str] = {
+    def _headers(self, request: Request) -> Dict[str, str]:
+        return {
+            name: "***" if name in REDACTED_HEADERS else value
+            for name, value in request.headers.items()
+            if name in self._log_config.header_allowlist
+        }
+
+    def _log(
+        self,
+        request: Request,
+        status_code: int,
+        started_at: float,
+        sampled: bool,
+        request_body: Optional[str],
+        response_body: Optional[str]
+    ) -> None:
+        if not sampled and status_code < 400:
+            return
+
+        duration_ms = round((perf_counter() - started_at) * 1000, 2)
+        extra: Dict[str, Any] = {
             "httpMethod": request.method,
             "url": request.url.path,
-            "body": response.body.decode("UTF-8")
+            "statusCode": status_code,
+            "durationMs": duration_ms,
+            "headers": self._headers(request),
+            "queryParams": str(request.query_params),
         }
-		
-        logger.info(f"응답 데이터: {extra['body']}", extra=extra)
\ No newline at end of file
+        if request_body is not None:
+            extra["body"] = request_body
+        if response_body is not None:
+            extra["responseBody"] = response_body
+
+        log = self._logger.error if status_code >= 500 else self._logger.info
+        log(f"{request.method} {request.url.path} {status_code} {duration_ms}ms", extra=extra)
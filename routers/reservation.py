@@ -1,91 +1,360 @@
-from datetime import datetime
-from typing import Dict
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlmodel import select
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import and_, or_, select
 
+from enums.request_priority import RequestPriority
 from enums.reservation_type import ReservationStatus
 from models.reservation import Reservation
 from routers.logging_router import LoggingAPIRoute
-from schemas.reservation import ReservationRequest, OrderNumberRequest, UpdatePaymentIdRequest
-from utils.authenticate import userAuthenticate
-from utils.mysqldb import get_mysql_session
+from schemas.reservation import (
+    BulkStatusUpdateRequest,
+    BulkStatusUpdateResponse,
+    BulkStatusUpdateResult,
+    OrderNumberRequest,
+    ReservationExportFormat,
+    ReservationListResponse,
+    ReservationOut,
+    ReservationRequest,
+    SPACE_STATS_MAX_DAYS,
+    SpaceAvailabilityResponse,
+    SpaceStatsResponse,
+    StatsGranularity,
+    UpdatePaymentIdRequest,
+)
+from services import reservation_status
+from services.admission_control import admission
+from services.idempotency import IDEMPOTENCY_KEY_MAX_LENGTH, get_idempotency_store, request_fingerprint
+from services.order_number_allocator import get_order_number_allocator
+from services.reservation_list_cache import get_reservation_list_cache
+from services.reservation_export import EXPORT_MEDIA_TYPES, ReservationExportFilter, stream_reservations
+from services.reservation_conflict import ACTIVE_STATUSES, ReservationSlot, lock_and_check_conflicts
+from services.reservation_recurrence import expand_reservation_slots
+from services.reservation_rollup import MINUTES_PER_DAY, RollupDelta, apply_rollup_delta, fetch_rollup
+from services.space_availability import FULL_DAY, HOURS_PER_DAY, get_space_availability_cache, month_start_of
+from utils.authenticate import opsAuthenticate, reconciliationAuthenticate, userAuthenticate
+from utils.cursor import decode_cursor, encode_cursor
+from utils.mysqldb import get_database, get_mysql_session
+from utils.read_session import get_mysql_read_session
+from utils.responses import FastJSONResponse
 
 
 reservation_router = APIRouter(tags=["예약"], route_class=LoggingAPIRoute)
 
+RESERVATION_OUT_FIELDS = tuple(ReservationOut.model_fields)
+AVAILABILITY_MIN_MONTH = date(1000, 1, 1)
+
 @reservation_router.get(
     "",
-    response_model=Dict,
+    dependencies=[Depends(admission(RequestPriority.LOW, reader=True))],
+    response_model=ReservationListResponse,
+    response_class=FastJSONResponse,
     status_code=status.HTTP_200_OK,
     summary="예약 목록 확인"
 )
 async def get_reservations(
-    skip: int = Query(default=0, ge=0),
+    skip: int = Query(default=0, ge=0, description="건너뛸 개수 (cursor 사용 시 무시)"),
     limit: int = Query(default=10, ge=1, le=100),
-    session=Depends(get_mysql_session),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 next_cursor"),
+    fields: Optional[str] = Query(default=None, description="조회할 필드 목록 (쉼표 구분, 예: order_number,space_name,r_status)"),
+    session=Depends(get_mysql_read_session),
     token_info=Depends(userAuthenticate)
 ):
-    statement = select(Reservation).where(Reservation.user_id == token_info["user_id"]).offset(skip).limit(limit)
+    output_fields = _parse_fields(fields)
+
+    # 결제 상태 폴링으로 같은 페이지가 반복 조회되므로 사용자별 캐시를 먼저 확인
+    list_cache = get_reservation_list_cache()
+    page_key = f"{skip}:{cursor or ''}:{limit}:{','.join(output_fields)}"
+    cached_body, cache_generation = await list_cache.get(token_info["user_id"], page_key)
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
+    # 커서 생성을 위해 reservation_date, id 는 항상 조회
+    selected_fields = tuple(dict.fromkeys(output_fields + ("reservation_date", "id")))
+
+    # ORM 객체 대신 필요한 컬럼만 조회 / (user_id, reservation_date, id) 인덱스를 역순으로 타는 keyset 페이지네이션
+    # 최신 예약부터 반환하고, reservation_date 가 NULL 인 행은 MySQL 내림차순 정렬대로 마지막에 옴
+    # (기존 목록 조회에는 ORDER BY 가 없었으므로 이 정렬 순서는 keyset 페이지네이션과 함께 새로 정한 API 동작)
+    statement = (
+        select(*(getattr(Reservation, field) for field in selected_fields))
+        .where(Reservation.user_id == token_info["user_id"])
+    )
+    if cursor:
+        last_date, last_id = decode_cursor(cursor)
+        if last_date is None:
+            statement = statement.where(Reservation.reservation_date.is_(None), Reservation.id < last_id)
+        else:
+            statement = statement.where(
+                or_(
+                    Reservation.reservation_date < last_date,
+                    and_(Reservation.reservation_date == last_date, Reservation.id < last_id),
+                    Reservation.reservation_date.is_(None)
+                )
+            )
+    elif skip:
+        statement = statement.offset(skip)
+
+    statement = statement.order_by(Reservation.reservation_date.desc(), Reservation.id.desc()).limit(limit)
     result = await session.execute(statement)
-    reservations = result.scalars().all()
+    rows = result.mappings().all()
+
+    next_cursor = None
+    if len(rows) == limit:
+        next_cursor = encode_cursor(rows[-1]["reservation_date"], rows[-1]["id"])
+
+    reservations = [{field: row[field] for field in output_fields} for row in rows]
+    response = FastJSONResponse({"reservations": reservations, "next_cursor": next_cursor})
+    await list_cache.set(token_info["user_id"], cache_generation, page_key, response.body)
+    return response
+
+@reservation_router.get(
+    "/export",
+    dependencies=[Depends(admission(RequestPriority.LOW, reader=True))],
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="예약 내보내기 (NDJSON/CSV)"
+)
+async def export_reservations(
+    export_format: ReservationExportFormat = Query(default=ReservationExportFormat.NDJSON, alias="format"),
+    user_id: Optional[str] = Query(default=None, description="예약자 고유번호 (본인만 가능, 생략 시 본인)"),
+    space_id: Optional[str] = Query(default=None, description="공간 고유번호 (본인 예약 중 해당 공간만)"),
+    date_from: Optional[date] = Query(default=None, description="이용일 시작(YYYY-MM-DD, 포함)"),
+    date_to: Optional[date] = Query(default=None, description="이용일 종료(YYYY-MM-DD, 포함)"),
+    token_info=Depends(userAuthenticate)
+):
+    if user_id and user_id != token_info["user_id"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="다른 사용자의 예약은 내보낼 수 없습니다.",
+        )
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="조회 시작일은 종료일 이전이어야 합니다.",
+        )
+
+    # 공간 소유자/운영자 권한을 확인할 방법이 없으므로 space_id 를 지정해도 항상 본인 예약으로 제한
+    export_filter = ReservationExportFilter(
+        user_id=token_info["user_id"],
+        space_id=space_id,
+        date_from=date_from,
+        date_to=date_to
+    )
+    return StreamingResponse(
+        stream_reservations(export_filter, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="reservations.{export_format.value}"'}
+    )
+
+@reservation_router.get(
+    "/spaces/{space_id}/availability",
+    dependencies=[Depends(admission(RequestPriority.LOW))],
+    response_model=SpaceAvailabilityResponse,
+    response_class=FastJSONResponse,
+    status_code=status.HTTP_200_OK,
+    summary="공간 예약 현황 (월별 달력)"
+)
+async def get_space_availability(
+    space_id: str,
+    month: Optional[str] = Query(default=None, pattern=r"^\d{4}-\d{2}$", description="조회 월(YYYY-MM), 기본값은 이번 달"),
+    token_info=Depends(userAuthenticate)
+):
+    try:
+        month_start = date.fromisoformat(f"{month}-01") if month else month_start_of(date.today())
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="조회 월 형식이 올바르지 않습니다.",
+        )
+    # MySQL DATETIME 범위(1000~9999년) 밖이거나 다음 달을 계산할 수 없는 9999-12 는 거절
+    if not AVAILABILITY_MIN_MONTH <= month_start < month_start_of(date.max):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="조회할 수 없는 월입니다.",
+        )
+
+    # 공간/월별 비트맵 캐시에서 응답 (캐시가 없을 때만 DB 조회)
+    bitmaps = await get_space_availability_cache().get_month(space_id, month_start)
+    return FastJSONResponse({
+        "space_id": space_id,
+        "month": f"{month_start:%Y-%m}",
+        "days": [
+            {
+                "day": month_start + timedelta(days=index),
+                "booked_hours": [hour for hour in range(HOURS_PER_DAY) if bitmap >> hour & 1],
+                "fully_booked": bitmap == FULL_DAY,
+            }
+            for index, bitmap in enumerate(bitmaps)
+        ],
+    })
+
+@reservation_router.get(
+    "/spaces/{space_id}/stats",
+    dependencies=[Depends(opsAuthenticate), Depends(admission(RequestPriority.LOW, reader=True))],
+    response_model=SpaceStatsResponse,
+    response_class=FastJSONResponse,
+    status_code=status.HTTP_200_OK,
+    summary="공간 예약 통계 (일/월별 상태별 예약 수, 가동률)"
+)
+async def get_space_stats(
+    space_id: str,
+    date_from: date = Query(description="시작일(YYYY-MM-DD, 포함)"),
+    date_to: date = Query(description="종료일(YYYY-MM-DD, 포함)"),
+    granularity: StatsGranularity = Query(default=StatsGranularity.DAY),
+    session=Depends(get_mysql_read_session)
+):
+    if date_from > date_to or (date_to - date_from).days >= SPACE_STATS_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"조회 기간은 {SPACE_STATS_MAX_DAYS}일 이내여야 하며 시작일은 종료일 이전이어야 합니다.",
+        )
+
+    # 원본 reservation 대신 (space_id, day, r_status) 집계 테이블만 조회
+    period_format = "%Y-%m-%d" if granularity is StatsGranularity.DAY else "%Y-%m"
+    buckets: Dict[str, Dict] = {}
+    day = date_from
+    while day <= date_to:
+        bucket = buckets.setdefault(
+            day.strftime(period_format),
+            {"reservation_counts": {}, "booked_minutes": 0, "total_minutes": 0}
+        )
+        bucket["total_minutes"] += MINUTES_PER_DAY
+        day += timedelta(days=1)
+
+    for day, r_status, reservation_count, minutes in await fetch_rollup(session, space_id, date_from, date_to):
+        bucket = buckets[day.strftime(period_format)]
+        bucket["reservation_counts"][r_status.value] = bucket["reservation_counts"].get(r_status.value, 0) + reservation_count
+        if r_status is ReservationStatus.COMPLETED:
+            bucket["booked_minutes"] += minutes
+
+    return FastJSONResponse({
+        "space_id": space_id,
+        "granularity": granularity.value,
+        "buckets": [
+            {
+                "period": period,
+                "reservation_counts": bucket["reservation_counts"],
+                "booked_minutes": bucket["booked_minutes"],
+                "occupancy_rate": round(bucket["booked_minutes"] / bucket["total_minutes"], 4),
+            }
+            for period, bucket in buckets.items()
+        ],
+    })
+
+async def _after_user_write(user_id: str) -> None:
+    # 커밋 이후 호출: 목록 캐시 무효화 + 잠시 동안 해당 사용자 조회를 primary로 고정
+    await get_reservation_list_cache().invalidate(user_id)
+    get_database().mark_user_write(user_id)
 
-    return {"reservations": reservations}
+async def _after_status_change(changed: List[Tuple[str, ReservationSlot]], target: ReservationStatus) -> None:
+    # 커밋 이후 호출: 공간을 비우는 상태(FAILED/CANCELED)로 바뀐 예약의 달력 캐시 무효화
+    if target in ACTIVE_STATUSES or not changed:
+        return
+    await get_space_availability_cache().release_slots(changed)
+
+def _parse_fields(fields: Optional[str]) -> Tuple[str, ...]:
+    if not fields:
+        return RESERVATION_OUT_FIELDS
+
+    requested = tuple(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+    unknown = [field for field in requested if field not in RESERVATION_OUT_FIELDS]
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"조회할 수 없는 필드입니다: {', '.join(unknown)}",
+        )
+    return requested
 
 @reservation_router.post(
     "/kakao/ready",
+    dependencies=[Depends(admission(RequestPriority.NORMAL))],
     response_model=Dict,
     status_code=status.HTTP_200_OK,
     summary="예약 결제 준비"
 )
 async def get_order_number(
     data: ReservationRequest,
+    idempotency_key: Optional[str] = Header(
+        default=None,
+        alias="Idempotency-Key",
+        max_length=IDEMPOTENCY_KEY_MAX_LENGTH,
+        description="재시도 시 같은 값을 보내면 최초 주문번호를 그대로 반환"
+    ),
     session=Depends(get_mysql_session),
     token_info=Depends(userAuthenticate)
 ):
     """구현이 필요하지 않습니다."""
-    now = datetime.now()
-    order_prefix = now.strftime("%Y%m%d%H%M%S")
+    user_id = token_info["user_id"]
+    idempotency_store = get_idempotency_store()
+    request_hash = None
+    if idempotency_key:
+        request_hash = request_fingerprint(data)
+        order_number = await idempotency_store.lookup(user_id, idempotency_key, request_hash)
+        if order_number is not None:
+            return {"order_number": order_number}
 
-    statement = select(Reservation).where(Reservation.order_number.like(f"{order_prefix}%")).order_by(Reservation.order_number.desc())
-    result = await session.execute(statement)
-    last_order = result.scalar()
-
-    if last_order:
-        last_order_number = int(last_order.order_number[-4:])
-        order_number = f"{order_prefix}{last_order_number + 1:04d}"
-    else:
-        order_number = f"{order_prefix}0000"
-
-    new_reservation = None
-    if data.use_date:
-        new_reservation = Reservation(
-            order_number = order_number, 
-            space_id = data.space_id,
-            space_name = data.space_name,
-            user_id = token_info["user_id"],
-            user_name = data.user_name,
-            use_date = data.use_date,
-            r_status = ReservationStatus.PENDING
-        )
-    else:
-        new_reservation = Reservation(
-            order_number = order_number, 
-            space_id = data.space_id,
-            space_name = data.space_name,
-            user_id = token_info["user_id"],
-            user_name = data.user_name,
-            start_time = data.start_time,
-            end_time = data.end_time,
-            r_status = ReservationStatus.PENDING
+    # 반복 규칙/다중 슬롯을 전개하고 슬롯마다 주문번호 발급 (2개 이상이면 첫 번호가 묶음 대표 번호)
+    slots = expand_reservation_slots(data)
+    order_numbers = await get_order_number_allocator().allocate(len(slots))
+    order_number = order_numbers[0]
+    group_order_number = order_number if len(slots) > 1 else None
+
+    try:
+        # 같은 공간/날짜 잠금을 잡은 상태에서 모든 슬롯의 겹치는 예약을 한 번에 확인 (409)
+        await lock_and_check_conflicts(session, data.space_id, slots)
+
+        # 슬롯 전체를 executemany 로 한 번에 저장 (한 트랜잭션이라 전부 성공하거나 전부 실패)
+        reservation_date = datetime.now()
+        await session.execute(
+            insert(Reservation),
+            [
+                {
+                    "order_number": slot_order_number,
+                    "group_order_number": group_order_number,
+                    "space_id": data.space_id,
+                    "space_name": data.space_name,
+                    "user_id": user_id,
+                    "user_name": data.user_name,
+                    "r_status": ReservationStatus.PENDING,
+                    "reservation_date": reservation_date,
+                    "use_date": slot.use_date,
+                    "start_time": slot.start_time,
+                    "end_time": slot.end_time,
+                }
+                for slot_order_number, slot in zip(order_numbers, slots)
+            ]
         )
+        delta = RollupDelta()
+        for slot in slots:
+            delta.add(data.space_id, slot, ReservationStatus.PENDING)
+        await apply_rollup_delta(session, delta)
+        if idempotency_key:
+            await idempotency_store.record(session, user_id, idempotency_key, request_hash, order_number)
+        await session.commit()
+    except (IntegrityError, HTTPException) as error:
+        # 같은 키의 동시 재시도: 먼저 커밋된 요청 때문에 키 충돌 또는 시간 중복(409)이 나므로 최초 주문번호 반환
+        if not idempotency_key or (isinstance(error, HTTPException) and error.status_code != status.HTTP_409_CONFLICT):
+            raise
+        await session.rollback()
+        original_order_number = await idempotency_store.lookup(user_id, idempotency_key, request_hash)
+        if original_order_number is None:
+            raise
+        return {"order_number": original_order_number}
 
-    session.add(new_reservation)
-    await session.commit()
+    if idempotency_key:
+        await idempotency_store.remember(user_id, idempotency_key, request_hash, order_number)
+    await _after_user_write(user_id)
+    await get_space_availability_cache().add_slots(data.space_id, slots)
+    if group_order_number:
+        return {"order_number": order_number, "order_numbers": order_numbers}
     return {"order_number": order_number}
 
 
 @reservation_router.patch(
     "/kakao/ready",
+    dependencies=[Depends(admission(RequestPriority.CRITICAL))],
     status_code=status.HTTP_204_NO_CONTENT,
     summary="결제 준비 번호 업데이트"
 )
@@ -95,84 +364,91 @@ async def update_payment_id(
     token_info=Depends(userAuthenticate)
 ):
     """구현이 필요하지 않습니다."""
-    statement = select(Reservation).filter(Reservation.order_number == update_request.order_number)
-    result = await session.execute(statement)
-    reservation = result.scalars().first()
-    if reservation:
-        reservation.payment_id = update_request.payment_id
-        await session.commit()
-        await session.refresh(reservation)
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="일치하는 주문번호가 존재하지 않습니다.",
-        )
+    user_ids = await reservation_status.update_payment_id(session, update_request.order_number, update_request.payment_id)
+    await session.commit()
+    # 호출자(결제 콜백 등)가 아니라 예약 소유자의 목록 캐시를 무효화
+    for user_id in user_ids:
+        await _after_user_write(user_id)
 
 @reservation_router.patch(
     "/kakao/approve",
+    dependencies=[Depends(admission(RequestPriority.CRITICAL))],
     status_code=status.HTTP_204_NO_CONTENT,
     summary="예약 완료 처리"
 )
-async def update_payment_id(
+async def approve_reservation(
     approve_request: OrderNumberRequest,
     token_info=Depends(userAuthenticate),
     session=Depends(get_mysql_session)
 ):
     """구현이 필요하지 않습니다."""
-    statement = select(Reservation).filter(Reservation.order_number == approve_request.order_number)
-    result = await session.execute(statement)
-    reservation = result.scalars().first()
-    if reservation:
-        reservation.r_status = ReservationStatus.COMPLETED
-        await session.commit()
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="일치하는 주문번호가 존재하지 않습니다.",
-        )
+    user_ids, changed = await reservation_status.transition_status(session, approve_request.order_number, ReservationStatus.COMPLETED)
+    await session.commit()
+    for user_id in user_ids:
+        await _after_user_write(user_id)
+    await _after_status_change(changed, ReservationStatus.COMPLETED)
 
 @reservation_router.patch(
     "/kakao/fail",
+    dependencies=[Depends(admission(RequestPriority.CRITICAL))],
     status_code=status.HTTP_204_NO_CONTENT,
     summary="예약 실패 처리"
 )
-async def update_payment_id(
+async def fail_reservation(
     fail_request: OrderNumberRequest,
     token_info=Depends(userAuthenticate),
     session=Depends(get_mysql_session)
 ):
     """구현이 필요하지 않습니다."""
-    statement = select(Reservation).filter(Reservation.order_number == fail_request.order_number)
-    result = await session.execute(statement)
-    reservation = result.scalars().first()
-    if reservation:
-        reservation.r_status = ReservationStatus.FAILED
-        await session.commit()
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="일치하는 주문번호가 존재하지 않습니다.",
-        )
+    user_ids, changed = await reservation_status.transition_status(session, fail_request.order_number, ReservationStatus.FAILED)
+    await session.commit()
+    for user_id in user_ids:
+        await _after_user_write(user_id)
+    await _after_status_change(changed, ReservationStatus.FAILED)
 
 @reservation_router.patch(
-    "/kakao/fail",
+    "/kakao/cancel",
+    dependencies=[Depends(admission(RequestPriority.CRITICAL))],
     status_code=status.HTTP_204_NO_CONTENT,
     summary="예약 취소 처리"
 )
-async def update_payment_id(
+async def cancel_reservation(
     cancel_request: OrderNumberRequest,
     token_info=Depends(userAuthenticate),
     session=Depends(get_mysql_session)
 ):
     """구현이 필요하지 않습니다."""
-    statement = select(Reservation).filter(Reservation.order_number == cancel_request.order_number)
-    result = await session.execute(statement)
-    reservation = result.scalars().first()
-    if reservation:
-        reservation.r_status = ReservationStatus.FAILED
-        await session.commit()
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="일치하는 주문번호가 존재하지 않습니다.",
-        )
+    user_ids, changed = await reservation_status.transition_status(session, cancel_request.order_number, ReservationStatus.CANCELED)
+    await session.commit()
+    for user_id in user_ids:
+        await _after_user_write(user_id)
+    await _after_status_change(changed, ReservationStatus.CANCELED)
+
+@reservation_router.patch(
+    "/status/bulk",
+    dependencies=[Depends(reconciliationAuthenticate), Depends(admission(RequestPriority.NORMAL))],
+    response_model=BulkStatusUpdateResponse,
+    status_code=status.HTTP_200_OK,
+    summary="예약 상태 일괄 변경 (결제 대사)"
+)
+async def bulk_update_status(
+    bulk_request: BulkStatusUpdateRequest,
+    session=Depends(get_mysql_session)
+):
+    outcomes, updated_user_ids, changed = await reservation_status.bulk_transition_status(
+        session,
+        [order.order_number for order in bulk_request.orders],
+        bulk_request.status
+    )
+    await session.commit()
+
+    for user_id in updated_user_ids:
+        await _after_user_write(user_id)
+    await _after_status_change(changed, bulk_request.status)
+
+    return BulkStatusUpdateResponse(
+        results=[
+            BulkStatusUpdateResult(order_number=order_number, outcome=outcome)
+            for order_number, outcome in outcomes.items()
+        ]
+    )
@@ -1,6 +1,40 @@
+from datetime import date, datetime
+from enum import Enum
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from enums.reservation_type import ReservationStatus
+
+
+# 일괄 상태 변경 요청당 최대 주문번호 수
+BULK_STATUS_UPDATE_LIMIT = 1000
+# 예약 생성 요청 하나로 만들 수 있는 최대 슬롯 수 (반복 규칙 전개 후 기준)
+RESERVATION_SLOT_LIMIT = 100
+# 공간 통계 조회 최대 기간(일)
+SPACE_STATS_MAX_DAYS = 731
+
+
+class RecurrenceFrequency(str, Enum):
+    DAILY = "DAILY"
+    WEEKLY = "WEEKLY"
+
+class RecurrenceRule(BaseModel):
+    frequency: RecurrenceFrequency = Field(description="반복 단위(DAILY/WEEKLY)")
+    interval: int = Field(default=1, ge=1, description="반복 간격 (예: WEEKLY + 2 = 격주)")
+    count: Optional[int] = Field(default=None, ge=1, le=RESERVATION_SLOT_LIMIT, description="반복 횟수 (첫 회 포함)")
+    until: Optional[date] = Field(default=None, description="반복 종료일(포함)")
+
+    @model_validator(mode="after")
+    def validate_end(self) -> "RecurrenceRule":
+        if self.count is None and self.until is None:
+            raise ValueError("count 또는 until 중 하나는 필요합니다.")
+        return self
+
+class ReservationSlotRequest(BaseModel):
+    use_date: str = Field(default='', description="이용일(YYYY-MM-DD)")
+    start_time: str = Field(default='', description="이용 시작 시간")
+    end_time: str = Field(default='', description="이용 종료 시간")
 
 class ReservationRequest(BaseModel):
     space_id: str = Field(description="공간 고유번호")
@@ -9,10 +43,93 @@ class ReservationRequest(BaseModel):
     use_date: str = Field(default='', description="이용일(YYYY-MM-DD)")
     start_time: str = Field(default='', description="이용 시작 시간")
     end_time: str = Field(default='', description="이용 종료 시간")    
+    slots: List[ReservationSlotRequest] = Field(
+        default_factory=list,
+        max_length=RESERVATION_SLOT_LIMIT,
+        description="여러 슬롯을 한 번에 예약 (지정 시 use_date/start_time/end_time 무시)"
+    )
+    recurrence: Optional[RecurrenceRule] = Field(default=None, description="슬롯 반복 규칙")
 
 class UpdatePaymentIdRequest(BaseModel):
     payment_id: int = Field(description="결제 고유번호")
     order_number: str = Field(description="주문번호")
 
 class OrderNumberRequest(BaseModel):
-    order_number: str = Field(description="주문번호")
\ No newline at end of file
+    order_number: str = Field(description="주문번호")
+
+class BulkStatusUpdateRequest(BaseModel):
+    status: ReservationStatus = Field(description="변경할 예약 상태(COMPLETED/FAILED/CANCELED)")
+    orders: List[OrderNumberRequest] = Field(
+        min_length=1,
+        max_length=BULK_STATUS_UPDATE_LIMIT,
+        description="대상 주문번호 목록"
+    )
+
+    @field_validator("status")
+    @classmethod
+    def validate_status(cls, value: ReservationStatus) -> ReservationStatus:
+        if value is ReservationStatus.PENDING:
+            raise ValueError("PENDING 상태로는 변경할 수 없습니다.")
+        return value
+
+class BulkStatusUpdateOutcome(str, Enum):
+    UPDATED = "updated"
+    NOT_FOUND = "not_found"
+    INVALID_TRANSITION = "invalid_transition"
+
+class BulkStatusUpdateResult(BaseModel):
+    order_number: str = Field(description="주문번호")
+    outcome: BulkStatusUpdateOutcome = Field(description="처리 결과")
+
+class BulkStatusUpdateResponse(BaseModel):
+    results: List[BulkStatusUpdateResult] = Field(description="주문번호별 처리 결과")
+
+class ReservationOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int = Field(description="예약 고유번호")
+    order_number: str = Field(description="주문번호")
+    group_order_number: Optional[str] = Field(default=None, description="묶음 예약의 대표 주문번호")
+    space_id: str = Field(description="공간 고유번호")
+    space_name: str = Field(description="공간 이름")
+    user_id: str = Field(description="예약자 고유번호")
+    user_name: str = Field(description="예약자 이름")
+    payment_id: Optional[int] = Field(default=None, description="결제 고유번호")
+    r_status: ReservationStatus = Field(description="예약 상태")
+    reservation_date: datetime = Field(description="예약 일시")
+    use_date: Optional[datetime] = Field(default=None, description="이용일")
+    start_time: Optional[datetime] = Field(default=None, description="이용 시작 시간")
+    end_time: Optional[datetime] = Field(default=None, description="이용 종료 시간")
+
+class ReservationListResponse(BaseModel):
+    reservations: List[ReservationOut] = Field(description="예약 목록 (fields 지정 시 선택한 필드만 포함)")
+    next_cursor: Optional[str] = Field(default=None, description="다음 페이지 커서")
+
+class ReservationExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+class DayAvailability(BaseModel):
+    day: date = Field(description="날짜")
+    booked_hours: List[int] = Field(description="예약된 시간대 (h = h시~h+1시)")
+    fully_booked: bool = Field(description="하루 전체 예약 여부")
+
+class SpaceAvailabilityResponse(BaseModel):
+    space_id: str = Field(description="공간 고유번호")
+    month: str = Field(description="조회 월(YYYY-MM)")
+    days: List[DayAvailability] = Field(description="일별 예약 현황")
+
+class StatsGranularity(str, Enum):
+    DAY = "day"
+    MONTH = "month"
+
+class SpaceStatsBucket(BaseModel):
+    period: str = Field(description="기간 (day: YYYY-MM-DD, month: YYYY-MM)")
+    reservation_counts: Dict[ReservationStatus, int] = Field(description="상태별 예약 수 (COMPLETED = 결제 완료)")
+    booked_minutes: int = Field(description="결제 완료(COMPLETED) 예약의 이용 시간 합계(분)")
+    occupancy_rate: float = Field(description="가동률 (booked_minutes / 기간 전체 시간)")
+
+class SpaceStatsResponse(BaseModel):
+    space_id: str = Field(description="공간 고유번호")
+    granularity: StatsGranularity = Field(description="집계 단위")
+    buckets: List[SpaceStatsBucket] = Field(description="기간별 집계")
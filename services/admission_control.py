@@ -0,0 +1,153 @@
+import math
+import os
+from collections import OrderedDict
+from time import monotonic
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import Depends, HTTPException, status
+
+from enums.request_priority import RequestPriority
+from utils.authenticate import userAuthenticate
+from utils.metrics import ADMISSION_REJECTIONS
+from utils.mysqldb import MySQLDatabase
+from utils.worker_config import get_worker_config
+
+
+# 사용자별 초당 허용 요청 수와 순간 최대 요청 수 (파드 전체 기준, 0이면 비활성화)
+# - 버킷은 워커 프로세스마다 따로 있으므로 워커 수로 나눠 적용 (요청이 워커에 고르게 분산된다고 가정한 근사치)
+RATE_LIMIT_PER_SECOND = float(os.getenv('RATE_LIMIT_PER_SECOND', '20'))
+RATE_LIMIT_BURST = float(os.getenv('RATE_LIMIT_BURST', '40'))
+RATE_LIMIT_MAX_USERS = int(os.getenv('RATE_LIMIT_MAX_USERS', '100000'))
+
+# 우선순위별 부하 차단 기준: (풀 사용률, 최근 커넥션 대기 시간(초))
+# - CRITICAL 은 차단하지 않고 풀 대기(pool_timeout)까지 허용해 결제 콜백용 여유를 남김
+SHED_THRESHOLDS: Dict[RequestPriority, Tuple[float, float]] = {
+    RequestPriority.LOW: (
+        float(os.getenv('ADMISSION_LOW_MAX_POOL_USAGE', '0.7')),
+        float(os.getenv('ADMISSION_LOW_MAX_POOL_WAIT', '0.05')),
+    ),
+    RequestPriority.NORMAL: (
+        float(os.getenv('ADMISSION_NORMAL_MAX_POOL_USAGE', '0.9')),
+        float(os.getenv('ADMISSION_NORMAL_MAX_POOL_WAIT', '0.25')),
+    ),
+}
+# 과부하 응답의 Retry-After(초)
+OVERLOAD_RETRY_AFTER = 1
+
+
+class TokenBucketLimiter:
+    """
+    사용자별 토큰 버킷
+    - 초당 rate 개씩 채워지고 최대 burst 개까지 쌓임
+    - 오래 요청이 없던 사용자부터 제거(LRU)해 메모리 사용량을 제한
+    """
+
+    def __init__(self, rate: float, burst: float, max_entries: int):
+        self._rate = rate
+        self._burst = burst
+        self._max_entries = max_entries
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def try_acquire(self, key: str) -> float:
+        """
+        허용되면 0, 거절되면 토큰이 다시 생길 때까지 남은 시간(초)
+        """
+        now = monotonic()
+        tokens, updated_at = self._buckets.pop(key, (self._burst, now))
+        tokens = min(self._burst, tokens + (now - updated_at) * self._rate)
+
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / self._rate
+
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self._max_entries:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+
+class AdmissionController:
+    """
+    요청 허용 여부 판단
+    - 사용자별 요청 제한 초과: 429 (CRITICAL 결제 콜백은 제한하지 않음)
+    - 커넥션 풀이 우선순위별 기준보다 붐비면 낮은 우선순위부터 즉시 503
+      (풀 대기열에 쌓여 모든 엔드포인트가 느려지는 대신, 조회를 먼저 버려 결제 콜백이 시간 안에 처리되도록 함)
+    - 요청 제한과 풀 사용량 모두 워커 프로세스 단위로 판단
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AdmissionController, cls).__new__(cls)
+
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+
+        self._limiter: Optional[TokenBucketLimiter] = None
+        if RATE_LIMIT_PER_SECOND > 0:
+            workers = get_worker_config().workers
+            self._limiter = TokenBucketLimiter(
+                RATE_LIMIT_PER_SECOND / workers,
+                max(RATE_LIMIT_BURST / workers, 1),
+                RATE_LIMIT_MAX_USERS
+            )
+        self._initialized = True
+
+    def admit(self, user_id: str, priority: RequestPriority, reader: bool = False) -> None:
+        # 결제 콜백은 PG 사 재시도에 맡기면 결제 상태가 늦게 반영되므로 요청 제한에서 제외
+        if self._limiter is not None and priority is not RequestPriority.CRITICAL:
+            retry_after = self._limiter.try_acquire(user_id)
+            if retry_after:
+                ADMISSION_REJECTIONS.labels(reason="rate_limited", priority=priority.value).inc()
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="요청이 너무 많습니다. 잠시 후 다시 시도해 주세요.",
+                    headers={"Retry-After": str(math.ceil(retry_after))},
+                )
+
+        if self._is_overloaded(priority, reader):
+            ADMISSION_REJECTIONS.labels(reason="overloaded", priority=priority.value).inc()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+                headers={"Retry-After": str(OVERLOAD_RETRY_AFTER)},
+            )
+
+    @staticmethod
+    def _is_overloaded(priority: RequestPriority, reader: bool) -> bool:
+        thresholds = SHED_THRESHOLDS.get(priority)
+        if thresholds is None:
+            return False
+        database = MySQLDatabase()
+        # reader 로 가는 조회도 최근 쓰기 사용자나 reader 미설정 시 primary 를 쓰므로 두 풀 모두 확인
+        pool_statuses = [database.pool_status()]
+        if reader:
+            pool_statuses.append(database.reader_pool_status())
+
+        max_usage, max_wait = thresholds
+        return any(
+            pool_status.usage >= max_usage or pool_status.recent_wait_seconds > max_wait
+            for pool_status in pool_statuses
+            if pool_status is not None
+        )
+
+
+def get_admission_controller() -> AdmissionController:
+    return AdmissionController()
+
+
+def admission(priority: RequestPriority, reader: bool = False) -> Callable:
+    """
+    라우트 의존성: dependencies=[Depends(admission(RequestPriority.LOW))]
+    - reader: 읽기 전용 복제본으로 조회하는 라우트면 True (reader 풀 사용량도 부하 판단에 포함)
+    """
+    async def _admit(token_info=Depends(userAuthenticate)) -> None:
+        get_admission_controller().admit(token_info["user_id"], priority, reader)
+
+    return _admit
@@ -1,13 +1,19 @@
 import os
-import boto3
+from time import monotonic
 from typing import Dict
 
+from utils.aws_client_registry import get_aws_client_registry
 from utils.aws_ssm import ParameterStore
 from utils.env_config import get_env_config
-from utils.credential import Credential
 from utils.database_config import DatabaseConfig
 
 
+# JWT 시크릿 갱신 주기(초)
+JWT_SECRET_REFRESH_INTERVAL = 600
+# 검증 실패로 인한 강제 갱신 최소 간격(초)
+JWT_SECRET_MIN_REFRESH_INTERVAL = 30
+
+
 class AWSService:
 
     _instance = None
@@ -19,26 +25,51 @@ class AWSService:
         return cls._instance
     
     def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+
         self._env_config = get_env_config()
-        self._credentials = Credential.get_credentials()
+        self._client_registry = get_aws_client_registry()
         self._parameter_store = ParameterStore()
         self._database_config = DatabaseConfig()
+        self._jwt_secret = None
+        self._jwt_secret_loaded_at = float('-inf')
+        self._jwt_secret_expires_at = 0.0
+        self._initialized = True
 
-    # 서비스별 client 생성
+    # 서비스별 client 조회 (레지스트리에서 한 번만 생성)
     def create_client(self, service_name: str):
-        return boto3.client(
-            service_name,
-            aws_access_key_id=self._credentials.access_key,
-            aws_secret_access_key=self._credentials.secret_key,
-            region_name=self._credentials.region
-        )
+        return self._client_registry.get_client(service_name)
 
     # JWT
     def get_jwt_secret(self) -> str:
         if self._env_config.is_development:
             return os.getenv('USER_JWT_SECRET')
-        
-        return self._parameter_store.get_parameter("USER_JWT_SECRET")
+
+        # 메모리에 보관한 시크릿을 갱신 주기 동안 재사용
+        if self._jwt_secret is None or monotonic() >= self._jwt_secret_expires_at:
+            self._load_jwt_secret()
+
+        return self._jwt_secret
+
+    def refresh_jwt_secret(self) -> bool:
+        """
+        시크릿 교체 대응용 강제 갱신
+        - 최소 간격 이내에 다시 호출되면 SSM을 조회하지 않고 False 반환
+        """
+        if self._env_config.is_development:
+            return False
+        if monotonic() - self._jwt_secret_loaded_at < JWT_SECRET_MIN_REFRESH_INTERVAL:
+            return False
+
+        self._parameter_store.invalidate("USER_JWT_SECRET")
+        self._load_jwt_secret()
+        return True
+
+    def _load_jwt_secret(self) -> None:
+        self._jwt_secret = self._parameter_store.get_parameter("USER_JWT_SECRET")
+        self._jwt_secret_loaded_at = monotonic()
+        self._jwt_secret_expires_at = self._jwt_secret_loaded_at + JWT_SECRET_REFRESH_INTERVAL
     
 def get_aws_service() -> AWSService:
     return AWSService()
\ No newline at end of file
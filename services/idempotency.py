@@ -0,0 +1,129 @@
+import hashlib
+import os
+from typing import Optional
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from utils.cache import CacheBackend, InMemoryCacheBackend
+from utils.mysqldb import MySQLDatabase
+
+
+# 키 보관 시간(초). 메모리는 TTL 로, DB 행은 PENDING 정리 작업이 created_at 기준으로 삭제 (0이면 DB 행을 삭제하지 않음)
+IDEMPOTENCY_KEY_TTL = float(os.getenv('IDEMPOTENCY_KEY_TTL', str(24 * 60 * 60)))
+IDEMPOTENCY_KEY_MAX_ENTRIES = int(os.getenv('IDEMPOTENCY_KEY_MAX_ENTRIES', '10000'))
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+
+def request_fingerprint(request: BaseModel) -> str:
+    return hashlib.sha256(request.model_dump_json().encode("utf-8")).hexdigest()
+
+
+class IdempotencyStore:
+    """
+    Idempotency-Key 별 최초 응답(주문번호) 저장소
+    - 조회: 메모리(TTL + LRU) -> idempotency_key 테이블
+    - 기록: 예약 INSERT 와 같은 트랜잭션에서 저장해 커밋된 예약과 항상 함께 존재
+    - 같은 키를 다른 요청 본문으로 재사용하면 422
+    - 보관 시간이 지난 DB 행은 prune_expired 로 배치 삭제
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(IdempotencyStore, cls).__new__(cls)
+
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+
+        self._backend: CacheBackend = InMemoryCacheBackend(IDEMPOTENCY_KEY_MAX_ENTRIES)
+        self._initialized = True
+
+    def set_backend(self, backend: CacheBackend) -> None:
+        self._backend = backend
+
+    async def lookup(self, user_id: str, key: str, request_hash: str) -> Optional[str]:
+        """
+        이미 처리된 키면 최초 주문번호, 처음 보는 키면 None
+        - DB 조회는 별도 세션에서 실행 (요청 트랜잭션의 첫 조회는 예약 잠금이어야 함)
+        """
+        cached = await self._backend.get(self._key(user_id, key))
+        if cached is not None:
+            stored_hash, order_number = cached.decode().split("|", 1)
+            return self._verified(stored_hash, request_hash, order_number)
+
+        async with MySQLDatabase().session() as session:
+            row = (await session.execute(
+                text(
+                    "SELECT request_hash, order_number FROM idempotency_key "
+                    "WHERE user_id = :user_id AND idem_key = :idem_key"
+                ),
+                {"user_id": user_id, "idem_key": key}
+            )).first()
+        if row is None:
+            return None
+
+        await self.remember(user_id, key, row.request_hash, row.order_number)
+        return self._verified(row.request_hash, request_hash, row.order_number)
+
+    async def record(self, session: AsyncSession, user_id: str, key: str, request_hash: str, order_number: str) -> None:
+        """
+        요청 트랜잭션 안에서 키 저장
+        - 같은 키의 동시 요청은 기본 키 충돌(IntegrityError)로 한 건만 커밋됨
+        """
+        await session.execute(
+            text(
+                "INSERT INTO idempotency_key (user_id, idem_key, request_hash, order_number) "
+                "VALUES (:user_id, :idem_key, :request_hash, :order_number)"
+            ),
+            {"user_id": user_id, "idem_key": key, "request_hash": request_hash, "order_number": order_number}
+        )
+
+    async def remember(self, user_id: str, key: str, request_hash: str, order_number: str) -> None:
+        """
+        커밋 이후 호출
+        """
+        await self._backend.set(
+            self._key(user_id, key),
+            f"{request_hash}|{order_number}".encode(),
+            IDEMPOTENCY_KEY_TTL
+        )
+
+    @staticmethod
+    async def prune_expired(session: AsyncSession, batch_size: int) -> int:
+        """
+        보관 시간이 지난 키를 created_at 인덱스 순으로 최대 batch_size 건 삭제하고 삭제 건수 반환
+        - created_at 이 DB 시각이므로 기준 시각도 DB 에서 계산
+        """
+        result = await session.execute(
+            text(
+                "DELETE FROM idempotency_key "
+                "WHERE created_at < NOW() - INTERVAL :ttl SECOND "
+                "ORDER BY created_at LIMIT :batch_size"
+            ),
+            {"ttl": int(IDEMPOTENCY_KEY_TTL), "batch_size": batch_size}
+        )
+        return result.rowcount
+
+    @staticmethod
+    def _verified(stored_hash: str, request_hash: str, order_number: str) -> str:
+        if stored_hash != request_hash:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="같은 Idempotency-Key로 다른 요청을 보낼 수 없습니다.",
+            )
+        return order_number
+
+    @staticmethod
+    def _key(user_id: str, key: str) -> str:
+        return f"idempotency:{user_id}:{key}"
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    return IdempotencyStore()
@@ -0,0 +1,109 @@
+import asyncio
+import os
+from datetime import datetime
+from time import perf_counter
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from utils.metrics import ORDER_NUMBER_ALLOCATION_SECONDS
+from utils.mysqldb import MySQLDatabase
+
+
+# 초당 발급 가능한 주문번호 수 (YYYYmmddHHMMSS + 4자리)
+ORDER_NUMBER_SUFFIX_LIMIT = 10000
+
+
+class OrderNumberAllocator:
+    """
+    주문번호(YYYYmmddHHMMSS + 4자리 일련번호) 발급기
+    - 초(prefix)별 카운터 행을 DB에서 원자적으로 증가시켜 블록 단위로 확보
+    - 확보한 블록은 워커 메모리에서 소진하므로 요청마다 조회하지 않음
+    - 카운터는 DB가 단일 진실 공급원이라 프로세스/파드 간 중복이 발생하지 않음
+    - 지난 날짜의 카운터 행은 다시 쓰이지 않으므로 PENDING 정리 작업(pending_sweeper)이 주기적으로 삭제
+    - ORDER_NUMBER_BLOCK_SIZE: 워커가 한 번에 확보하는 주문번호 개수 (첫 발급 시점에 읽어 .env 설정도 반영)
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(OrderNumberAllocator, cls).__new__(cls)
+
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+
+        self._lock = asyncio.Lock()
+        self._block_size = int(os.getenv('ORDER_NUMBER_BLOCK_SIZE', '20'))
+        self._prefix = None
+        self._next_value = 0
+        self._end_value = 0
+        self._initialized = True
+
+    async def allocate(self, count: int = 1) -> List[str]:
+        if count > ORDER_NUMBER_SUFFIX_LIMIT:
+            raise ValueError(f"한 번에 발급 가능한 주문번호는 최대 {ORDER_NUMBER_SUFFIX_LIMIT}개입니다.")
+
+        started_at = perf_counter()
+        source = "memory"
+        async with self._lock:
+            while True:
+                prefix = datetime.now().strftime("%Y%m%d%H%M%S")
+                if prefix == self._prefix and self._end_value - self._next_value >= count:
+                    break
+
+                source = "database"
+                await self._reserve_block(prefix, max(count, self._block_size))
+                if self._end_value - self._next_value >= count:
+                    break
+
+                # 해당 초의 번호를 모두 소진하면 다음 초까지 대기
+                await asyncio.sleep(1 - datetime.now().microsecond / 1_000_000)
+
+            start_value = self._next_value
+            self._next_value += count
+
+        ORDER_NUMBER_ALLOCATION_SECONDS.labels(source=source).observe(perf_counter() - started_at)
+
+        return [f"{prefix}{value:04d}" for value in range(start_value, start_value + count)]
+
+    async def _reserve_block(self, prefix: str, size: int) -> None:
+        async with MySQLDatabase().session() as session:
+            result = await session.execute(
+                text(
+                    "INSERT INTO order_number_counter (order_prefix, last_value) "
+                    "VALUES (:prefix, LAST_INSERT_ID(:size)) "
+                    "ON DUPLICATE KEY UPDATE last_value = LAST_INSERT_ID(last_value + :size)"
+                ),
+                {"prefix": prefix, "size": size}
+            )
+            end_value = result.lastrowid
+            if not end_value:
+                end_value = (await session.execute(text("SELECT LAST_INSERT_ID()"))).scalar_one()
+
+        self._prefix = prefix
+        self._next_value = min(end_value - size, ORDER_NUMBER_SUFFIX_LIMIT)
+        self._end_value = min(end_value, ORDER_NUMBER_SUFFIX_LIMIT)
+
+    @staticmethod
+    async def prune_past_counters(session: AsyncSession, batch_size: int) -> int:
+        """
+        오늘 이전 카운터 행을 기본 키(order_prefix) 순서로 최대 batch_size 건 삭제하고 삭제 건수 반환
+        - 발급 잠금 밖(백그라운드 작업)에서 호출해 주문번호 발급이 삭제를 기다리지 않도록 함
+        """
+        result = await session.execute(
+            text(
+                "DELETE FROM order_number_counter WHERE order_prefix < :day_start "
+                "ORDER BY order_prefix LIMIT :batch_size"
+            ),
+            {"day_start": datetime.now().strftime("%Y%m%d000000"), "batch_size": batch_size}
+        )
+        return result.rowcount
+
+
+def get_order_number_allocator() -> OrderNumberAllocator:
+    return OrderNumberAllocator()
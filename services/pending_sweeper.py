@@ -0,0 +1,207 @@
+import asyncio
+import os
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+from sqlalchemy import text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from enums.reservation_type import ReservationStatus
+from models.reservation import Reservation
+from services.idempotency import IDEMPOTENCY_KEY_TTL, get_idempotency_store
+from services.order_number_allocator import OrderNumberAllocator
+from services.reservation_conflict import ReservationSlot
+from services.reservation_list_cache import get_reservation_list_cache
+from services.reservation_rollup import RollupDelta, apply_rollup_delta
+from services.reservation_status import slot_of
+from services.space_availability import get_space_availability_cache
+from utils.logger import Logger
+from utils.metrics import PENDING_RESERVATIONS_SWEPT
+from utils.mysqldb import MySQLDatabase
+
+
+# 결제 콜백 없이 이 시간(초)이 지난 PENDING 예약을 만료 처리 (0이면 비활성화)
+PENDING_RESERVATION_TTL = float(os.getenv('PENDING_RESERVATION_TTL', '1800'))
+# 만료된 예약을 옮길 상태 (FAILED 또는 CANCELED)
+PENDING_SWEEP_TARGET_STATUS = ReservationStatus(os.getenv('PENDING_SWEEP_TARGET_STATUS', 'FAILED'))
+# 정리 주기(초), 배치 크기, 배치 사이 대기 시간(초)
+PENDING_SWEEP_INTERVAL = float(os.getenv('PENDING_SWEEP_INTERVAL', '60'))
+PENDING_SWEEP_BATCH_SIZE = int(os.getenv('PENDING_SWEEP_BATCH_SIZE', '200'))
+PENDING_SWEEP_BATCH_PAUSE = float(os.getenv('PENDING_SWEEP_BATCH_PAUSE', '0.1'))
+# 여러 파드/워커 중 한 곳만 정리하도록 잡는 advisory lock 이름
+PENDING_SWEEP_LOCK_NAME = "space_place_reservation.pending_sweeper"
+
+
+class PendingReservationSweeper:
+    """
+    만료된 PENDING 예약 정리 백그라운드 작업
+    - (r_status, reservation_date) 인덱스 순서로 작은 배치씩 처리하고 배치 사이에 쉬어 DB 부하를 제한
+    - 매 주기 GET_LOCK(대기 없음)을 얻은 프로세스만 정리 (나머지는 해당 주기를 건너뜀)
+    - 배치마다 커밋하고, 결제 콜백이 처리 중인 행(SKIP LOCKED)은 다음 주기로 미룸
+    - 같은 주기에 보관 시간이 지난 Idempotency-Key 행과 지난 날짜의 주문번호 카운터 행도 같은 배치 크기로 삭제
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(PendingReservationSweeper, cls).__new__(cls)
+
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+
+        if PENDING_SWEEP_TARGET_STATUS not in (ReservationStatus.FAILED, ReservationStatus.CANCELED):
+            raise ValueError("PENDING_SWEEP_TARGET_STATUS 는 FAILED 또는 CANCELED 여야 합니다.")
+
+        self._logger = Logger.setup_logger()
+        self._task: Optional[asyncio.Task] = None
+        self._initialized = True
+
+    def start(self) -> None:
+        # 주문번호 카운터 정리는 끌 수 없으므로 두 TTL 이 모두 0 이어도 실행
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                swept = await self.sweep_once()
+                if swept:
+                    self._logger.info(f'만료된 PENDING 예약 {swept}건을 {PENDING_SWEEP_TARGET_STATUS.value} 처리했습니다.')
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.error(f'PENDING 예약 정리 실패: {e}')
+            await asyncio.sleep(PENDING_SWEEP_INTERVAL)
+
+    async def sweep_once(self) -> int:
+        """
+        잠금을 얻으면 만료된 PENDING 예약을 모두 정리하고 처리 건수 반환 (잠금을 못 얻으면 0)
+        """
+        database = MySQLDatabase()
+        # 잠금은 연결 단위이므로 정리가 끝날 때까지 이 세션(연결)을 유지
+        async with database.session() as lock_session:
+            acquired = (await lock_session.execute(
+                text("SELECT GET_LOCK(:name, 0)"), {"name": PENDING_SWEEP_LOCK_NAME}
+            )).scalar()
+            if acquired != 1:
+                return 0
+
+            try:
+                swept = await self._expire_pending(database) if PENDING_RESERVATION_TTL > 0 else 0
+                if IDEMPOTENCY_KEY_TTL > 0:
+                    pruned = await self._prune_idempotency_keys(database)
+                    if pruned:
+                        self._logger.info(f'보관 시간이 지난 Idempotency-Key {pruned}건을 삭제했습니다.')
+                await self._prune_batches(database, OrderNumberAllocator.prune_past_counters)
+                return swept
+            finally:
+                await lock_session.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": PENDING_SWEEP_LOCK_NAME})
+
+    async def _expire_pending(self, database: MySQLDatabase) -> int:
+        cutoff = datetime.now() - timedelta(seconds=PENDING_RESERVATION_TTL)
+        swept = 0
+        while True:
+            async with database.session() as session:
+                expired_count, user_ids, released = await expire_pending_batch(
+                    session, cutoff, PENDING_SWEEP_TARGET_STATUS, PENDING_SWEEP_BATCH_SIZE
+                )
+
+            if expired_count:
+                swept += expired_count
+                PENDING_RESERVATIONS_SWEPT.labels(status=PENDING_SWEEP_TARGET_STATUS.value).inc(expired_count)
+                for user_id in user_ids:
+                    await get_reservation_list_cache().invalidate(user_id)
+                await get_space_availability_cache().release_slots(released)
+
+            if expired_count < PENDING_SWEEP_BATCH_SIZE:
+                return swept
+            await asyncio.sleep(PENDING_SWEEP_BATCH_PAUSE)
+
+    async def _prune_idempotency_keys(self, database: MySQLDatabase) -> int:
+        return await self._prune_batches(database, get_idempotency_store().prune_expired)
+
+    @staticmethod
+    async def _prune_batches(database: MySQLDatabase, prune: Callable[[AsyncSession, int], Awaitable[int]]) -> int:
+        """
+        prune(session, batch_size) 를 삭제 건수가 배치 크기보다 작아질 때까지 배치마다 커밋하며 반복
+        """
+        pruned = 0
+        while True:
+            async with database.session() as session:
+                deleted = await prune(session, PENDING_SWEEP_BATCH_SIZE)
+
+            pruned += deleted
+            if deleted < PENDING_SWEEP_BATCH_SIZE:
+                return pruned
+            await asyncio.sleep(PENDING_SWEEP_BATCH_PAUSE)
+
+
+async def expire_pending_batch(
+    session: AsyncSession,
+    cutoff: datetime,
+    target: ReservationStatus,
+    batch_size: int
+) -> Tuple[int, Set[str], List[Tuple[str, ReservationSlot]]]:
+    """
+    cutoff 이전에 생성된 PENDING 예약을 최대 batch_size 건 target 상태로 변경
+    - 같은 트랜잭션에서 일별 집계(reservation_daily_rollup) 반영
+    - (처리 건수, 변경된 예약의 user_id 목록, 비워진 (space_id, 이용 구간) 목록) 반환
+    """
+    rows = (await session.execute(
+        select(
+            Reservation.id,
+            Reservation.user_id,
+            Reservation.space_id,
+            Reservation.use_date,
+            Reservation.start_time,
+            Reservation.end_time
+        )
+        .where(
+            Reservation.r_status == ReservationStatus.PENDING,
+            Reservation.reservation_date < cutoff
+        )
+        .order_by(Reservation.reservation_date)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )).all()
+    if not rows:
+        return 0, set(), []
+
+    result = await session.execute(
+        update(Reservation)
+        .where(
+            Reservation.id.in_([row.id for row in rows]),
+            Reservation.r_status == ReservationStatus.PENDING
+        )
+        .values(r_status=target)
+        .execution_options(synchronize_session=False)
+    )
+    delta = RollupDelta()
+    released = []
+    for row in rows:
+        slot = slot_of(row)
+        if slot is None:
+            continue
+        delta.move(row.space_id, slot, ReservationStatus.PENDING, target)
+        released.append((row.space_id, slot))
+    await apply_rollup_delta(session, delta)
+    return result.rowcount, {row.user_id for row in rows}, released
+
+
+def get_pending_sweeper() -> PendingReservationSweeper:
+    return PendingReservationSweeper()
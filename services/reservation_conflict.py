@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from itertools import count
+from typing import List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import and_, or_, select
+
+from enums.reservation_type import ReservationStatus
+from models.reservation import Reservation
+
+
+# 공간을 점유하는 예약 상태
+ACTIVE_STATUSES = (ReservationStatus.PENDING, ReservationStatus.COMPLETED)
+# 잠금 행 생성/잠금이 교착으로 롤백됐을 때 다시 시도하는 횟수
+LOCK_DEADLOCK_RETRIES = 3
+MYSQL_LOCK_DEADLOCK = 1213
+
+
+@dataclass(frozen=True)
+class ReservationSlot:
+    """
+    예약 한 건이 점유하는 구간
+    - 일 단위 예약: use_date만 존재, [use_date, use_date + 1일)
+    - 시간 단위 예약: start_time/end_time 존재, [start_time, end_time)
+    """
+    use_date: Optional[datetime] = None
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+
+    @property
+    def range_start(self) -> datetime:
+        return self.use_date if self.use_date else self.start_time
+
+    @property
+    def range_end(self) -> datetime:
+        return self.use_date + timedelta(days=1) if self.use_date else self.end_time
+
+    @property
+    def lock_dates(self) -> List[date]:
+        first_day = self.range_start.date()
+        last_day = (self.range_end - timedelta(microseconds=1)).date()
+        return [first_day + timedelta(days=offset) for offset in range((last_day - first_day).days + 1)]
+
+    def overlaps(self, other: "ReservationSlot") -> bool:
+        return self.range_start < other.range_end and other.range_start < self.range_end
+
+    def shifted(self, delta: timedelta) -> "ReservationSlot":
+        if self.use_date:
+            return ReservationSlot(use_date=self.use_date + delta)
+        return ReservationSlot(start_time=self.start_time + delta, end_time=self.end_time + delta)
+
+
+def parse_use_date(use_date: str) -> datetime:
+    """
+    이용일 문자열을 그날 0시로 변환
+    - 기존 클라이언트가 보내던 형식(YYYY-MM-DD, YYYYMMDD, YYYY/MM/DD, YYYY.MM.DD, 시각이 붙은 ISO 형식)을 모두 허용
+    - 일 단위 예약은 하루 전체를 점유하므로 시각 부분은 버림
+    """
+    value = use_date.strip()
+    if len(value) >= 10 and value[4] in "/." and value[7] == value[4]:
+        value = f"{value[:4]}-{value[5:7]}-{value[8:]}"
+    return datetime.combine(datetime.fromisoformat(value).date(), datetime.min.time())
+
+
+def parse_reservation_slot(use_date: str, start_time: str, end_time: str) -> ReservationSlot:
+    try:
+        if use_date:
+            return ReservationSlot(use_date=parse_use_date(use_date))
+
+        slot = ReservationSlot(start_time=datetime.fromisoformat(start_time), end_time=datetime.fromisoformat(end_time))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이용일 또는 이용 시간 형식이 올바르지 않습니다.",
+        )
+
+    if slot.start_time >= slot.end_time:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이용 종료 시간은 시작 시간 이후여야 합니다.",
+        )
+    return slot
+
+
+async def lock_and_check_conflicts(session: AsyncSession, space_id: str, slots: List[ReservationSlot]) -> None:
+    """
+    (space_id, 날짜) 잠금 행을 잡은 뒤 겹치는 예약이 있는지 확인
+    - 같은 공간/날짜의 생성 요청만 직렬화되고 다른 공간/날짜는 병렬로 처리됨
+    - 트랜잭션의 첫 문장이 잠금이어야 이후 조회가 잠금 이후 커밋된 예약까지 보게 됨
+    - 잠금은 요청 세션이 커밋/롤백될 때 해제됨
+    """
+    lock_dates = sorted({lock_date for slot in slots for lock_date in slot.lock_dates})
+    await _lock_space_dates(session, space_id, lock_dates)
+
+    if await find_conflicting_reservation(session, space_id, slots) is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 예약된 시간입니다.",
+        )
+
+
+async def find_conflicting_reservation(
+    session: AsyncSession,
+    space_id: str,
+    slots: List[ReservationSlot]
+) -> Optional[int]:
+    """
+    (space_id, start_time, end_time) / (space_id, use_date) 인덱스를 사용하는 단일 조회
+    """
+    conditions = []
+    for slot in slots:
+        conditions.append(
+            and_(Reservation.start_time < slot.range_end, Reservation.end_time > slot.range_start)
+        )
+        conditions.append(
+            and_(
+                Reservation.use_date > slot.range_start - timedelta(days=1),
+                Reservation.use_date < slot.range_end
+            )
+        )
+
+    statement = (
+        select(Reservation.id)
+        .where(
+            Reservation.space_id == space_id,
+            Reservation.r_status.in_(ACTIVE_STATUSES),
+            or_(*conditions)
+        )
+        .limit(1)
+    )
+    result = await session.execute(statement)
+    return result.scalar()
+
+
+async def _lock_space_dates(session: AsyncSession, space_id: str, lock_dates: List[date]) -> None:
+    """
+    요청 트랜잭션에서 잠금 행을 만들거나(처음 예약되는 날짜) 이미 있으면 배타 잠금
+    - INSERT ... ON DUPLICATE KEY UPDATE 한 문장이라 다른 커넥션이 필요 없고, 공유 잠금에서 배타 잠금으로의 승격도 없음
+    - 날짜 순으로 잠가 여러 날짜를 잡는 요청끼리의 교착을 줄이고, 그래도 교착이 나면 트랜잭션의 첫 문장이므로 롤백 후 재시도
+    """
+    rows = [{"space_id": space_id, "lock_date": lock_date} for lock_date in lock_dates]
+    for attempt in count():
+        try:
+            await session.execute(
+                text(
+                    "INSERT INTO reservation_lock (space_id, lock_date) VALUES (:space_id, :lock_date) "
+                    "ON DUPLICATE KEY UPDATE lock_date = lock_date"
+                ),
+                rows
+            )
+            return
+        except OperationalError as e:
+            if e.orig.args[0] != MYSQL_LOCK_DEADLOCK or attempt >= LOCK_DEADLOCK_RETRIES:
+                raise
+            await session.rollback()
@@ -0,0 +1,101 @@
+import csv
+import io
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from typing import Any, AsyncIterator, Iterable, Optional
+
+from pydantic_core import to_json
+from sqlmodel import and_, or_, select
+
+from models.reservation import Reservation
+from schemas.reservation import ReservationExportFormat, ReservationOut
+from utils.mysqldb import get_database
+
+
+# 서버 측 커서에서 한 번에 가져와 응답 청크 하나로 내보내는 행 수
+RESERVATION_EXPORT_CHUNK_ROWS = int(os.getenv('RESERVATION_EXPORT_CHUNK_ROWS', '1000'))
+
+EXPORT_FIELDS = tuple(ReservationOut.model_fields)
+
+EXPORT_MEDIA_TYPES = {
+    ReservationExportFormat.NDJSON: "application/x-ndjson",
+    ReservationExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+@dataclass(frozen=True)
+class ReservationExportFilter:
+    """
+    내보내기 조건
+    - date_from/date_to: 이용일(또는 이용 시작 시간) 기준 [date_from, date_to] 범위
+    """
+    user_id: Optional[str] = None
+    space_id: Optional[str] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+
+
+def build_export_statement(export_filter: ReservationExportFilter):
+    statement = select(*(getattr(Reservation, field) for field in EXPORT_FIELDS))
+    if export_filter.user_id:
+        statement = statement.where(Reservation.user_id == export_filter.user_id)
+    if export_filter.space_id:
+        statement = statement.where(Reservation.space_id == export_filter.space_id)
+
+    if export_filter.date_from or export_filter.date_to:
+        statement = statement.where(
+            or_(
+                _date_range_condition(Reservation.start_time, export_filter),
+                _date_range_condition(Reservation.use_date, export_filter)
+            )
+        )
+    return statement.order_by(Reservation.id)
+
+
+def _date_range_condition(column, export_filter: ReservationExportFilter):
+    conditions = []
+    if export_filter.date_from:
+        conditions.append(column >= datetime.combine(export_filter.date_from, time.min))
+    if export_filter.date_to:
+        conditions.append(column < datetime.combine(export_filter.date_to + timedelta(days=1), time.min))
+    return and_(*conditions)
+
+
+async def stream_reservations(
+    export_filter: ReservationExportFilter,
+    export_format: ReservationExportFormat
+) -> AsyncIterator[bytes]:
+    """
+    서버 측 커서(stream_results)로 읽으면서 청크 단위로 직렬화
+    - 요청 의존성 세션은 응답 스트리밍 전에 닫히므로 스트림이 직접 세션을 열고 닫음
+    - 메모리에는 청크 하나 분량의 행만 유지
+    - 조회 전용이므로 reader 엔드포인트가 있으면 복제본에서 읽음
+    """
+    if export_format is ReservationExportFormat.CSV:
+        yield _csv_chunk([EXPORT_FIELDS])
+
+    async with get_database().reader_session() as session:
+        result = await session.stream(
+            build_export_statement(export_filter).execution_options(yield_per=RESERVATION_EXPORT_CHUNK_ROWS)
+        )
+        async for rows in result.mappings().partitions():
+            if export_format is ReservationExportFormat.CSV:
+                yield _csv_chunk([_csv_value(row[field]) for field in EXPORT_FIELDS] for row in rows)
+            else:
+                yield b"".join(to_json(dict(row)) + b"\n" for row in rows)
+
+
+def _csv_chunk(rows: Iterable[Iterable[Any]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    return value
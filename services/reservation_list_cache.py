@@ -0,0 +1,85 @@
+import os
+from time import time_ns
+from typing import Optional, Tuple
+
+from utils.cache import CacheBackend, InMemoryCacheBackend
+
+
+# 목록 캐시 유지 시간(초). 공유 CacheBackend 를 쓰지 않으면 다른 파드나 같은 파드의 다른 워커 프로세스에서
+# 발생한 변경은 최대 이 시간만큼 늦게 반영됨
+RESERVATION_LIST_CACHE_TTL = float(os.getenv('RESERVATION_LIST_CACHE_TTL', '5'))
+RESERVATION_LIST_CACHE_MAX_ENTRIES = int(os.getenv('RESERVATION_LIST_CACHE_MAX_ENTRIES', '10000'))
+# 사용자별 세대(generation) 키 유지 시간(초)
+_GENERATION_TTL = 24 * 60 * 60
+
+
+class ReservationListCache:
+    """
+    사용자별 예약 목록 응답(read-through) 캐시
+    - 키: reservations:{user_id}:{세대}:{페이지 키}
+    - 생성/상태 변경 시 해당 사용자의 세대만 새 값으로 바꿔 이전 페이지들을 한 번에 무효화
+    - 세대 값은 시각 기반이라 세대 키가 LRU로 밀려나도 과거 항목이 다시 조회되지 않음
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ReservationListCache, cls).__new__(cls)
+
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+
+        self._backend: CacheBackend = InMemoryCacheBackend(RESERVATION_LIST_CACHE_MAX_ENTRIES)
+        self._ttl = RESERVATION_LIST_CACHE_TTL
+        self._initialized = True
+
+    def set_backend(self, backend: CacheBackend) -> None:
+        self._backend = backend
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    async def get(self, user_id: str, page_key: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        (캐시된 응답, 조회 시점의 세대) 반환
+        - 저장 시에는 조회 시점의 세대를 그대로 넘겨야, 조회 중 무효화된 결과가 새 세대로 저장되지 않음
+        """
+        if not self.enabled:
+            return None, None
+        generation = await self._generation(user_id)
+        return await self._backend.get(self._key(user_id, generation, page_key)), generation
+
+    async def set(self, user_id: str, generation: Optional[str], page_key: str, body: bytes) -> None:
+        if not self.enabled or generation is None:
+            return
+        await self._backend.set(self._key(user_id, generation, page_key), body, self._ttl)
+
+    async def invalidate(self, user_id: str) -> None:
+        """
+        커밋 이후에 호출해야 함 (커밋 전에 무효화하면 이전 데이터가 새 세대로 다시 캐시될 수 있음)
+        """
+        await self._backend.set(self._generation_key(user_id), str(time_ns()).encode(), _GENERATION_TTL)
+
+    async def _generation(self, user_id: str) -> str:
+        generation = await self._backend.get(self._generation_key(user_id))
+        if generation is None:
+            generation = str(time_ns()).encode()
+            await self._backend.set(self._generation_key(user_id), generation, _GENERATION_TTL)
+        return generation.decode()
+
+    @staticmethod
+    def _generation_key(user_id: str) -> str:
+        return f"reservations:generation:{user_id}"
+
+    @staticmethod
+    def _key(user_id: str, generation: str, page_key: str) -> str:
+        return f"reservations:{user_id}:{generation}:{page_key}"
+
+
+def get_reservation_list_cache() -> ReservationListCache:
+    return ReservationListCache()
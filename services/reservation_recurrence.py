@@ -0,0 +1,72 @@
+from datetime import timedelta
+from itertools import count
+from typing import List
+
+from fastapi import HTTPException, status
+
+from schemas.reservation import (
+    RESERVATION_SLOT_LIMIT,
+    RecurrenceFrequency,
+    RecurrenceRule,
+    ReservationRequest,
+    ReservationSlotRequest,
+)
+from services.reservation_conflict import ReservationSlot, parse_reservation_slot
+
+
+def expand_reservation_slots(request: ReservationRequest) -> List[ReservationSlot]:
+    """
+    요청의 슬롯(단일 슬롯 또는 slots)에 반복 규칙을 적용해 예약할 슬롯 목록으로 전개
+    - 시작 시각 순으로 정렬해 반환
+    - 전개 결과가 없거나(반복 종료일이 첫 슬롯보다 이전) RESERVATION_SLOT_LIMIT 을 넘거나 슬롯끼리 겹치면 400
+    """
+    slot_requests = request.slots or [
+        ReservationSlotRequest(use_date=request.use_date, start_time=request.start_time, end_time=request.end_time)
+    ]
+    base_slots = [
+        parse_reservation_slot(slot_request.use_date, slot_request.start_time, slot_request.end_time)
+        for slot_request in slot_requests
+    ]
+
+    slots = base_slots if request.recurrence is None else _repeat(base_slots, request.recurrence)
+    if not slots:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="반복 종료일은 첫 이용일 이후여야 합니다.",
+        )
+    if len(slots) > RESERVATION_SLOT_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 예약할 수 있는 슬롯은 최대 {RESERVATION_SLOT_LIMIT}개입니다.",
+        )
+
+    slots = sorted(slots, key=lambda slot: slot.range_start)
+    # 시작 시각 순으로 정렬하면 겹치는 슬롯이 있을 때 인접한 두 슬롯도 반드시 겹침
+    for previous, current in zip(slots, slots[1:]):
+        if previous.overlaps(current):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="요청한 이용 시간끼리 겹칩니다.",
+            )
+    return slots
+
+
+def _repeat(base_slots: List[ReservationSlot], rule: RecurrenceRule) -> List[ReservationSlot]:
+    period_days = 7 if rule.frequency is RecurrenceFrequency.WEEKLY else 1
+    step = timedelta(days=period_days * rule.interval)
+
+    slots: List[ReservationSlot] = []
+    for occurrence in count():
+        if rule.count is not None and occurrence >= rule.count:
+            break
+
+        repeated = [slot.shifted(step * occurrence) for slot in base_slots]
+        if rule.until is not None:
+            repeated = [slot for slot in repeated if slot.range_start.date() <= rule.until]
+            if not repeated:
+                break
+
+        slots.extend(repeated)
+        if len(slots) > RESERVATION_SLOT_LIMIT:
+            break
+    return slots
@@ -0,0 +1,159 @@
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from enums.reservation_type import ReservationStatus
+from services.reservation_conflict import ReservationSlot
+
+
+MINUTES_PER_DAY = 24 * 60
+
+# reservation 테이블 기준 집계 (마이그레이션 0009 의 초기 집계와 같은 식)
+_ROLLUP_SELECT = """
+    SELECT
+        space_id,
+        DATE(COALESCE(use_date, start_time)),
+        r_status,
+        COUNT(*),
+        SUM(CASE WHEN use_date IS NOT NULL THEN 1440 ELSE TIMESTAMPDIFF(MINUTE, start_time, end_time) END)
+    FROM reservation
+    WHERE space_id IS NOT NULL
+        AND r_status IS NOT NULL
+        AND (use_date IS NOT NULL OR (start_time IS NOT NULL AND end_time IS NOT NULL))
+"""
+
+
+def rollup_day(slot: ReservationSlot) -> date:
+    """
+    집계 기준일: 이용일(일 단위) 또는 이용 시작일(시간 단위)
+    """
+    return slot.range_start.date()
+
+
+def booked_minutes(slot: ReservationSlot) -> int:
+    if slot.use_date:
+        return MINUTES_PER_DAY
+    return int((slot.end_time - slot.start_time).total_seconds() // 60)
+
+
+class RollupDelta:
+    """
+    reservation_daily_rollup 에 더할 (space_id, 날짜, 상태)별 증감
+    - 상태 전이는 이전 상태 -1, 새 상태 +1
+    """
+
+    def __init__(self):
+        self._changes: Dict[Tuple[str, date, ReservationStatus], List[int]] = defaultdict(lambda: [0, 0])
+
+    def add(self, space_id: str, slot: ReservationSlot, r_status: ReservationStatus, sign: int = 1) -> None:
+        change = self._changes[(space_id, rollup_day(slot), r_status)]
+        change[0] += sign
+        change[1] += sign * booked_minutes(slot)
+
+    def move(self, space_id: str, slot: ReservationSlot, source: ReservationStatus, target: ReservationStatus) -> None:
+        self.add(space_id, slot, source, -1)
+        self.add(space_id, slot, target, 1)
+
+    def __bool__(self) -> bool:
+        return any(count or minutes for count, minutes in self._changes.values())
+
+    def rows(self) -> List[Dict]:
+        # 여러 트랜잭션이 같은 집계 행을 갱신할 때 교착을 피하도록 항상 같은 순서로 갱신
+        return [
+            {
+                "space_id": space_id,
+                "day": day,
+                "r_status": r_status.value,
+                "reservation_count": count,
+                "booked_minutes": minutes,
+            }
+            for (space_id, day, r_status), (count, minutes) in sorted(
+                self._changes.items(), key=lambda item: (item[0][0], item[0][1], item[0][2].value)
+            )
+            if count or minutes
+        ]
+
+
+async def apply_rollup_delta(session: AsyncSession, delta: RollupDelta) -> None:
+    """
+    예약 변경과 같은 트랜잭션에서 집계 반영 (executemany 한 번)
+    """
+    if not delta:
+        return
+    await session.execute(
+        text(
+            "INSERT INTO reservation_daily_rollup (space_id, day, r_status, reservation_count, booked_minutes) "
+            "VALUES (:space_id, :day, :r_status, :reservation_count, :booked_minutes) "
+            "ON DUPLICATE KEY UPDATE "
+            "reservation_count = reservation_count + VALUES(reservation_count), "
+            "booked_minutes = booked_minutes + VALUES(booked_minutes)"
+        ),
+        delta.rows()
+    )
+
+
+async def rebuild_rollup(session: AsyncSession, space_id: Optional[str] = None) -> None:
+    """
+    reservation 테이블로 집계를 다시 만듦 (전체 또는 공간 하나)
+    - 집계가 어긋났을 때 운영자가 실행하는 용도, 대상 예약 행에 공유 잠금이 걸리므로 한가한 시간에 실행
+    """
+    if space_id is None:
+        space_condition, params = "", {}
+        await session.execute(text("DELETE FROM reservation_daily_rollup"))
+    else:
+        space_condition, params = " AND space_id = :space_id", {"space_id": space_id}
+        await session.execute(text("DELETE FROM reservation_daily_rollup WHERE space_id = :space_id"), params)
+
+    await session.execute(
+        text(
+            "INSERT INTO reservation_daily_rollup (space_id, day, r_status, reservation_count, booked_minutes) "
+            f"{_ROLLUP_SELECT}{space_condition} "
+            "GROUP BY space_id, DATE(COALESCE(use_date, start_time)), r_status"
+        ),
+        params
+    )
+
+
+async def fetch_rollup(
+    session: AsyncSession,
+    space_id: str,
+    date_from: date,
+    date_to: date
+) -> List[Tuple[date, ReservationStatus, int, int]]:
+    """
+    집계 테이블만 읽어 (날짜, 상태, 예약 수, 예약 시간(분)) 목록 반환 (기본 키 범위 조회)
+    """
+    rows = await session.execute(
+        text(
+            "SELECT day, r_status, reservation_count, booked_minutes FROM reservation_daily_rollup "
+            "WHERE space_id = :space_id AND day BETWEEN :date_from AND :date_to"
+        ),
+        {"space_id": space_id, "date_from": date_from, "date_to": date_to}
+    )
+    return [
+        (day, ReservationStatus(r_status), reservation_count, minutes)
+        for day, r_status, reservation_count, minutes in rows.all()
+    ]
+
+
+if __name__ == "__main__":
+    # 집계 재생성: python -m services.reservation_rollup [space_id]
+    import asyncio
+    import os
+    import sys
+
+    from dotenv import load_dotenv
+
+    from utils.database_config import DatabaseConfig
+
+    async def _rebuild(space_id: Optional[str]) -> None:
+        load_dotenv('.env.development' if os.getenv('APP_ENV') == 'development' else '.env.production')
+        database = DatabaseConfig().create_database()
+        async with database.session() as session:
+            await rebuild_rollup(session, space_id)
+        await database.close()
+
+    asyncio.run(_rebuild(sys.argv[1] if len(sys.argv) > 1 else None))
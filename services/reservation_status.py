@@ -0,0 +1,227 @@
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import or_, select
+
+from enums.reservation_type import ReservationStatus
+from models.reservation import Reservation
+from schemas.reservation import BulkStatusUpdateOutcome
+from services.reservation_conflict import ReservationSlot
+from services.reservation_rollup import RollupDelta, apply_rollup_delta
+
+
+def matches_order_number(order_number: str):
+    """
+    주문번호 또는 묶음 대표 주문번호(group_order_number)가 일치하는 예약
+    - 묶음 예약은 대표 주문번호 하나로 결제되므로 묶음 전체가 함께 변경됨
+    """
+    return or_(Reservation.order_number == order_number, Reservation.group_order_number == order_number)
+
+
+def matches_order_numbers(order_numbers: List[str]):
+    return or_(Reservation.order_number.in_(order_numbers), Reservation.group_order_number.in_(order_numbers))
+
+
+async def transition_status(
+    session: AsyncSession,
+    order_number: str,
+    target: ReservationStatus
+) -> Tuple[Set[str], List[Tuple[str, ReservationSlot]]]:
+    """
+    주문번호(또는 묶음 대표 주문번호)의 예약 상태 전이 (요청 트랜잭션의 첫 작업이어야 함)
+    - 조건부 UPDATE 로 바로 전이한 뒤, UPDATE 가 잠근 행을 다시 읽어 집계 증감을 계산하고 같은 트랜잭션에서 반영
+    - 바뀔 수 있는 이전 상태는 하나(PENDING)뿐이므로, 지금 target 인 행 수가 변경 건수와 같으면 모두 이번에 바뀐 행
+    - 묶음 중 일부가 이미 target 이었다면 어느 행이 바뀌었는지 알 수 없으므로 롤백 후 잠금 조회 경로로 처리
+    - 없는 주문번호는 404, 전이할 수 없는 상태는 409, 같은 상태로의 재요청은 변경 없이 성공
+    - (상태가 바뀐 예약의 user_id 목록, (space_id, 이용 구간) 목록) 반환
+    """
+    sources = tuple(source for source in target.allowed_sources() if source is not target)
+    if len(sources) != 1:
+        return await _transition_locked(session, order_number, target)
+
+    result = await session.execute(
+        update(Reservation)
+        .where(matches_order_number(order_number), Reservation.r_status == sources[0])
+        .values(r_status=target)
+        .execution_options(synchronize_session=False)
+    )
+    rows = await _read_reservations(session, order_number)
+    if not result.rowcount:
+        _check_transition(rows, target)
+        return set(), []
+
+    changing = [row for row in rows if row.r_status is target]
+    if len(changing) != result.rowcount:
+        await session.rollback()
+        return await _transition_locked(session, order_number, target)
+    return await _apply_rollup(session, [(row, sources[0]) for row in changing], target)
+
+
+async def _transition_locked(
+    session: AsyncSession,
+    order_number: str,
+    target: ReservationStatus
+) -> Tuple[Set[str], List[Tuple[str, ReservationSlot]]]:
+    # 대상 행을 잠근(FOR UPDATE) 뒤 실제로 상태가 바뀌는 행만 UPDATE
+    rows = await _lock_reservations(session, [order_number])
+    _check_transition(rows, target)
+    return await _apply_transition(session, rows, target)
+
+
+def _check_transition(rows, target: ReservationStatus) -> None:
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="일치하는 주문번호가 존재하지 않습니다.",
+        )
+    if not any(row.r_status in target.allowed_sources() for row in rows):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="현재 예약 상태에서는 변경할 수 없습니다.",
+        )
+
+
+async def bulk_transition_status(
+    session: AsyncSession,
+    order_numbers: List[str],
+    target: ReservationStatus
+) -> Tuple[Dict[str, BulkStatusUpdateOutcome], Set[str], List[Tuple[str, ReservationSlot]]]:
+    """
+    여러 주문번호를 한 트랜잭션에서 일괄 전이
+    - 대상 행을 한 번에 잠그고(FOR UPDATE) 현재 상태로 결과를 분류
+    - 전이 가능한 행만 집합 UPDATE 한 번으로 변경
+    - (주문번호별 결과, 변경된 예약의 user_id 목록, 상태가 바뀐 예약의 (space_id, 이용 구간) 목록) 반환
+    """
+    order_numbers = list(dict.fromkeys(order_numbers))
+    sources = target.allowed_sources()
+
+    requested = set(order_numbers)
+    rows = await _lock_reservations(session, order_numbers)
+    # 요청한 번호(개별 또는 묶음 대표 번호) 기준으로 집계, 묶음은 전이 가능한 예약이 하나라도 있으면 변경 대상
+    rows_by_number: Dict[str, list] = {}
+    for row in rows:
+        requested_number = row.group_order_number if row.group_order_number in requested else row.order_number
+        rows_by_number.setdefault(requested_number, []).append(row)
+    updatable = {
+        order_number for order_number, number_rows in rows_by_number.items()
+        if any(row.r_status in sources for row in number_rows)
+    }
+
+    user_ids, changed = await _apply_transition(
+        session,
+        [row for order_number in updatable for row in rows_by_number[order_number]],
+        target
+    )
+
+    outcomes: Dict[str, BulkStatusUpdateOutcome] = {}
+    for order_number in order_numbers:
+        if order_number not in rows_by_number:
+            outcomes[order_number] = BulkStatusUpdateOutcome.NOT_FOUND
+        elif order_number in updatable:
+            outcomes[order_number] = BulkStatusUpdateOutcome.UPDATED
+        else:
+            outcomes[order_number] = BulkStatusUpdateOutcome.INVALID_TRANSITION
+    return outcomes, user_ids, changed
+
+
+_RESERVATION_COLUMNS = (
+    Reservation.id,
+    Reservation.order_number,
+    Reservation.group_order_number,
+    Reservation.r_status,
+    Reservation.user_id,
+    Reservation.space_id,
+    Reservation.use_date,
+    Reservation.start_time,
+    Reservation.end_time,
+)
+
+
+async def _lock_reservations(session: AsyncSession, order_numbers: List[str]):
+    result = await session.execute(
+        select(*_RESERVATION_COLUMNS)
+        .where(matches_order_numbers(order_numbers))
+        .with_for_update()
+    )
+    return result.all()
+
+
+async def _read_reservations(session: AsyncSession, order_number: str):
+    # 같은 트랜잭션의 UPDATE 가 이미 행을 잠갔으므로 잠금 없이 주문번호 인덱스로 조회
+    result = await session.execute(select(*_RESERVATION_COLUMNS).where(matches_order_number(order_number)))
+    return result.all()
+
+
+async def _apply_transition(
+    session: AsyncSession,
+    rows,
+    target: ReservationStatus
+) -> Tuple[Set[str], List[Tuple[str, ReservationSlot]]]:
+    """
+    잠근 행 중 상태가 실제로 바뀌는 행만 UPDATE 한 번으로 변경하고 집계에 반영
+    - 같은 상태로의 재요청(결제 콜백 재시도)은 변경 없이 성공
+    """
+    sources = target.allowed_sources()
+    changing = [row for row in rows if row.r_status in sources and row.r_status is not target]
+    if not changing:
+        return set(), []
+
+    await session.execute(
+        update(Reservation)
+        .where(Reservation.id.in_([row.id for row in changing]))
+        .values(r_status=target)
+        .execution_options(synchronize_session=False)
+    )
+    return await _apply_rollup(session, [(row, row.r_status) for row in changing], target)
+
+
+async def _apply_rollup(
+    session: AsyncSession,
+    changes: List[Tuple[Any, ReservationStatus]],
+    target: ReservationStatus
+) -> Tuple[Set[str], List[Tuple[str, ReservationSlot]]]:
+    # 이미 (행, 이전 상태) -> target 으로 UPDATE 된 행의 집계 반영
+    delta = RollupDelta()
+    changed = []
+    for row, source in changes:
+        slot = slot_of(row)
+        if slot is None:
+            continue
+        delta.move(row.space_id, slot, source, target)
+        changed.append((row.space_id, slot))
+    await apply_rollup_delta(session, delta)
+    return {row.user_id for row, _ in changes}, changed
+
+
+def slot_of(row) -> Optional[ReservationSlot]:
+    """
+    조회한 예약 행의 이용 구간 (이용일/시간이 비어 있는 행은 None)
+    """
+    if row.use_date is None and (row.start_time is None or row.end_time is None):
+        return None
+    return ReservationSlot(use_date=row.use_date, start_time=row.start_time, end_time=row.end_time)
+
+
+async def update_payment_id(session: AsyncSession, order_number: str, payment_id: int) -> Set[str]:
+    """
+    결제 준비 번호 저장 후 해당 예약의 user_id 목록 반환 (목록 캐시 무효화용)
+    """
+    statement = (
+        update(Reservation)
+        .where(matches_order_number(order_number))
+        .values(payment_id=payment_id)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(statement)
+    if not result.rowcount:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="일치하는 주문번호가 존재하지 않습니다.",
+        )
+
+    # 방금 UPDATE 로 잠근 행을 주문번호 인덱스로 다시 읽음
+    user_ids = await session.execute(select(Reservation.user_id).where(matches_order_number(order_number)))
+    return set(user_ids.scalars().all())
+
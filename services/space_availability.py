@@ -0,0 +1,185 @@
+import os
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Set, Tuple
+
+from sqlmodel import and_, or_, select
+
+from models.reservation import Reservation
+from services.reservation_conflict import ACTIVE_STATUSES, ReservationSlot
+from utils.cache import CacheBackend, InMemoryCacheBackend
+from utils.mysqldb import get_database
+
+
+# 월별 비트맵 유지 시간(초). 공유 CacheBackend 를 쓰지 않으면 다른 파드나 같은 파드의 다른 워커 프로세스에서
+# 발생한 변경은 최대 이 시간만큼 늦게 반영됨
+SPACE_AVAILABILITY_CACHE_TTL = float(os.getenv('SPACE_AVAILABILITY_CACHE_TTL', '60'))
+SPACE_AVAILABILITY_CACHE_MAX_ENTRIES = int(os.getenv('SPACE_AVAILABILITY_CACHE_MAX_ENTRIES', '10000'))
+
+HOURS_PER_DAY = 24
+FULL_DAY = (1 << HOURS_PER_DAY) - 1
+# 하루 24시간 비트맵을 3바이트로 저장
+_BYTES_PER_DAY = 3
+
+
+def month_start_of(value: date) -> date:
+    return value.replace(day=1)
+
+
+def next_month(month: date) -> date:
+    return (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def months_of(slot: ReservationSlot) -> List[date]:
+    """
+    슬롯이 걸쳐 있는 달(1일) 목록
+    """
+    months = []
+    month = month_start_of(slot.range_start.date())
+    last_day = (slot.range_end - timedelta(microseconds=1)).date()
+    while month <= last_day:
+        months.append(month)
+        month = next_month(month)
+    return months
+
+
+def mark_slot(bitmaps: List[int], month: date, slot: ReservationSlot) -> None:
+    """
+    슬롯이 조금이라도 걸친 시간대의 비트를 켬 (bit h = h시~h+1시)
+    """
+    month_start = datetime.combine(month, datetime.min.time())
+    range_start = max(slot.range_start, month_start)
+    range_end = min(slot.range_end, datetime.combine(next_month(month), datetime.min.time()))
+
+    hour = range_start.replace(minute=0, second=0, microsecond=0)
+    while hour < range_end:
+        day_index = (hour - month_start).days
+        if hour.hour == 0 and hour + timedelta(days=1) <= range_end:
+            bitmaps[day_index] = FULL_DAY
+            hour += timedelta(days=1)
+            continue
+        bitmaps[day_index] |= 1 << hour.hour
+        hour += timedelta(hours=1)
+
+
+def _pack(bitmaps: List[int]) -> bytes:
+    return b"".join(bitmap.to_bytes(_BYTES_PER_DAY, "little") for bitmap in bitmaps)
+
+
+def _unpack(packed: bytes) -> List[int]:
+    return [
+        int.from_bytes(packed[index:index + _BYTES_PER_DAY], "little")
+        for index in range(0, len(packed), _BYTES_PER_DAY)
+    ]
+
+
+class SpaceAvailabilityCache:
+    """
+    공간별/월별 시간대 점유 비트맵 캐시
+    - 값: 그 달의 일수만큼 하루 24비트(3바이트) 비트맵을 이어 붙인 bytes
+    - 캐시가 없을 때만 PENDING/COMPLETED 예약으로 한 달치를 만들고, 이후 조회는 DB를 읽지 않음
+    - 예약 생성은 캐시된 비트맵에 비트를 켜서 바로 반영
+    - 예약 해제(FAILED/CANCELED)는 같은 시간대의 다른 예약 여부를 알 수 없으므로 해당 달을 무효화
+    - 공간별 변경 횟수를 기록해, 만드는 도중 변경이 생긴 비트맵은 저장하지 않음
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SpaceAvailabilityCache, cls).__new__(cls)
+
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+
+        self._backend: CacheBackend = InMemoryCacheBackend(SPACE_AVAILABILITY_CACHE_MAX_ENTRIES)
+        self._ttl = SPACE_AVAILABILITY_CACHE_TTL
+        self._versions: Dict[str, int] = {}
+        self._initialized = True
+
+    def set_backend(self, backend: CacheBackend) -> None:
+        self._backend = backend
+
+    async def get_month(self, space_id: str, month: date) -> List[int]:
+        """
+        month(1일) 한 달의 일별 점유 비트맵
+        """
+        packed = await self._backend.get(self._key(space_id, month))
+        if packed is not None:
+            return _unpack(packed)
+
+        version = self._versions.get(space_id, 0)
+        bitmaps = await self._build(space_id, month)
+        if self._versions.get(space_id, 0) == version:
+            await self._backend.set(self._key(space_id, month), _pack(bitmaps), self._ttl)
+        return bitmaps
+
+    async def add_slots(self, space_id: str, slots: Iterable[ReservationSlot]) -> None:
+        """
+        예약 생성 커밋 이후 호출
+        """
+        self._bump_version(space_id)
+        for slot in slots:
+            for month in months_of(slot):
+                key = self._key(space_id, month)
+                packed = await self._backend.get(key)
+                if packed is None:
+                    continue
+                bitmaps = _unpack(packed)
+                mark_slot(bitmaps, month, slot)
+                await self._backend.set(key, _pack(bitmaps), self._ttl)
+
+    async def release_slots(self, released: Iterable[Tuple[str, ReservationSlot]]) -> None:
+        """
+        예약 해제 커밋 이후 호출: (space_id, 슬롯) 이 걸친 달을 무효화
+        """
+        invalidated: Set[Tuple[str, date]] = set()
+        for space_id, slot in released:
+            self._bump_version(space_id)
+            for month in months_of(slot):
+                if (space_id, month) not in invalidated:
+                    invalidated.add((space_id, month))
+                    await self._backend.delete(self._key(space_id, month))
+
+    def _bump_version(self, space_id: str) -> None:
+        if len(self._versions) > SPACE_AVAILABILITY_CACHE_MAX_ENTRIES:
+            # 진행 중인 비트맵 생성이 있으면 저장되지 않을 뿐이므로 초기화해도 안전
+            self._versions = {}
+        self._versions[space_id] = self._versions.get(space_id, 0) + 1
+
+    async def _build(self, space_id: str, month: date) -> List[int]:
+        month_start = datetime.combine(month, datetime.min.time())
+        month_end = datetime.combine(next_month(month), datetime.min.time())
+        # 방금 커밋된 예약이 빠지지 않도록 primary 에서 조회 (TTL 당 공간/월별 1회)
+        async with get_database().session() as session:
+            rows = (await session.execute(
+                select(Reservation.use_date, Reservation.start_time, Reservation.end_time)
+                .where(
+                    Reservation.space_id == space_id,
+                    Reservation.r_status.in_(ACTIVE_STATUSES),
+                    or_(
+                        and_(Reservation.start_time < month_end, Reservation.end_time > month_start),
+                        and_(
+                            Reservation.use_date > month_start - timedelta(days=1),
+                            Reservation.use_date < month_end
+                        )
+                    )
+                )
+            )).all()
+
+        bitmaps = [0] * (month_end - month_start).days
+        for use_date, start_time, end_time in rows:
+            if use_date is None and (start_time is None or end_time is None):
+                continue
+            mark_slot(bitmaps, month, ReservationSlot(use_date=use_date, start_time=start_time, end_time=end_time))
+        return bitmaps
+
+    @staticmethod
+    def _key(space_id: str, month: date) -> str:
+        return f"availability:{space_id}:{month:%Y-%m}"
+
+
+def get_space_availability_cache() -> SpaceAvailabilityCache:
+    return SpaceAvailabilityCache()
@@ -0,0 +1,82 @@
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.cache import CacheBackend
+
+
+class FakeResult:
+    def __init__(self, rows: Optional[List[Any]] = None, rowcount: int = 0, scalar: Any = None, lastrowid: int = 0):
+        self._rows = rows or []
+        self.rowcount = rowcount
+        self.lastrowid = lastrowid
+        self._scalar = scalar
+
+    def all(self) -> List[Any]:
+        return list(self._rows)
+
+    def first(self) -> Any:
+        return self._rows[0] if self._rows else None
+
+    def scalar(self) -> Any:
+        return self._scalar
+
+    def scalars(self) -> "FakeResult":
+        return FakeResult(self._rows)
+
+
+class FakeSession:
+    """
+    실행한 문장을 기록하고 미리 정한 결과를 순서대로 돌려주는 AsyncSession 대역
+    - results 항목이 예외면 해당 실행에서 발생시킴, 결과가 바닥나면 빈 FakeResult
+    """
+
+    def __init__(self, results: Optional[List[Any]] = None):
+        self.results = list(results or [])
+        self.executed: List[tuple] = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, statement, params=None):
+        self.executed.append((str(statement), params))
+        result = self.results.pop(0) if self.results else FakeResult()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+    def statements(self) -> List[str]:
+        return [statement for statement, _ in self.executed]
+
+
+def session_factory(session: FakeSession) -> Callable:
+    """
+    MySQLDatabase.session 대체용: 별도 세션을 여는 코드가 주어진 FakeSession 을 사용하도록 함
+    """
+    @asynccontextmanager
+    async def _session(self):
+        yield session
+
+    return _session
+
+
+class SharedCacheBackend(CacheBackend):
+    """
+    여러 워커가 함께 쓰는 공유 캐시 저장소 대용 (TTL 무시)
+    """
+
+    def __init__(self):
+        self.entries: Dict[str, bytes] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.entries.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.entries[key] = value
+
+    async def delete(self, key: str) -> None:
+        self.entries.pop(key, None)
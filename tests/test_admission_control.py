@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from enums.request_priority import RequestPriority
+from services import admission_control
+from services.admission_control import AdmissionController
+from utils.mysqldb import MySQLDatabase
+from utils.type.pool_status_type import PoolStatus
+
+
+IDLE = PoolStatus(checked_out=0, capacity=10, recent_wait_seconds=0.0)
+BUSY = PoolStatus(checked_out=9, capacity=10, recent_wait_seconds=0.0)
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    statuses = {"primary": IDLE, "reader": None}
+    monkeypatch.setattr(MySQLDatabase, "pool_status", lambda self: statuses["primary"])
+    monkeypatch.setattr(MySQLDatabase, "reader_pool_status", lambda self: statuses["reader"])
+    return statuses
+
+
+@pytest.fixture
+def rate_limited(monkeypatch, pools):
+    # 파드 기준 초당 2건, 최대 2건을 워커 2개로 나누면 워커당 1건
+    monkeypatch.setattr(admission_control, "RATE_LIMIT_PER_SECOND", 2.0)
+    monkeypatch.setattr(admission_control, "RATE_LIMIT_BURST", 2.0)
+    monkeypatch.setattr(admission_control, "get_worker_config", lambda: SimpleNamespace(workers=2))
+    monkeypatch.setattr(AdmissionController, "_instance", None)
+    return AdmissionController()
+
+
+def test_rate_limit_is_split_across_workers(rate_limited):
+    rate_limited.admit("user-1", RequestPriority.NORMAL)
+
+    with pytest.raises(HTTPException) as error:
+        rate_limited.admit("user-1", RequestPriority.NORMAL)
+
+    assert error.value.status_code == 429
+
+
+def test_payment_callbacks_are_not_rate_limited(rate_limited):
+    for _ in range(5):
+        rate_limited.admit("payment-callback", RequestPriority.CRITICAL)
+
+
+def test_low_read_is_shed_on_reader_pool(pools):
+    pools["reader"] = BUSY
+    controller = AdmissionController()
+
+    controller.admit("user-1", RequestPriority.LOW)
+    with pytest.raises(HTTPException) as error:
+        controller.admit("user-1", RequestPriority.LOW, reader=True)
+
+    assert error.value.status_code == 503
+
+
+def test_critical_is_never_shed(pools):
+    pools["primary"] = BUSY
+    pools["reader"] = BUSY
+
+    AdmissionController().admit("user-1", RequestPriority.CRITICAL, reader=True)
@@ -0,0 +1,90 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from schemas.reservation import ReservationRequest
+from services.idempotency import IdempotencyStore, request_fingerprint
+from tests.fakes import FakeResult, FakeSession, session_factory
+from utils.cache import InMemoryCacheBackend
+from utils.mysqldb import MySQLDatabase
+
+
+pytestmark = pytest.mark.anyio
+
+READY_BODY = {
+    "space_id": "space-1",
+    "space_name": "테스트 공간",
+    "user_name": "테스트",
+    "start_time": "2026-11-10T10:00:00",
+    "end_time": "2026-11-10T11:00:00",
+}
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = IdempotencyStore()
+    monkeypatch.setattr(store, "_backend", InMemoryCacheBackend())
+    return store
+
+
+async def test_remembered_key_replays_without_database(monkeypatch, store):
+    database_session = FakeSession()
+    monkeypatch.setattr(MySQLDatabase, "session", session_factory(database_session))
+    request_hash = request_fingerprint(ReservationRequest(**READY_BODY))
+
+    await store.remember("user-1", "key-1", request_hash, "202611100000000001")
+
+    assert await store.lookup("user-1", "key-1", request_hash) == "202611100000000001"
+    assert database_session.executed == []
+
+
+async def test_stored_key_is_loaded_from_database(monkeypatch, store):
+    row = SimpleNamespace(request_hash="hash-1", order_number="202611100000000001")
+    monkeypatch.setattr(MySQLDatabase, "session", session_factory(FakeSession([FakeResult([row])])))
+
+    assert await store.lookup("user-1", "key-1", "hash-1") == "202611100000000001"
+    # 이후 조회는 메모리에서 응답
+    monkeypatch.setattr(MySQLDatabase, "session", session_factory(FakeSession([AssertionError("DB 조회")])))
+    assert await store.lookup("user-1", "key-1", "hash-1") == "202611100000000001"
+
+
+async def test_unknown_key_returns_none(monkeypatch, store):
+    monkeypatch.setattr(MySQLDatabase, "session", session_factory(FakeSession([FakeResult()])))
+
+    assert await store.lookup("user-1", "key-1", "hash-1") is None
+
+
+async def test_reused_key_with_different_body_is_rejected(store):
+    await store.remember("user-1", "key-1", "hash-1", "202611100000000001")
+
+    with pytest.raises(HTTPException) as error:
+        await store.lookup("user-1", "key-1", "hash-2")
+
+    assert error.value.status_code == 422
+
+
+async def test_ready_replays_original_order_number(api_client, request_session, store):
+    api_client.user_id = "user-1"
+    request_hash = request_fingerprint(ReservationRequest(**READY_BODY))
+    await store.remember("user-1", "key-1", request_hash, "202611100000000001")
+
+    response = await api_client.post(
+        "/api/v1/reservations/kakao/ready", json=READY_BODY, headers={"Idempotency-Key": "key-1"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"order_number": "202611100000000001"}
+    # 재시도는 예약 잠금/INSERT 없이 최초 응답을 반환
+    assert request_session.executed == []
+
+
+async def test_prune_expired_deletes_one_batch_by_created_at():
+    session = FakeSession([FakeResult(rowcount=3)])
+
+    assert await IdempotencyStore.prune_expired(session, 100) == 3
+
+    statement, params = session.executed[0]
+    assert statement.startswith("DELETE FROM idempotency_key")
+    assert "ORDER BY created_at LIMIT" in statement
+    assert params["batch_size"] == 100
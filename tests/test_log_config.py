@@ -0,0 +1,9 @@
+from utils.log_config import LogConfig
+
+
+def test_malformed_route_sample_rates_are_skipped():
+    rates = LogConfig._parse_route_sample_rates(
+        "GET /api/v1/reservations=0.1,/no-method=0.5,PATCH /api/v1/reservations/kakao/approve=abc,no-equals"
+    )
+
+    assert rates == {"GET /api/v1/reservations": 0.1}
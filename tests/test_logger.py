@@ -0,0 +1,22 @@
+import logging
+import queue
+
+from prometheus_client import REGISTRY
+
+from utils.logger import DroppingQueueHandler
+
+
+def _dropped_metric() -> float:
+    return REGISTRY.get_sample_value("reservation_log_records_dropped_total")
+
+
+def test_full_queue_drops_and_counts_records():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+    dropped_before = _dropped_metric()
+
+    for index in range(5):
+        handler.handle(logging.makeLogRecord({"msg": f"log {index}", "levelno": logging.INFO}))
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
+    assert _dropped_metric() - dropped_before == 3
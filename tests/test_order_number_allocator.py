@@ -0,0 +1,52 @@
+import pytest
+
+from services import pending_sweeper
+from services.order_number_allocator import OrderNumberAllocator
+from services.pending_sweeper import PendingReservationSweeper
+from tests.fakes import FakeResult, FakeSession, session_factory
+from utils.mysqldb import MySQLDatabase
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def allocator(monkeypatch):
+    monkeypatch.setenv("ORDER_NUMBER_BLOCK_SIZE", "20")
+    monkeypatch.setattr(OrderNumberAllocator, "_instance", None)
+    return OrderNumberAllocator()
+
+
+async def test_allocation_only_reserves_a_counter_block(monkeypatch, allocator):
+    session = FakeSession([FakeResult(lastrowid=20)])
+    monkeypatch.setattr(MySQLDatabase, "session", session_factory(session))
+
+    first = await allocator.allocate(2)
+
+    assert [order_number[-4:] for order_number in first] == ["0000", "0001"]
+    assert len(session.executed) == 1
+    assert session.statements()[0].startswith("INSERT INTO order_number_counter")
+
+
+async def test_prune_past_counters_deletes_one_batch_before_today():
+    session = FakeSession([FakeResult(rowcount=5)])
+
+    assert await OrderNumberAllocator.prune_past_counters(session, 100) == 5
+
+    statement, params = session.executed[0]
+    assert statement.startswith("DELETE FROM order_number_counter WHERE order_prefix < :day_start")
+    assert params["day_start"].endswith("000000")
+    assert params["batch_size"] == 100
+
+
+async def test_sweeper_prunes_counters_without_ttls(monkeypatch):
+    monkeypatch.setattr(pending_sweeper, "PENDING_RESERVATION_TTL", 0)
+    monkeypatch.setattr(pending_sweeper, "IDEMPOTENCY_KEY_TTL", 0)
+    session = FakeSession([FakeResult(scalar=1), FakeResult(rowcount=0), FakeResult()])
+    monkeypatch.setattr(MySQLDatabase, "session", session_factory(session))
+
+    assert await PendingReservationSweeper().sweep_once() == 0
+
+    statements = session.statements()
+    assert statements[1].startswith("DELETE FROM order_number_counter")
+    assert "RELEASE_LOCK" in statements[2]
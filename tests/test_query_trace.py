@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from utils import query_trace
+from utils.query_trace import QueryTraceMiddleware, RequestQueryTrace, fingerprint_statement, instrument_query_tracing
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def traced_engine():
+    engine = create_engine("sqlite://")
+    instrument_query_tracing(SimpleNamespace(sync_engine=engine))
+    yield engine
+    engine.dispose()
+
+
+def test_fingerprint_ignores_literals_and_parameter_counts():
+    first = fingerprint_statement("SELECT * FROM reservation WHERE id IN (%s, %s) AND user_id = 'a'")
+    second = fingerprint_statement("SELECT  *  FROM reservation WHERE id IN (%s, %s, %s) AND user_id = 'bb'")
+
+    assert first == second
+    assert first[1] == "SELECT * FROM reservation WHERE id IN (?+) AND user_id = ?"
+
+
+def test_failed_statement_leaves_no_state_on_connection(traced_engine):
+    request_trace = RequestQueryTrace()
+    token = query_trace._current_trace.set(request_trace)
+    try:
+        with traced_engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing_table"))
+            connection.execute(text("SELECT 1"))
+
+            assert "query_started_at" not in connection.connection.info
+    finally:
+        query_trace._current_trace.reset(token)
+
+    assert request_trace.query_count == 1
+
+
+async def test_server_timing_header_counts_request_queries(traced_engine):
+    def _endpoint(request):
+        with traced_engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+        return PlainTextResponse("ok")
+
+    app = QueryTraceMiddleware(Starlette(routes=[Route("/", _endpoint)]))
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/")
+
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert response.headers["server-timing"].endswith('desc="2 queries"')
@@ -0,0 +1,122 @@
+import asyncio
+import uuid
+from datetime import date, datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.exc import OperationalError
+
+from services import reservation_conflict
+from services.reservation_conflict import ReservationSlot, lock_and_check_conflicts, parse_reservation_slot
+from tests.fakes import FakeResult, FakeSession
+from utils.mysqldb import MySQLDatabase
+
+
+pytestmark = pytest.mark.anyio
+
+
+def _slot(start: str, end: str) -> ReservationSlot:
+    return ReservationSlot(start_time=datetime.fromisoformat(start), end_time=datetime.fromisoformat(end))
+
+
+def _deadlock() -> OperationalError:
+    return OperationalError("INSERT INTO reservation_lock", {}, Exception(1213, "Deadlock found when trying to get lock"))
+
+
+@pytest.fixture
+def no_nested_session(monkeypatch):
+    # 잠금 행은 요청 세션에서 만들어야 하므로 다른 커넥션을 꺼내면 실패
+    def _nested_session(self):
+        raise AssertionError("요청 세션 외의 커넥션을 사용했습니다.")
+
+    monkeypatch.setattr(MySQLDatabase, "session", _nested_session)
+
+
+async def test_lock_rows_are_upserted_first_on_request_session(no_nested_session, fake_session):
+    slots = [
+        _slot("2026-11-11T10:00:00", "2026-11-11T11:00:00"),
+        _slot("2026-11-10T23:00:00", "2026-11-11T01:00:00"),
+    ]
+
+    await lock_and_check_conflicts(fake_session, "space-1", slots)
+
+    lock_statement, lock_params = fake_session.executed[0]
+    assert lock_statement.startswith("INSERT INTO reservation_lock")
+    assert "ON DUPLICATE KEY UPDATE" in lock_statement
+    assert [row["lock_date"] for row in lock_params] == [date(2026, 11, 10), date(2026, 11, 11)]
+    assert "FROM reservation" in fake_session.statements()[1]
+    assert len(fake_session.executed) == 2
+
+
+async def test_overlapping_reservation_is_rejected(no_nested_session):
+    session = FakeSession([FakeResult(), FakeResult(scalar=1)])
+
+    with pytest.raises(HTTPException) as error:
+        await lock_and_check_conflicts(session, "space-1", [_slot("2026-11-10T10:00:00", "2026-11-10T11:00:00")])
+
+    assert error.value.status_code == 409
+
+
+async def test_deadlock_on_lock_rows_is_retried(no_nested_session):
+    session = FakeSession([_deadlock(), FakeResult(), FakeResult()])
+
+    await lock_and_check_conflicts(session, "space-1", [_slot("2026-11-10T10:00:00", "2026-11-10T11:00:00")])
+
+    assert session.rollbacks == 1
+    assert [statement.startswith("INSERT INTO reservation_lock") for statement in session.statements()] == [True, True, False]
+
+
+async def test_deadlock_retries_are_bounded(no_nested_session):
+    session = FakeSession([_deadlock() for _ in range(reservation_conflict.LOCK_DEADLOCK_RETRIES + 1)])
+
+    with pytest.raises(OperationalError):
+        await lock_and_check_conflicts(session, "space-1", [_slot("2026-11-10T10:00:00", "2026-11-10T11:00:00")])
+
+    assert session.rollbacks == reservation_conflict.LOCK_DEADLOCK_RETRIES
+
+
+async def test_two_reservations_on_fresh_date(mysql_database, api_client):
+    space_id = f"test-space-{uuid.uuid4()}"
+
+    def ready(start_time: str, end_time: str):
+        return api_client.post(
+            "/api/v1/reservations/kakao/ready",
+            json={
+                "space_id": space_id,
+                "space_name": "테스트 공간",
+                "user_name": "테스트",
+                "start_time": start_time,
+                "end_time": end_time,
+            },
+        )
+
+    # 처음 예약되는 날짜: 순차 요청과 동시 요청 모두 잠금 행을 만들며 성공해야 함
+    first = await ready("2030-01-10T10:00:00", "2030-01-10T11:00:00")
+    second = await ready("2030-01-10T11:00:00", "2030-01-10T12:00:00")
+    assert (first.status_code, second.status_code) == (200, 200)
+
+    concurrent = await asyncio.gather(
+        ready("2030-01-11T10:00:00", "2030-01-11T11:00:00"),
+        ready("2030-01-11T12:00:00", "2030-01-11T13:00:00"),
+    )
+    assert [response.status_code for response in concurrent] == [200, 200]
+
+    overlapping = await ready("2030-01-10T10:30:00", "2030-01-10T11:30:00")
+    assert overlapping.status_code == 409
+
+
+@pytest.mark.parametrize(
+    "use_date",
+    ["2026-11-10", "20261110", "2026/11/10", "2026.11.10", "2026-11-10T00:00:00", "2026-11-10 09:30:00"],
+)
+def test_legacy_use_date_formats_are_accepted(use_date):
+    slot = parse_reservation_slot(use_date, "", "")
+
+    assert slot.use_date == datetime(2026, 11, 10)
+
+
+def test_unparseable_use_date_is_400():
+    with pytest.raises(HTTPException) as error:
+        parse_reservation_slot("next tuesday", "", "")
+
+    assert error.value.status_code == 400
@@ -0,0 +1,54 @@
+import pytest
+
+from routers import reservation as reservation_router_module
+from services.reservation_export import ReservationExportFilter, build_export_statement
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def export_filters(monkeypatch):
+    filters = []
+
+    async def _stream(export_filter, export_format):
+        filters.append(export_filter)
+        yield b""
+
+    monkeypatch.setattr(reservation_router_module, "stream_reservations", _stream)
+    return filters
+
+
+async def test_export_of_another_user_is_forbidden(api_client, export_filters):
+    api_client.user_id = "user-1"
+
+    response = await api_client.get("/api/v1/reservations/export", params={"user_id": "user-2"})
+
+    assert response.status_code == 403
+    assert export_filters == []
+
+
+async def test_space_export_is_limited_to_caller(api_client, export_filters):
+    api_client.user_id = "user-1"
+
+    response = await api_client.get("/api/v1/reservations/export", params={"space_id": "space-1"})
+
+    assert response.status_code == 200
+    assert export_filters == [ReservationExportFilter(user_id="user-1", space_id="space-1")]
+
+
+async def test_export_defaults_to_caller(api_client, export_filters):
+    api_client.user_id = "user-1"
+
+    response = await api_client.get("/api/v1/reservations/export", params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert export_filters == [ReservationExportFilter(user_id="user-1")]
+
+
+def test_export_statement_filters_by_user():
+    statement = build_export_statement(ReservationExportFilter(user_id="user-1", space_id="space-1"))
+
+    compiled = statement.compile()
+    assert "reservation.user_id = :user_id_1" in str(compiled)
+    assert compiled.params["user_id_1"] == "user-1"
@@ -0,0 +1,57 @@
+from datetime import date, datetime
+
+import pytest
+
+from services.reservation_conflict import ReservationSlot
+from services.reservation_list_cache import ReservationListCache
+from services.space_availability import SpaceAvailabilityCache
+from tests.fakes import SharedCacheBackend
+
+
+pytestmark = pytest.mark.anyio
+
+
+def _worker_instance(monkeypatch, cache_class, backend):
+    # 워커 프로세스마다 싱글턴이 따로 만들어지는 상황
+    monkeypatch.setattr(cache_class, "_instance", None)
+    cache = cache_class()
+    cache.set_backend(backend)
+    return cache
+
+
+async def test_list_invalidation_reaches_other_worker(monkeypatch):
+    backend = SharedCacheBackend()
+    worker_a = _worker_instance(monkeypatch, ReservationListCache, backend)
+    worker_b = _worker_instance(monkeypatch, ReservationListCache, backend)
+
+    _, generation = await worker_b.get("user-1", "first-page")
+    await worker_b.set("user-1", generation, "first-page", b"PENDING")
+    assert (await worker_a.get("user-1", "first-page"))[0] == b"PENDING"
+
+    await worker_a.invalidate("user-1")
+
+    assert (await worker_b.get("user-1", "first-page"))[0] is None
+
+
+async def test_availability_release_reaches_other_worker(monkeypatch):
+    backend = SharedCacheBackend()
+    worker_a = _worker_instance(monkeypatch, SpaceAvailabilityCache, backend)
+    worker_b = _worker_instance(monkeypatch, SpaceAvailabilityCache, backend)
+    month = date(2026, 11, 1)
+    slot = ReservationSlot(start_time=datetime(2026, 11, 10, 10), end_time=datetime(2026, 11, 10, 11))
+    builds = []
+
+    async def _build(self, space_id, month):
+        builds.append(self)
+        return [0] * 30
+
+    monkeypatch.setattr(SpaceAvailabilityCache, "_build", _build)
+
+    await worker_b.get_month("space-1", month)
+    await worker_a.add_slots("space-1", [slot])
+    assert (await worker_b.get_month("space-1", month))[9] == 1 << 10
+
+    await worker_a.release_slots([("space-1", slot)])
+
+    assert (await worker_b.get_month("space-1", month))[9] == 0
+    assert builds == [worker_b, worker_b]
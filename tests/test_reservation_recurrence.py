@@ -0,0 +1,90 @@
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from schemas.reservation import RESERVATION_SLOT_LIMIT, ReservationRequest
+from services.reservation_recurrence import expand_reservation_slots
+
+
+def _request(**values) -> ReservationRequest:
+    return ReservationRequest(space_id="space-1", space_name="테스트 공간", user_name="테스트", **values)
+
+
+def test_single_slot_without_recurrence():
+    slots = expand_reservation_slots(_request(start_time="2026-11-10T10:00:00", end_time="2026-11-10T11:00:00"))
+
+    assert [(slot.start_time, slot.end_time) for slot in slots] == [
+        (datetime(2026, 11, 10, 10), datetime(2026, 11, 10, 11))
+    ]
+
+
+def test_weekly_recurrence_by_count():
+    slots = expand_reservation_slots(_request(
+        start_time="2026-11-10T10:00:00",
+        end_time="2026-11-10T11:00:00",
+        recurrence={"frequency": "WEEKLY", "count": 3},
+    ))
+
+    assert [slot.start_time for slot in slots] == [
+        datetime(2026, 11, 10, 10), datetime(2026, 11, 17, 10), datetime(2026, 11, 24, 10)
+    ]
+
+
+def test_daily_recurrence_until_is_inclusive_for_every_slot():
+    slots = expand_reservation_slots(_request(
+        slots=[{"use_date": "2026-11-11"}, {"use_date": "2026-11-10"}],
+        recurrence={"frequency": "DAILY", "interval": 2, "until": "2026-11-13"},
+    ))
+
+    # 시작 시각 순으로 정렬되고, until 이후 슬롯은 빠짐
+    assert [slot.use_date.day for slot in slots] == [10, 11, 12, 13]
+
+
+def test_until_before_first_slot_is_rejected():
+    with pytest.raises(HTTPException) as error:
+        expand_reservation_slots(_request(
+            start_time="2026-11-10T10:00:00",
+            end_time="2026-11-10T11:00:00",
+            recurrence={"frequency": "WEEKLY", "until": "2026-11-01"},
+        ))
+
+    assert error.value.status_code == 400
+
+
+def test_expansion_over_limit_is_rejected():
+    with pytest.raises(HTTPException) as error:
+        expand_reservation_slots(_request(
+            slots=[{"use_date": "2026-11-10"}, {"use_date": "2026-11-11"}],
+            recurrence={"frequency": "WEEKLY", "count": RESERVATION_SLOT_LIMIT},
+        ))
+
+    assert error.value.status_code == 400
+
+
+def test_overlapping_occurrences_are_rejected():
+    with pytest.raises(HTTPException) as error:
+        expand_reservation_slots(_request(
+            slots=[{"use_date": "2026-11-10"}, {"use_date": "2026-11-11"}],
+            recurrence={"frequency": "DAILY", "count": 2},
+        ))
+
+    assert error.value.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_ready_with_empty_recurrence_returns_400(api_client, request_session):
+    response = await api_client.post(
+        "/api/v1/reservations/kakao/ready",
+        json={
+            "space_id": "space-1",
+            "space_name": "테스트 공간",
+            "user_name": "테스트",
+            "start_time": "2026-11-10T10:00:00",
+            "end_time": "2026-11-10T11:00:00",
+            "recurrence": {"frequency": "WEEKLY", "until": "2026-11-01"},
+        },
+    )
+
+    assert response.status_code == 400
+    assert request_session.executed == []
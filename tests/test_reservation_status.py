@@ -0,0 +1,189 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from enums.reservation_type import ReservationStatus
+from schemas.reservation import BulkStatusUpdateOutcome
+from services.reservation_list_cache import ReservationListCache
+from services.reservation_status import bulk_transition_status, transition_status
+from tests.fakes import FakeResult, FakeSession
+
+
+pytestmark = pytest.mark.anyio
+
+ORDER_NUMBER = "202611100000000001"
+
+
+def _reservation(user_id: str, r_status: ReservationStatus, **values) -> SimpleNamespace:
+    row = {
+        "id": 1,
+        "order_number": ORDER_NUMBER,
+        "group_order_number": None,
+        "r_status": r_status,
+        "user_id": user_id,
+        "space_id": "space-1",
+        "use_date": None,
+        "start_time": datetime(2026, 11, 10, 10),
+        "end_time": datetime(2026, 11, 10, 11),
+    }
+    row.update(values)
+    return SimpleNamespace(**row)
+
+
+def _rollup_rows(session: FakeSession):
+    statement, params = session.executed[-1]
+    assert statement.startswith("INSERT INTO reservation_daily_rollup")
+    return [(row["r_status"], row["reservation_count"], row["booked_minutes"]) for row in params]
+
+
+async def test_transition_updates_first_then_reads_changed_rows():
+    session = FakeSession([
+        FakeResult(rowcount=1),
+        FakeResult([_reservation("owner-1", ReservationStatus.COMPLETED)]),
+    ])
+
+    user_ids, changed = await transition_status(session, ORDER_NUMBER, ReservationStatus.COMPLETED)
+
+    statements = session.statements()
+    assert statements[0].startswith("UPDATE reservation SET r_status")
+    assert "FOR UPDATE" not in statements[1]
+    assert _rollup_rows(session) == [("COMPLETED", 1, 60), ("PENDING", -1, -60)]
+    assert len(statements) == 3
+    assert user_ids == {"owner-1"}
+    assert [space_id for space_id, _ in changed] == ["space-1"]
+
+
+async def test_repeated_callback_changes_nothing():
+    session = FakeSession([FakeResult(rowcount=0), FakeResult([_reservation("owner-1", ReservationStatus.COMPLETED)])])
+
+    assert await transition_status(session, ORDER_NUMBER, ReservationStatus.COMPLETED) == (set(), [])
+    assert len(session.executed) == 2
+
+
+async def test_unknown_order_number_is_404():
+    session = FakeSession([FakeResult(rowcount=0), FakeResult()])
+
+    with pytest.raises(HTTPException) as error:
+        await transition_status(session, ORDER_NUMBER, ReservationStatus.COMPLETED)
+
+    assert error.value.status_code == 404
+
+
+async def test_invalid_transition_is_409():
+    session = FakeSession([FakeResult(rowcount=0), FakeResult([_reservation("owner-1", ReservationStatus.FAILED)])])
+
+    with pytest.raises(HTTPException) as error:
+        await transition_status(session, ORDER_NUMBER, ReservationStatus.COMPLETED)
+
+    assert error.value.status_code == 409
+
+
+async def test_partially_completed_group_falls_back_to_locked_path():
+    group = {"group_order_number": ORDER_NUMBER}
+    already_completed = _reservation("owner-1", ReservationStatus.COMPLETED, id=1, **group)
+    session = FakeSession([
+        FakeResult(rowcount=1),
+        # UPDATE 이후에는 두 행 모두 COMPLETED 라 어느 행이 바뀌었는지 알 수 없음
+        FakeResult([already_completed, _reservation("owner-1", ReservationStatus.COMPLETED, id=2, **group)]),
+        # 롤백 후 잠금 조회: 실제 이전 상태
+        FakeResult([already_completed, _reservation("owner-1", ReservationStatus.PENDING, id=2, **group)]),
+        FakeResult(rowcount=1),
+    ])
+
+    user_ids, changed = await transition_status(session, ORDER_NUMBER, ReservationStatus.COMPLETED)
+
+    assert session.rollbacks == 1
+    assert "FOR UPDATE" in session.statements()[2]
+    assert _rollup_rows(session) == [("COMPLETED", 1, 60), ("PENDING", -1, -60)]
+    assert len(changed) == 1
+
+
+async def test_bulk_transition_classifies_each_order():
+    session = FakeSession([
+        FakeResult([
+            _reservation("owner-1", ReservationStatus.PENDING, id=1, order_number="A"),
+            _reservation("owner-2", ReservationStatus.COMPLETED, id=2, order_number="B"),
+        ]),
+        FakeResult(rowcount=1),
+    ])
+
+    outcomes, user_ids, changed = await bulk_transition_status(session, ["A", "B", "C"], ReservationStatus.FAILED)
+
+    assert outcomes == {
+        "A": BulkStatusUpdateOutcome.UPDATED,
+        "B": BulkStatusUpdateOutcome.INVALID_TRANSITION,
+        "C": BulkStatusUpdateOutcome.NOT_FOUND,
+    }
+    assert user_ids == {"owner-1"}
+    assert _rollup_rows(session) == [("FAILED", 1, 60), ("PENDING", -1, -60)]
+
+
+@pytest.fixture
+def invalidated(monkeypatch):
+    users = []
+
+    async def _invalidate(self, user_id: str) -> None:
+        users.append(user_id)
+
+    monkeypatch.setattr(ReservationListCache, "invalidate", _invalidate)
+    return users
+
+
+async def test_approve_invalidates_owner_list_cache(api_client, request_session, invalidated):
+    request_session.results = [FakeResult(rowcount=1), FakeResult([_reservation("owner-1", ReservationStatus.COMPLETED)])]
+    api_client.user_id = "payment-callback"
+
+    response = await api_client.patch("/api/v1/reservations/kakao/approve", json={"order_number": ORDER_NUMBER})
+
+    assert response.status_code == 204
+    assert invalidated == ["owner-1"]
+    assert request_session.commits == 1
+
+
+async def test_payment_id_update_invalidates_owner_list_cache(api_client, request_session, invalidated):
+    request_session.results = [FakeResult(rowcount=1), FakeResult(["owner-1"])]
+    api_client.user_id = "payment-callback"
+
+    response = await api_client.patch(
+        "/api/v1/reservations/kakao/ready", json={"order_number": ORDER_NUMBER, "payment_id": 7}
+    )
+
+    assert response.status_code == 204
+    assert invalidated == ["owner-1"]
+
+
+async def test_space_stats_require_ops_user(api_client, monkeypatch):
+    monkeypatch.setenv("RESERVATION_OPS_USER_IDS", "ops-1")
+    api_client.user_id = "user-1"
+
+    response = await api_client.get(
+        "/api/v1/reservations/spaces/space-1/stats", params={"date_from": "2026-11-01", "date_to": "2026-11-30"}
+    )
+
+    assert response.status_code == 403
+
+
+async def test_bulk_update_requires_reconciliation_user(api_client, request_session, monkeypatch):
+    monkeypatch.setenv("RESERVATION_RECONCILIATION_USER_IDS", "reconciliation-job")
+    api_client.user_id = "user-1"
+    body = {"status": "COMPLETED", "orders": [{"order_number": ORDER_NUMBER}]}
+
+    response = await api_client.patch("/api/v1/reservations/status/bulk", json=body)
+
+    assert response.status_code == 403
+    assert request_session.executed == []
+
+
+async def test_bulk_update_by_reconciliation_user(api_client, request_session, monkeypatch, invalidated):
+    monkeypatch.setenv("RESERVATION_RECONCILIATION_USER_IDS", "reconciliation-job")
+    request_session.results = [FakeResult([_reservation("owner-1", ReservationStatus.PENDING)]), FakeResult(rowcount=1)]
+    api_client.user_id = "reconciliation-job"
+    body = {"status": "COMPLETED", "orders": [{"order_number": ORDER_NUMBER}]}
+
+    response = await api_client.patch("/api/v1/reservations/status/bulk", json=body)
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [{"order_number": ORDER_NUMBER, "outcome": "updated"}]
+    assert invalidated == ["owner-1"]
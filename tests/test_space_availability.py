@@ -0,0 +1,30 @@
+import pytest
+
+from services.space_availability import SpaceAvailabilityCache
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("month", ["9999-12", "0999-01", "2026-13"])
+async def test_out_of_range_month_is_400(api_client, monkeypatch, month):
+    async def _get_month(self, space_id, month_start):
+        raise AssertionError("캐시/DB 조회")
+
+    monkeypatch.setattr(SpaceAvailabilityCache, "get_month", _get_month)
+
+    response = await api_client.get("/api/v1/reservations/spaces/space-1/availability", params={"month": month})
+
+    assert response.status_code == 400
+
+
+async def test_last_supported_month_is_served(api_client, monkeypatch):
+    async def _get_month(self, space_id, month_start):
+        return [0] * 30
+
+    monkeypatch.setattr(SpaceAvailabilityCache, "get_month", _get_month)
+
+    response = await api_client.get("/api/v1/reservations/spaces/space-1/availability", params={"month": "9999-11"})
+
+    assert response.status_code == 200
+    assert response.json()["month"] == "9999-11"
@@ -0,0 +1,24 @@
+from utils import worker_config
+from utils.worker_config import MIN_POOL_SIZE, WorkerConfig
+
+
+def test_single_worker_by_default(monkeypatch):
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    monkeypatch.setattr(worker_config, "cgroup_cpu_limit", lambda: 4.0)
+
+    assert WorkerConfig._resolve_workers() == 1
+
+
+def test_auto_workers_follow_cpu_limit(monkeypatch):
+    monkeypatch.setenv("WEB_CONCURRENCY", "auto")
+    monkeypatch.setattr(worker_config, "cgroup_cpu_limit", lambda: 2.5)
+
+    assert WorkerConfig._resolve_workers() == 3
+
+
+def test_pool_size_is_not_split_below_floor(monkeypatch):
+    monkeypatch.setenv("RESERVATION_DB_CONNECTION_BUDGET", "8")
+
+    pool_size, max_overflow = WorkerConfig._resolve_pool_limits(4)
+
+    assert (pool_size, max_overflow) == (MIN_POOL_SIZE, 0)
@@ -1,3 +1,5 @@
+import os
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from utils.jwt_handler import verify_jwt_token
@@ -15,3 +17,28 @@ async def userAuthenticate(token: str = Depends(user_oauth2_scheme)):
 
     payload = verify_jwt_token(token)
     return {"user_id": payload["user_id"]}
+
+
+def _allowed_user_ids(env_name: str) -> set:
+    return {user_id.strip() for user_id in os.getenv(env_name, '').split(',') if user_id.strip()}
+
+
+# 공간 단위 조회(통계 등)는 운영 권한 사용자만 가능
+# - 이 서비스에는 공간 소유자 정보가 없으므로 소유자 확인이 생기기 전까지 RESERVATION_OPS_USER_IDS(쉼표 구분)로 제한
+async def opsAuthenticate(token_info=Depends(userAuthenticate)):
+    if token_info["user_id"] not in _allowed_user_ids('RESERVATION_OPS_USER_IDS'):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="공간 통계를 조회할 권한이 없습니다.",
+        )
+    return token_info
+
+
+# 예약 상태 일괄 변경은 결제 대사 작업 계정만 가능 (RESERVATION_RECONCILIATION_USER_IDS, 쉼표 구분)
+async def reconciliationAuthenticate(token_info=Depends(userAuthenticate)):
+    if token_info["user_id"] not in _allowed_user_ids('RESERVATION_RECONCILIATION_USER_IDS'):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="예약 상태를 일괄 변경할 권한이 없습니다.",
+        )
+    return token_info
@@ -0,0 +1,69 @@
+import threading
+from typing import Dict, Iterable
+
+import boto3
+
+from utils.credential import Credential
+from utils.type.aws_credential_type import AWSCredentials
+
+
+class AWSClientRegistry:
+    """
+    boto3 세션/클라이언트를 프로세스당 한 번만 생성해서 공유
+    - 자격 증명은 최초 한 번만 읽음
+    - boto3 client는 thread-safe 하므로 서비스별로 하나씩 재사용
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AWSClientRegistry, cls).__new__(cls)
+
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+
+        self._credentials: AWSCredentials = None
+        self._session: boto3.session.Session = None
+        self._clients: Dict[str, object] = {}
+        self._lock = threading.RLock()
+        self._initialized = True
+
+    @property
+    def credentials(self) -> AWSCredentials:
+        if self._credentials is None:
+            with self._lock:
+                if self._credentials is None:
+                    self._credentials = Credential.get_credentials()
+        return self._credentials
+
+    def get_client(self, service_name: str):
+        client = self._clients.get(service_name)
+        if client is not None:
+            return client
+
+        with self._lock:
+            if service_name not in self._clients:
+                self._clients[service_name] = self._get_session().client(service_name)
+            return self._clients[service_name]
+
+    def warm_up(self, service_names: Iterable[str]) -> None:
+        for service_name in service_names:
+            self.get_client(service_name)
+
+    def _get_session(self) -> boto3.session.Session:
+        if self._session is None:
+            credentials = self.credentials
+            self._session = boto3.session.Session(
+                aws_access_key_id=credentials.access_key,
+                aws_secret_access_key=credentials.secret_key,
+                region_name=credentials.region
+            )
+        return self._session
+
+
+def get_aws_client_registry() -> AWSClientRegistry:
+    return AWSClientRegistry()
@@ -1,37 +1,57 @@
-import boto3
+import threading
+from time import monotonic
+from typing import Dict, List, Optional, Tuple
+
 from fastapi import HTTPException, status
 
-from utils.credential import Credential
+from utils.aws_client_registry import get_aws_client_registry
+from utils.metrics import SSM_PARAMETER_LOOKUPS, SSM_REQUEST_SECONDS, observe_seconds
+
+
+# 파라미터 캐시 유지 시간(초)
+PARAMETER_CACHE_TTL = 300
+# 존재하지 않는 파라미터를 다시 조회하지 않는 시간(초)
+NEGATIVE_CACHE_TTL = 60
+# GetParameters 한 번에 조회 가능한 최대 개수
+GET_PARAMETERS_BATCH_SIZE = 10
 
 
 class ParameterStore:
 
     _instance = None
-    
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(ParameterStore, cls).__new__(cls)
-            
+
         return cls._instance
-    
+
     def __init__(self):
-        credentials = Credential.get_credentials()
-        self._client = boto3.client(
-            'ssm',
-            aws_access_key_id=credentials.access_key,
-            aws_secret_access_key=credentials.secret_key,
-            region_name=credentials.region
-        )
+        if getattr(self, '_initialized', False):
+            return
+
+        self._client = get_aws_client_registry().get_client('ssm')
+        # (key_name, with_decryption) -> (value, 만료 시각). value가 None이면 미존재(negative cache)
+        self._cache: Dict[Tuple[str, bool], Tuple[Optional[str], float]] = {}
+        self._cache_lock = threading.Lock()
+        self._initialized = True
 
     def get_parameter(self, key_name: str, with_decryption: bool = False) -> str:
+        cached = self._get_cached(key_name, with_decryption)
+        if cached is not None:
+            SSM_PARAMETER_LOOKUPS.labels(result="cache_hit").inc()
+            return self._unwrap(key_name, cached)
+
+        SSM_PARAMETER_LOOKUPS.labels(result="fetched").inc()
         try:
-            parameter = self._client.get_parameter(Name=key_name, WithDecryption=with_decryption)
-            return parameter['Parameter']['Value']
+            with observe_seconds(SSM_REQUEST_SECONDS, operation="get_parameter"):
+                parameter = self._client.get_parameter(Name=key_name, WithDecryption=with_decryption)
+            value = parameter['Parameter']['Value']
+            self._set_cached(key_name, with_decryption, value)
+            return value
         except self._client.exceptions.ParameterNotFound:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"{parameter}는 정의되어 있지 않습니다."
-            )
+            self._set_cached(key_name, with_decryption, None)
+            raise self._not_found(key_name)
         except self._client.exceptions.InvalidKeyId:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -42,3 +62,83 @@ class ParameterStore:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"파라미터 조회 중 오류가 발생했습니다.{e}"
             )
+
+    def get_parameters(self, key_names: List[str], with_decryption: bool = False) -> Dict[str, str]:
+        """
+        연관된 파라미터를 GetParameters 한 번으로 조회(캐시에 없는 키만)
+        """
+        values: Dict[str, str] = {}
+        missing: List[str] = []
+        for key_name in key_names:
+            cached = self._get_cached(key_name, with_decryption)
+            if cached is None:
+                missing.append(key_name)
+            else:
+                values[key_name] = self._unwrap(key_name, cached)
+
+        SSM_PARAMETER_LOOKUPS.labels(result="cache_hit").inc(len(key_names) - len(missing))
+        SSM_PARAMETER_LOOKUPS.labels(result="fetched").inc(len(missing))
+
+        for start in range(0, len(missing), GET_PARAMETERS_BATCH_SIZE):
+            batch = missing[start:start + GET_PARAMETERS_BATCH_SIZE]
+            try:
+                with observe_seconds(SSM_REQUEST_SECONDS, operation="get_parameters"):
+                    response = self._client.get_parameters(Names=batch, WithDecryption=with_decryption)
+            except self._client.exceptions.InvalidKeyId:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"복호화에 사용된 KMS 키가 잘못되었습니다."
+                )
+            except Exception as e:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"파라미터 조회 중 오류가 발생했습니다.{e}"
+                )
+
+            for parameter in response.get('Parameters', []):
+                self._set_cached(parameter['Name'], with_decryption, parameter['Value'])
+                values[parameter['Name']] = parameter['Value']
+
+            for key_name in response.get('InvalidParameters', []):
+                self._set_cached(key_name, with_decryption, None)
+
+        for key_name in key_names:
+            if key_name not in values:
+                raise self._not_found(key_name)
+
+        return values
+
+    def invalidate(self, key_name: Optional[str] = None) -> None:
+        with self._cache_lock:
+            if key_name is None:
+                self._cache.clear()
+                return
+            for cache_key in [k for k in self._cache if k[0] == key_name]:
+                del self._cache[cache_key]
+
+    def _get_cached(self, key_name: str, with_decryption: bool) -> Optional[Tuple[Optional[str], float]]:
+        with self._cache_lock:
+            entry = self._cache.get((key_name, with_decryption))
+            if entry is None:
+                return None
+            if entry[1] <= monotonic():
+                del self._cache[(key_name, with_decryption)]
+                return None
+            return entry
+
+    def _set_cached(self, key_name: str, with_decryption: bool, value: Optional[str]) -> None:
+        ttl = PARAMETER_CACHE_TTL if value is not None else NEGATIVE_CACHE_TTL
+        with self._cache_lock:
+            self._cache[(key_name, with_decryption)] = (value, monotonic() + ttl)
+
+    def _unwrap(self, key_name: str, entry: Tuple[Optional[str], float]) -> str:
+        if entry[0] is None:
+            raise self._not_found(key_name)
+        return entry[0]
+
+    @staticmethod
+    def _not_found(key_name: str) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{key_name}는 정의되어 있지 않습니다."
+        )
@@ -0,0 +1,61 @@
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from time import monotonic
+from typing import Optional, Tuple
+
+
+class CacheBackend(ABC):
+    """
+    캐시 저장소 인터페이스
+    - 기본은 프로세스 내 LRU(InMemoryCacheBackend)
+    - 여러 파드/워커 프로세스가 공유하는 저장소(Redis 등)는 이 인터페이스를 구현해서 교체
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    TTL + LRU 프로세스 내 캐시
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,25 @@
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, status
+
+
+# 커서 페이지네이션용 불투명(opaque) 커서: (reservation_date, id)
+# - reservation_date 가 NULL 인 행은 날짜 부분을 비워서 인코딩
+def encode_cursor(reservation_date: Optional[datetime], reservation_id: int) -> str:
+    raw = f"{reservation_date.isoformat() if reservation_date else ''}|{reservation_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        reservation_date, reservation_id = raw.split("|", 1)
+        return datetime.fromisoformat(reservation_date) if reservation_date else None, int(reservation_id)
+    except (ValueError, UnicodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 커서입니다.",
+        )
@@ -1,4 +1,7 @@
 import os
+from typing import Optional
+
+from fastapi import HTTPException, status
 
 from utils.aws_ssm import ParameterStore
 from utils.env_config import get_env_config
@@ -21,8 +24,12 @@ class DatabaseConfig:
     DB 환경에 따른 설정관리
     """
     def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+
         self._env_config = get_env_config()
         self._parameter_store = ParameterStore()
+        self._initialized = True
 
     def create_database(self) -> MySQLDatabase:
         db_config = self.get_db_config()
@@ -34,12 +41,33 @@ class DatabaseConfig:
                 host=os.getenv('RESERVATION_DB_HOST'),
                 dbname=os.getenv('RESERVATION_DB_NAME'),
                 username=os.getenv('RESERVATION_DB_USERNAME'),
-                password=os.getenv('RESERVATION_DB_PASSWORD')
+                password=os.getenv('RESERVATION_DB_PASSWORD'),
+                reader_host=os.getenv('RESERVATION_DB_READER_HOST') or None
             )
         else:
+            # 4개의 파라미터를 GetParameters 한 번으로 조회 (String 타입은 복호화 옵션이 무시됨)
+            parameters = self._parameter_store.get_parameters(
+                [
+                    "RESERVATION_DB_HOST",
+                    "RESERVATION_DB_NAME",
+                    "RESERVATION_DB_USERNAME",
+                    "RESERVATION_DB_PASSWORD",
+                ],
+                with_decryption=True
+            )
             return DBConfig(
-                host=self._parameter_store.get_parameter("RESERVATION_DB_HOST"),
-                dbname=self._parameter_store.get_parameter("RESERVATION_DB_NAME"),
-                username=self._parameter_store.get_parameter("RESERVATION_DB_USERNAME"),
-                password=self._parameter_store.get_parameter("RESERVATION_DB_PASSWORD", True)
-            )
\ No newline at end of file
+                host=parameters["RESERVATION_DB_HOST"],
+                dbname=parameters["RESERVATION_DB_NAME"],
+                username=parameters["RESERVATION_DB_USERNAME"],
+                password=parameters["RESERVATION_DB_PASSWORD"],
+                reader_host=self._get_optional_parameter("RESERVATION_DB_READER_HOST")
+            )
+
+    def _get_optional_parameter(self, key_name: str) -> Optional[str]:
+        # 정의되지 않은 파라미터는 negative cache 되므로 반복 조회 비용이 없음
+        try:
+            return self._parameter_store.get_parameter(key_name) or None
+        except HTTPException as e:
+            if e.status_code == status.HTTP_404_NOT_FOUND:
+                return None
+            raise
\ No newline at end of file
@@ -1,8 +1,10 @@
-from time import time
+from time import perf_counter, time
 from fastapi import HTTPException, status
 from jose import jwt
 
 from services.aws_service import get_aws_service
+from utils.metrics import JWT_VERIFY_SECONDS
+from utils.token_cache import verified_token_cache
 
 # JWT 토큰 생성
 def create_jwt_token(user_id: str) -> str:
@@ -15,15 +17,41 @@ def create_jwt_token(user_id: str) -> str:
 
 # JWT 토큰 검증
 def verify_jwt_token(token: str) -> dict:
-    secret = get_aws_service().get_jwt_secret()
+    # 이미 검증된 토큰이면 SSM 조회와 서명 검증을 생략
+    started_at = perf_counter()
+    cached_payload = verified_token_cache.get(token)
+    if cached_payload is not None:
+        JWT_VERIFY_SECONDS.labels(cache="hit").observe(perf_counter() - started_at)
+        return cached_payload
+
+    try:
+        return _verify_jwt_token(token)
+    finally:
+        JWT_VERIFY_SECONDS.labels(cache="miss").observe(perf_counter() - started_at)
+
+
+def _verify_jwt_token(token: str) -> dict:
+    aws_service = get_aws_service()
     try:
-        payload = jwt.decode(token, secret, algorithms=["HS256"])
+        try:
+            payload = jwt.decode(token, aws_service.get_jwt_secret(), algorithms=["HS256"])
+        except jwt.ExpiredSignatureError:
+            raise
+        except jwt.JWTError:
+            # 시크릿이 교체되었을 수 있으므로 한 번만 새로 조회해서 재검증
+            if not aws_service.refresh_jwt_secret():
+                raise
+            payload = jwt.decode(token, aws_service.get_jwt_secret(), algorithms=["HS256"])
+
         if "exp" not in payload or time() > payload["exp"]:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail="다시 로그인해주세요"
             )
+        verified_token_cache.put(token, payload)
         return payload
 
+    except HTTPException:
+        raise
     except jwt.JWTError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="로그인을 해주세요"
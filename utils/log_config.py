@@ -0,0 +1,69 @@
+import os
+from typing import Dict, FrozenSet, Iterable
+
+from utils.logger import Logger
+
+
+# 허용 목록에 있더라도 값을 가리는 헤더
+REDACTED_HEADERS = frozenset({"authorization", "cookie", "set-cookie", "proxy-authorization"})
+
+
+class LogConfig:
+    """
+    요청/응답 로그 설정
+    - LOG_SAMPLE_RATE: 기본 샘플링 비율(0~1)
+    - LOG_ROUTE_SAMPLE_RATES: 라우트별 비율 ("GET /api/v1/reservations=0.1,PATCH /api/v1/reservations/kakao/approve=1")
+    - LOG_BODY_MAX_BYTES: 본문 최대 기록 길이
+    - LOG_HEADER_ALLOWLIST: 기록할 헤더 (쉼표 구분)
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(LogConfig, cls).__new__(cls)
+
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+
+        self.sample_rate = float(os.getenv('LOG_SAMPLE_RATE', '1.0'))
+        self.route_sample_rates = self._parse_route_sample_rates(os.getenv('LOG_ROUTE_SAMPLE_RATES', ''))
+        self.body_max_bytes = int(os.getenv('LOG_BODY_MAX_BYTES', '2048'))
+        self.header_allowlist: FrozenSet[str] = frozenset(
+            header.strip().lower()
+            for header in os.getenv(
+                'LOG_HEADER_ALLOWLIST',
+                'user-agent,content-type,content-length,x-request-id,x-forwarded-for'
+            ).split(',')
+            if header.strip()
+        )
+        self._initialized = True
+
+    def sample_rate_for(self, methods: Iterable[str], path: str) -> float:
+        for method in methods or ():
+            rate = self.route_sample_rates.get(f"{method.upper()} {path}")
+            if rate is not None:
+                return rate
+        return self.sample_rate
+
+    @staticmethod
+    def _parse_route_sample_rates(raw: str) -> Dict[str, float]:
+        rates: Dict[str, float] = {}
+        for item in raw.split(','):
+            if '=' not in item:
+                continue
+            route, rate = item.rsplit('=', 1)
+            # 잘못된 항목 때문에 앱이 시작되지 않으면 안 되므로 경고만 남기고 건너뜀
+            try:
+                method, path = route.strip().split(None, 1)
+                rates[f"{method.upper()} {path.strip()}"] = float(rate)
+            except ValueError:
+                Logger.setup_logger().warning(f"LOG_ROUTE_SAMPLE_RATES 항목을 무시합니다: {item.strip()!r}")
+        return rates
+
+
+def get_log_config() -> LogConfig:
+    return LogConfig()
@@ -1,10 +1,105 @@
+import atexit
+import json
 import logging
-import logging.config
+import logging.handlers
+import os
+import queue
+import threading
 from pathlib import Path
 from datetime import datetime
 
+from utils.metrics import LOG_RECORDS_DROPPED
+
+
+# LogRecord 기본 속성 (extra 로 전달된 필드만 JSON에 포함하기 위해 사용)
+_RESERVED_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    한 줄짜리 JSON 로그 포맷
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        log = {
+            "timestamp": datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
+            "level": record.levelname,
+            "thread": record.thread,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            log["exception"] = self.formatException(record.exc_info)
+
+        for key, value in vars(record).items():
+            if key not in _RESERVED_RECORD_ATTRS and not key.startswith("_"):
+                log[key] = value
+
+        return json.dumps(log, ensure_ascii=False, default=str)
+
+
+class DailyRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    날짜별 디렉터리(base_dir/YYYYmmdd/filename) + 용량 기준 로테이션
+    - 날짜가 바뀌면 새 디렉터리의 파일로 전환
+    """
+
+    def __init__(self, base_dir: Path, filename: str, **kwargs):
+        self._base_dir = base_dir
+        self._filename = filename
+        self._current_day = datetime.now().strftime("%Y%m%d")
+        super().__init__(str(self._path_for(self._current_day)), **kwargs)
+
+    def _path_for(self, day: str) -> Path:
+        daily_log_dir = self._base_dir / day
+        daily_log_dir.mkdir(parents=True, exist_ok=True)
+        return daily_log_dir / self._filename
+
+    def emit(self, record: logging.LogRecord) -> None:
+        today = datetime.fromtimestamp(record.created).strftime("%Y%m%d")
+        if today != self._current_day:
+            self._switch_day(today)
+        super().emit(record)
+
+    def _switch_day(self, day: str) -> None:
+        self.acquire()
+        try:
+            if self.stream:
+                self.stream.close()
+                self.stream = None
+            self.baseFilename = os.path.abspath(str(self._path_for(day)))
+            self._current_day = day
+        finally:
+            self.release()
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    큐가 가득 차면 기다리지 않고 버린 뒤 개수만 기록 (/metrics 의 reservation_log_records_dropped_total)
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+            LOG_RECORDS_DROPPED.inc()
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+
 class Logger:
     logger = None
+    queue_handler = None
+    listener = None
 
     @staticmethod
     def setup_logger():
@@ -13,41 +108,46 @@ class Logger:
             base_log_dir = Path(f"/var/log/spaceplace/{service_name}")
             base_log_dir.mkdir(parents=True, exist_ok=True)
 
-            today = datetime.now().strftime("%Y%m%d")
-            daily_log_dir = base_log_dir / today
-            daily_log_dir.mkdir(exist_ok=True)
-
-            log_config = {
-                'version': 1,
-                'formatters': {
-                    'detailed': {
-                        'format': '[%(asctime)s.%(msecs)03d] %(levelname)s [%(thread)d] - %(message)s',
-                        'datefmt': '%Y-%m-%d %H:%M:%S'
-                    }
-                },
-                'handlers': {
-                    'console': {
-                        'class': 'logging.StreamHandler',
-                        'level': 'INFO',
-                        'formatter': 'detailed'
-                    },
-                    'file': {
-                        'class': 'logging.handlers.RotatingFileHandler',
-                        'level': 'INFO',
-                        'formatter': 'detailed',
-                        'filename': str(daily_log_dir / 'logfile.log'),
-                        'maxBytes': 1024 * 1024,  # 1mb
-                        'backupCount': 10,
-                        'encoding': 'utf-8'
-                    }
-                },
-                'root': {
-                    'level': 'INFO',
-                    'handlers': ['console', 'file']
-                }
-            }
-
-            logging.config.dictConfig(log_config)
-            Logger.logger = logging.getLogger()
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(logging.INFO)
+            console_handler.setFormatter(
+                logging.Formatter(
+                    '[%(asctime)s.%(msecs)03d] %(levelname)s [%(thread)d] - %(message)s',
+                    datefmt='%Y-%m-%d %H:%M:%S'
+                )
+            )
+
+            # 멀티 워커 모드에서는 워커끼리 같은 파일을 로테이션하지 않도록 파일을 나눔
+            log_filename = 'logfile.log'
+            if int(os.getenv('WEB_CONCURRENCY', '1')) > 1:
+                log_filename = f'logfile-{os.getpid()}.log'
+
+            file_handler = DailyRotatingFileHandler(
+                base_log_dir,
+                log_filename,
+                maxBytes=int(os.getenv('LOG_MAX_BYTES', 1024 * 1024)),  # 1mb
+                backupCount=10,
+                encoding='utf-8'
+            )
+            file_handler.setLevel(logging.INFO)
+            file_handler.setFormatter(JsonFormatter())
+
+            # 이벤트 루프 스레드는 큐에 넣기만 하고, 파일/콘솔 출력은 백그라운드 스레드에서 처리
+            log_queue = queue.Queue(maxsize=int(os.getenv('LOG_QUEUE_SIZE', 10000)))
+            Logger.queue_handler = DroppingQueueHandler(log_queue)
+            Logger.listener = logging.handlers.QueueListener(
+                log_queue, console_handler, file_handler, respect_handler_level=True
+            )
+            Logger.listener.start()
+            atexit.register(Logger.listener.stop)
+
+            root = logging.getLogger()
+            root.setLevel(logging.INFO)
+            root.handlers = [Logger.queue_handler]
+            Logger.logger = root
 
         return Logger.logger
+
+    @staticmethod
+    def dropped_count() -> int:
+        return Logger.queue_handler.dropped if Logger.queue_handler else 0
@@ -0,0 +1,158 @@
+import os
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator
+
+from prometheus_client import Counter, Gauge, Histogram, multiprocess
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+# 멀티 워커 모드에서는 PROMETHEUS_MULTIPROC_DIR 에 워커별 값을 기록하고 /metrics 에서 합산
+# (Gauge 는 살아있는 워커 값의 합계, 종료된 워커는 mark_worker_dead 로 제외)
+
+# DB 커넥션 풀
+DB_POOL_CHECKED_OUT = Gauge(
+    "reservation_db_pool_checked_out",
+    "사용 중인 커넥션 수",
+    ["pool"],
+    multiprocess_mode="livesum"
+)
+DB_POOL_OVERFLOW = Gauge(
+    "reservation_db_pool_overflow",
+    "pool_size 를 초과해 사용 중인 overflow 커넥션 수",
+    ["pool"],
+    multiprocess_mode="livesum"
+)
+DB_POOL_ACQUIRE_SECONDS = Histogram(
+    "reservation_db_pool_acquire_seconds",
+    "풀에서 커넥션을 얻기까지 대기한 시간",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+DB_POOL_PRE_PING_FAILURES = Counter(
+    "reservation_db_pool_pre_ping_failures_total",
+    "pre-ping 실패로 폐기된 커넥션 수",
+    ["pool"]
+)
+
+# AWS SSM Parameter Store
+SSM_REQUEST_SECONDS = Histogram(
+    "reservation_ssm_request_seconds",
+    "SSM API 호출 시간",
+    ["operation"]
+)
+SSM_PARAMETER_LOOKUPS = Counter(
+    "reservation_ssm_parameter_lookups_total",
+    "파라미터 조회 수 (cache_hit: 캐시 사용, fetched: SSM 호출)",
+    ["result"]
+)
+
+# 핫패스
+JWT_VERIFY_SECONDS = Histogram(
+    "reservation_jwt_verify_seconds",
+    "JWT 검증 시간",
+    ["cache"],
+    buckets=(0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1)
+)
+ORDER_NUMBER_ALLOCATION_SECONDS = Histogram(
+    "reservation_order_number_allocation_seconds",
+    "주문번호 발급 시간",
+    ["source"],
+    buckets=(0.00001, 0.0001, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+)
+
+
+# 부하 차단
+ADMISSION_REJECTIONS = Counter(
+    "reservation_admission_rejections_total",
+    "요청 제한/부하 차단으로 거절한 요청 수 (reason: rate_limited, overloaded)",
+    ["reason", "priority"]
+)
+
+# 로그
+LOG_RECORDS_DROPPED = Counter(
+    "reservation_log_records_dropped_total",
+    "로그 큐가 가득 차서 버린 로그 레코드 수"
+)
+
+# 백그라운드 작업
+PENDING_RESERVATIONS_SWEPT = Counter(
+    "reservation_pending_swept_total",
+    "만료되어 정리된 PENDING 예약 수",
+    ["status"]
+)
+
+
+@contextmanager
+def observe_seconds(histogram: Histogram, **labels: str) -> Iterator[None]:
+    started_at = perf_counter()
+    try:
+        yield
+    finally:
+        histogram.labels(**labels).observe(perf_counter() - started_at)
+
+
+# 커넥션 대기 시간 이동 평균의 갱신 비율 (클수록 최근 값 비중이 큼)
+POOL_WAIT_SMOOTHING = 0.2
+# 커넥션 획득이 없는 동안 이동 평균이 절반으로 줄어드는 시간(초) (차단 후 회복되도록)
+POOL_WAIT_HALF_LIFE = 1.0
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    커넥션 획득 대기 시간과 사용량을 기록하는 풀
+    """
+    metrics_name = "primary"
+
+    _recent_wait = 0.0
+    _recent_wait_at = 0.0
+
+    def _do_get(self):
+        started_at = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = perf_counter() - started_at
+            recent_wait = self.recent_wait_seconds()
+            self._recent_wait = recent_wait + (waited - recent_wait) * POOL_WAIT_SMOOTHING
+            self._recent_wait_at = perf_counter()
+            DB_POOL_ACQUIRE_SECONDS.labels(pool=self.metrics_name).observe(waited)
+            self._update_usage_gauges()
+
+    def recent_wait_seconds(self) -> float:
+        """
+        최근 커넥션 획득 대기 시간의 지수 이동 평균(초), 부하 차단(admission control) 판단에 사용
+        """
+        idle = perf_counter() - self._recent_wait_at
+        return self._recent_wait * 0.5 ** (idle / POOL_WAIT_HALF_LIFE)
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self._update_usage_gauges()
+
+    def _update_usage_gauges(self) -> None:
+        DB_POOL_CHECKED_OUT.labels(pool=self.metrics_name).set(self.checkedout())
+        DB_POOL_OVERFLOW.labels(pool=self.metrics_name).set(max(self.overflow(), 0))
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> None:
+    """
+    풀 메트릭 라벨 지정 및 pre-ping 실패 카운터 연결
+    """
+    engine.sync_engine.pool.metrics_name = name
+
+    def _count_pre_ping_failure(context):
+        if context.is_pre_ping:
+            DB_POOL_PRE_PING_FAILURES.labels(pool=name).inc()
+
+    event.listen(engine.sync_engine, "handle_error", _count_pre_ping_failure)
+
+
+def mark_worker_dead(pid: int) -> None:
+    """
+    멀티 워커 모드에서 종료되는 워커의 Gauge 값을 집계에서 제외
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,172 @@
+import hashlib
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from utils.logger import Logger
+
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
+MIGRATION_TABLE = "schema_migration"
+# 여러 파드가 동시에 기동해도 DDL은 한 곳에서만 실행되도록 잡는 advisory lock 이름
+MIGRATION_LOCK_NAME = "space_place_reservation.schema_migration"
+# 다른 파드가 마이그레이션 중일 때 기다리는 최대 시간(초)
+MIGRATION_LOCK_TIMEOUT = int(os.getenv('MIGRATION_LOCK_TIMEOUT', '300'))
+
+MYSQL_DUPLICATE_COLUMN_NAME = 1060
+MYSQL_DUPLICATE_KEY_NAME = 1061
+MYSQL_NO_SUCH_TABLE = 1146
+# setup.sql 로 이미 만들어진 DB에서 같은 컬럼/인덱스를 다시 추가하는 경우는 적용된 것으로 봄
+_ALREADY_APPLIED_ERRORS = (MYSQL_DUPLICATE_COLUMN_NAME, MYSQL_DUPLICATE_KEY_NAME)
+
+_FILE_NAME_PATTERN = re.compile(r"^(\d+)_(\w+)\.sql$")
+_COMMENT_PATTERN = re.compile(r"^\s*--.*$", re.MULTILINE)
+_STATEMENT_DELIMITER = re.compile(r";\s*(?:\n|$)")
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    checksum: str
+    statements: List[str]
+
+
+def load_migrations(directory: Path = MIGRATIONS_DIR) -> List[Migration]:
+    """
+    migrations/<버전>_<이름>.sql 파일을 버전 순으로 읽음
+    - 문장 구분은 줄 끝의 ';' 기준
+    - checksum 은 파일 내용 전체의 sha256
+    """
+    migrations = []
+    for path in sorted(directory.glob("*.sql")):
+        matched = _FILE_NAME_PATTERN.match(path.name)
+        if not matched:
+            raise RuntimeError(f"마이그레이션 파일 이름 형식이 올바르지 않습니다: {path.name}")
+
+        content = path.read_text(encoding="utf-8")
+        body = _COMMENT_PATTERN.sub("", content)
+        migrations.append(Migration(
+            version=int(matched.group(1)),
+            name=matched.group(2),
+            checksum=hashlib.sha256(content.encode("utf-8")).hexdigest(),
+            statements=[statement.strip() for statement in _STATEMENT_DELIMITER.split(body) if statement.strip()],
+        ))
+
+    versions = [migration.version for migration in migrations]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError("마이그레이션 버전이 중복되었습니다.")
+    return sorted(migrations, key=lambda migration: migration.version)
+
+
+class MigrationRunner:
+    """
+    버전 테이블 기반 스키마 마이그레이션
+    - 이미 적용된 버전(checksum 일치)은 건너뜀, 모두 적용된 경우 조회 1번으로 끝남
+    - 적용할 버전이 있으면 GET_LOCK 으로 한 파드만 DDL 실행, 나머지는 대기 후 재확인
+    - 적용된 파일이 수정된 경우(checksum 불일치) 기동 중단
+    - 인덱스 추가는 마이그레이션 파일에서 ALGORITHM=INPLACE, LOCK=NONE 으로 작성 (온라인 DDL)
+    """
+
+    def __init__(self, engine: AsyncEngine, migrations: List[Migration] = None):
+        self._engine = engine
+        self._migrations = migrations if migrations is not None else load_migrations()
+        self._logger = Logger.setup_logger()
+
+    async def run(self) -> List[int]:
+        # DDL은 트랜잭션에 묶이지 않으므로 autocommit 커넥션에서 실행
+        async with self._engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+            if not self._pending(await self._applied_checksums(conn)):
+                self._logger.info('스키마 최신 상태 (적용할 마이그레이션 없음)')
+                return []
+
+            acquired = (await conn.execute(
+                text("SELECT GET_LOCK(:name, :timeout)"),
+                {"name": MIGRATION_LOCK_NAME, "timeout": MIGRATION_LOCK_TIMEOUT}
+            )).scalar()
+            if acquired != 1:
+                raise RuntimeError(f"마이그레이션 잠금을 {MIGRATION_LOCK_TIMEOUT}초 안에 얻지 못했습니다.")
+
+            try:
+                await self._create_version_table(conn)
+                # 잠금을 기다리는 동안 다른 파드가 적용했을 수 있으므로 다시 확인
+                applied_versions = []
+                for migration in self._pending(await self._applied_checksums(conn)):
+                    await self._apply(conn, migration)
+                    applied_versions.append(migration.version)
+                return applied_versions
+            finally:
+                await conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": MIGRATION_LOCK_NAME})
+
+    def _pending(self, applied: Dict[int, str]) -> List[Migration]:
+        pending = []
+        for migration in self._migrations:
+            checksum = applied.get(migration.version)
+            if checksum is None:
+                pending.append(migration)
+            elif checksum != migration.checksum:
+                raise RuntimeError(
+                    f"이미 적용된 마이그레이션이 변경되었습니다: {migration.version}_{migration.name} "
+                    f"(새 버전 파일로 추가해 주세요)"
+                )
+        return pending
+
+    async def _applied_checksums(self, conn: AsyncConnection) -> Dict[int, str]:
+        try:
+            result = await conn.execute(text(f"SELECT version, checksum FROM {MIGRATION_TABLE}"))
+        except ProgrammingError as e:
+            if e.orig.args[0] != MYSQL_NO_SUCH_TABLE:
+                raise
+            return {}
+        return {version: checksum for version, checksum in result.all()}
+
+    async def _create_version_table(self, conn: AsyncConnection) -> None:
+        await conn.execute(text(
+            f"""
+            CREATE TABLE IF NOT EXISTS {MIGRATION_TABLE} (
+                version INT PRIMARY KEY,
+                name VARCHAR(255) NOT NULL,
+                checksum CHAR(64) NOT NULL,
+                execution_ms INT NOT NULL,
+                applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        ))
+
+    async def _apply(self, conn: AsyncConnection, migration: Migration) -> None:
+        started_at = perf_counter()
+        for statement in migration.statements:
+            try:
+                await conn.execute(text(statement))
+            except OperationalError as e:
+                if e.orig.args[0] not in _ALREADY_APPLIED_ERRORS:
+                    raise
+                self._logger.info(f'이미 적용된 변경 건너뜀 ({migration.version}_{migration.name}): {e.orig.args[1]}')
+
+        execution_ms = int((perf_counter() - started_at) * 1000)
+        await conn.execute(
+            text(
+                f"INSERT INTO {MIGRATION_TABLE} (version, name, checksum, execution_ms) "
+                f"VALUES (:version, :name, :checksum, :execution_ms)"
+            ),
+            {
+                "version": migration.version,
+                "name": migration.name,
+                "checksum": migration.checksum,
+                "execution_ms": execution_ms,
+            }
+        )
+        self._logger.info(f'마이그레이션 적용: {migration.version}_{migration.name} ({execution_ms}ms)')
+
+
+async def run_migrations(engine: AsyncEngine) -> List[int]:
+    return await MigrationRunner(engine).run()
@@ -1,12 +1,27 @@
 
+import os
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from time import monotonic
+from typing import AsyncContextManager, AsyncGenerator, Dict, Optional
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from utils.logger import Logger
+from utils.migration import run_migrations
+from utils.metrics import InstrumentedAsyncQueuePool, instrument_engine
+from utils.query_trace import instrument_query_tracing
 from utils.type.db_config_type import DBConfig
+from utils.type.pool_status_type import PoolStatus
+from utils.worker_config import get_worker_config
+
+
+# 쓰기 이후 해당 사용자의 조회를 primary로 보내는 시간(초)
+# - 최근 쓰기 기록은 프로세스 메모리에만 있으므로 쓰기를 처리한 워커로 온 조회에만 적용
+#   (다른 파드나 같은 파드의 다른 워커로 간 조회는 복제본을 읽어 복제 지연만큼 이전 상태를 볼 수 있음)
+READ_YOUR_WRITES_WINDOW = float(os.getenv('READ_YOUR_WRITES_WINDOW', '5'))
+RECENT_WRITERS_MAX_ENTRIES = 10000
+# 커넥션 풀 설정 (워커당 크기는 WorkerConfig 에서 커넥션 budget 기준으로 계산)
+DB_POOL_TIMEOUT = float(os.getenv('RESERVATION_DB_POOL_TIMEOUT', '30'))
 
 
 class MySQLDatabase:
@@ -16,6 +31,9 @@ class MySQLDatabase:
     _instance = None
     _engine = None
     _session_maker = None
+    _reader_engine = None
+    _reader_session_maker = None
+    _recent_writers: Dict[str, float] = {}
 
     def __new__(cls, *args):
         if cls._instance is None:
@@ -24,41 +42,56 @@ class MySQLDatabase:
         return cls._instance
     
     def __init__(self, db_config: DBConfig = None):
-        if not hasattr(self, '_db_config'):
+        if getattr(self, '_db_config', None) is None and db_config is not None:
             self._logger.info('데이터 베이스가 연동 되었습니다.')
             self._db_config = db_config
 
+    @property
+    def is_configured(self) -> bool:
+        return getattr(self, '_db_config', None) is not None
+
     async def initialize(self):
         if not self._engine:
-            connection_string = self._build_connection_string()
-            self._engine = create_async_engine(
-                connection_string,
-                echo=False,
-                pool_pre_ping=True,
-                pool_size=10,
-                max_overflow=20
-            )
+            self._engine = self._create_engine(self._db_config.host, "primary")
             self._session_maker = sessionmaker(
                 self._engine,
                 class_=AsyncSession,
                 expire_on_commit=False
             )
 
-            await self.create_tables()  
+            # 읽기 전용 복제본(reader) 엔드포인트가 있으면 별도 풀로 연결
+            if self._db_config.reader_host:
+                self._reader_engine = self._create_engine(self._db_config.reader_host, "reader")
+                self._reader_session_maker = sessionmaker(
+                    self._reader_engine,
+                    class_=AsyncSession,
+                    expire_on_commit=False
+                )
+                self._logger.info('읽기 전용 데이터 베이스가 연동 되었습니다.')
 
-    async def create_tables(self):
-        async with self.session() as session:
-            with open('setup.sql', 'r', encoding='utf-8') as file:
-                sql_commands = file.read().split(';')
-                
-            for command in sql_commands:
-                if command.strip():
-                    await session.execute(text(command.strip()))
+            await self.migrate()
 
-            self._logger.info('테이블 준비 완료')
-    
-    def _build_connection_string(self) -> str:
-        host = self._db_config.host
+    def _create_engine(self, host: str, name: str) -> AsyncEngine:
+        worker_config = get_worker_config()
+        engine = create_async_engine(
+            self._build_connection_string(host),
+            echo=False,
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_pre_ping=True,
+            pool_size=worker_config.pool_size,
+            max_overflow=worker_config.max_overflow,
+            pool_timeout=DB_POOL_TIMEOUT
+        )
+        instrument_engine(engine, name)
+        instrument_query_tracing(engine)
+        return engine
+
+    async def migrate(self):
+        applied_versions = await run_migrations(self._engine)
+        if applied_versions:
+            self._logger.info(f'테이블 준비 완료 (적용 버전: {applied_versions})')
+
+    def _build_connection_string(self, host: str) -> str:
         dbname = self._db_config.dbname
         username = self._db_config.username
         password = self._db_config.password
@@ -77,16 +110,93 @@ class MySQLDatabase:
                 await session.rollback()
                 raise
 
+    @asynccontextmanager
+    async def reader_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        읽기 전용 세션 (reader 엔드포인트가 없으면 primary 사용)
+        """
+        if not self._session_maker:
+            await self.initialize()
+        if not self._reader_session_maker:
+            async with self.session() as session:
+                yield session
+            return
+
+        async with self._reader_session_maker() as session:
+            try:
+                yield session
+            finally:
+                await session.rollback()
+
+    def pool_status(self) -> Optional[PoolStatus]:
+        """
+        primary 커넥션 풀 사용량 (엔진 생성 전이면 None)
+        """
+        return self._pool_status(self._engine)
+
+    def reader_pool_status(self) -> Optional[PoolStatus]:
+        """
+        reader 커넥션 풀 사용량 (reader 엔드포인트가 없으면 None)
+        """
+        return self._pool_status(self._reader_engine)
+
+    @staticmethod
+    def _pool_status(engine: Optional[AsyncEngine]) -> Optional[PoolStatus]:
+        if not engine:
+            return None
+        pool = engine.sync_engine.pool
+        worker_config = get_worker_config()
+        return PoolStatus(
+            checked_out=pool.checkedout(),
+            capacity=worker_config.pool_size + max(worker_config.max_overflow, 0),
+            recent_wait_seconds=pool.recent_wait_seconds(),
+        )
+
+    def mark_user_write(self, user_id: str) -> None:
+        """
+        쓰기 직후 일정 시간 동안 해당 사용자의 조회를 primary로 보냄 (read-your-writes)
+        """
+        now = monotonic()
+        self._recent_writers[user_id] = now + READ_YOUR_WRITES_WINDOW
+        if len(self._recent_writers) > RECENT_WRITERS_MAX_ENTRIES:
+            self._recent_writers = {
+                writer: expires_at for writer, expires_at in self._recent_writers.items() if expires_at > now
+            }
+
+    def read_session_for(self, user_id: str) -> AsyncContextManager[AsyncSession]:
+        """
+        조회 전용 세션: 최근 쓰기가 없는 사용자는 복제본, 있으면 primary
+        """
+        if self.should_read_primary(user_id):
+            return self.session()
+        return self.reader_session()
+
+    def should_read_primary(self, user_id: str) -> bool:
+        if not self._reader_session_maker:
+            return True
+        expires_at = self._recent_writers.get(user_id)
+        return expires_at is not None and expires_at > monotonic()
+
     async def close(self):
+        if self._reader_engine:
+            await self._reader_engine.dispose()
+            self._reader_engine = None
+            self._reader_session_maker = None
         if self._engine:
             await self._engine.dispose()
             self._engine = None
             self._session_maker = None
             self._logger.info('DB 커넥션 해제')
 
+def get_database() -> MySQLDatabase:
+    # lifespan에서 구성된 인스턴스를 재사용하고, 설정이 없을 때만 DB 설정을 조회
+    db = MySQLDatabase()
+    if not db.is_configured:
+        from utils.database_config import DatabaseConfig
+
+        db = DatabaseConfig().create_database()
+    return db
+
 async def get_mysql_session() -> AsyncGenerator[AsyncSession, None]:
-    from utils.database_config import DatabaseConfig
-    
-    db = MySQLDatabase(DatabaseConfig().get_db_config())
-    async with db.session() as session:
-        yield session
\ No newline at end of file
+    async with get_database().session() as session:
+        yield session
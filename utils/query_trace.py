@@ -0,0 +1,178 @@
+import hashlib
+import os
+import re
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from time import perf_counter, time_ns
+from typing import Dict, Optional
+
+from opentelemetry import trace
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from utils.logger import Logger
+
+
+# 요청당 쿼리 수가 이 값을 넘으면 경고 로그 (N+1 탐지)
+SQL_TRACE_MAX_QUERIES = int(os.getenv('SQL_TRACE_MAX_QUERIES', '10'))
+# 요청 내 한 쿼리가 이 시간(ms)을 넘으면 경고 로그
+SQL_TRACE_SLOW_QUERY_MS = float(os.getenv('SQL_TRACE_SLOW_QUERY_MS', '100'))
+
+_tracer = trace.get_tracer(__name__)
+
+_LITERAL_PATTERNS = (
+    (re.compile(r"'(?:[^'\\]|\\.)*'"), "?"),
+    (re.compile(r"%\(\w+\)s|%s|\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"\?(?:\s*,\s*\?)+"), "?+"),
+    (re.compile(r"\s+"), " "),
+)
+
+
+@dataclass
+class QueryStats:
+    statement: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+@dataclass
+class RequestQueryTrace:
+    query_count: int = 0
+    total_ms: float = 0.0
+    queries: Dict[str, QueryStats] = field(default_factory=dict)
+
+    def record(self, fingerprint: str, statement: str, elapsed_ms: float) -> None:
+        self.query_count += 1
+        self.total_ms += elapsed_ms
+        stats = self.queries.get(fingerprint)
+        if stats is None:
+            stats = self.queries[fingerprint] = QueryStats(statement=statement)
+        stats.count += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+
+
+_current_trace: ContextVar[Optional[RequestQueryTrace]] = ContextVar("request_query_trace", default=None)
+
+
+@lru_cache(maxsize=1024)
+def fingerprint_statement(statement: str):
+    """
+    리터럴/바인드 파라미터를 ? 로 치환한 정규화 문장과 그 해시
+    """
+    normalized = statement
+    for pattern, replacement in _LITERAL_PATTERNS:
+        normalized = pattern.sub(replacement, normalized)
+    normalized = normalized.strip()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:12], normalized
+
+
+def instrument_query_tracing(engine: AsyncEngine) -> None:
+    """
+    커서 실행마다 요청 단위 통계를 누적하고 OpenTelemetry 자식 span 생성
+    """
+
+    # 시작 시각은 실행 컨텍스트에 둠: 문장이 실패하면 after_cursor_execute 가 호출되지 않으므로
+    # 풀링된 커넥션(conn.info)에 쌓으면 커넥션 수명 동안 계속 늘어남
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._trace_started_at = (perf_counter(), time_ns())
+
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started_at = getattr(context, "_trace_started_at", None)
+        if started_at is None:
+            return
+        started_at, started_at_ns = started_at
+        elapsed_ms = (perf_counter() - started_at) * 1000
+        fingerprint, normalized = fingerprint_statement(statement)
+
+        request_trace = _current_trace.get()
+        if request_trace is not None:
+            request_trace.record(fingerprint, normalized, elapsed_ms)
+
+        span = _tracer.start_span(
+            "db.query",
+            kind=trace.SpanKind.CLIENT,
+            start_time=started_at_ns,
+            attributes={
+                "db.system": "mysql",
+                "db.statement": normalized,
+                "db.statement.fingerprint": fingerprint,
+            },
+        )
+        span.end(end_time=started_at_ns + int(elapsed_ms * 1_000_000))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryTraceMiddleware:
+    """
+    요청 단위 DB 쿼리 수/시간 집계
+    - 응답 헤더 Server-Timing: db;dur=<ms>;desc="<n> queries"
+    - 현재 요청 span에 합계 속성 추가
+    - 임계값 초과 시 쿼리 지문별 경고 로그
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._logger = Logger.setup_logger()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_trace = RequestQueryTrace()
+        token = _current_trace.set(request_trace)
+
+        async def send_with_server_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and request_trace.query_count:
+                headers = list(message.get("headers", []))
+                headers.append((
+                    b"server-timing",
+                    f'db;dur={request_trace.total_ms:.2f};desc="{request_trace.query_count} queries"'.encode("latin-1"),
+                ))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            _current_trace.reset(token)
+            if request_trace.query_count:
+                self._report(scope, request_trace)
+
+    def _report(self, scope: Scope, request_trace: RequestQueryTrace) -> None:
+        span = trace.get_current_span()
+        span.set_attribute("db.query_count", request_trace.query_count)
+        span.set_attribute("db.total_ms", round(request_trace.total_ms, 2))
+
+        slow_queries = [stats for stats in request_trace.queries.values() if stats.max_ms > SQL_TRACE_SLOW_QUERY_MS]
+        if request_trace.query_count <= SQL_TRACE_MAX_QUERIES and not slow_queries:
+            return
+
+        self._logger.warning(
+            f"쿼리 임계값 초과: {scope['method']} {scope['path']} "
+            f"{request_trace.query_count} queries, {request_trace.total_ms:.2f}ms",
+            extra={
+                "url": scope["path"],
+                "queryCount": request_trace.query_count,
+                "dbTotalMs": round(request_trace.total_ms, 2),
+                "queries": [
+                    {
+                        "fingerprint": fingerprint,
+                        "statement": stats.statement,
+                        "count": stats.count,
+                        "totalMs": round(stats.total_ms, 2),
+                        "maxMs": round(stats.max_ms, 2),
+                    }
+                    for fingerprint, stats in sorted(
+                        request_trace.queries.items(), key=lambda item: item[1].total_ms, reverse=True
+                    )
+                ],
+            }
+        )
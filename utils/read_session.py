@@ -0,0 +1,13 @@
+from typing import AsyncGenerator
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from utils.authenticate import userAuthenticate
+from utils.mysqldb import get_database
+
+
+# 조회 전용 핸들러용 세션 의존성 (복제본 + read-your-writes)
+async def get_mysql_read_session(token_info=Depends(userAuthenticate)) -> AsyncGenerator[AsyncSession, None]:
+    async with get_database().read_session_for(token_info["user_id"]) as session:
+        yield session
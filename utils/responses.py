@@ -0,0 +1,14 @@
+from typing import Any
+
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    pydantic-core(Rust) 직렬화기를 사용하는 JSON 응답
+    - datetime, Enum 등을 jsonable_encoder 없이 바로 직렬화
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -0,0 +1,33 @@
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict, Iterator
+
+from utils.logger import Logger
+
+
+class StartupTimer:
+    """
+    애플리케이션 시작 단계별 소요 시간(ms) 측정
+    """
+
+    def __init__(self):
+        self._started_at = perf_counter()
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        started_at = perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round((perf_counter() - started_at) * 1000, 2)
+
+    @property
+    def total(self) -> float:
+        return round((perf_counter() - self._started_at) * 1000, 2)
+
+    def report(self) -> Dict[str, float]:
+        summary = {**self.timings, "total": self.total}
+        breakdown = ", ".join(f"{name}={elapsed}ms" for name, elapsed in summary.items())
+        Logger.setup_logger().info(f"애플리케이션 준비 완료: {breakdown}", extra={"startupTimings": summary})
+        return summary
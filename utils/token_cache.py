@@ -0,0 +1,54 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from time import time
+from typing import Dict, Optional, Tuple
+
+
+class VerifiedTokenCache:
+    """
+    검증이 끝난 JWT의 payload를 보관하는 LRU 캐시
+    - 토큰 원문 대신 digest를 키로 사용
+    - 각 토큰의 exp 시각이 지나면 제거
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self._max_size = max_size
+        self._entries: "OrderedDict[bytes, Tuple[Dict, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[Dict]:
+        key = self._digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if expires_at <= time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def put(self, token: str, payload: Dict) -> None:
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)) or expires_at <= time():
+            return
+
+        key = self._digest(token)
+        with self._lock:
+            self._entries[key] = (payload, float(expires_at))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+verified_token_cache = VerifiedTokenCache()
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -6,4 +7,5 @@ class DBConfig:
     host: str
     dbname: str
     username: str
-    password: str
\ No newline at end of file
+    password: str
+    reader_host: Optional[str] = None
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class PoolStatus:
+    checked_out: int
+    capacity: int
+    recent_wait_seconds: float
+
+    @property
+    def usage(self) -> float:
+        return self.checked_out / self.capacity if self.capacity else 0.0
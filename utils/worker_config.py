@@ -0,0 +1,106 @@
+import math
+import os
+from pathlib import Path
+from typing import Optional
+
+
+CGROUP_V2_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+CGROUP_V1_CPU_QUOTA = Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+CGROUP_V1_CPU_PERIOD = Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+# 한 작업이 동시에 잡는 최대 커넥션 수 (PENDING 정리 작업: advisory lock 세션 + 배치 세션)
+MAX_NESTED_SESSIONS = 2
+# 워커당 최소 풀 크기: 중첩 세션을 잡은 작업 둘이 서로의 커넥션 반납을 기다리며 풀을 소진하지 않도록 여유를 둠
+MIN_POOL_SIZE = 2 * MAX_NESTED_SESSIONS
+
+
+def cgroup_cpu_limit() -> Optional[float]:
+    """
+    컨테이너 CPU 제한(코어 수), 제한이 없거나 확인할 수 없으면 None
+    """
+    try:
+        if CGROUP_V2_CPU_MAX.exists():
+            quota, period = CGROUP_V2_CPU_MAX.read_text().split()[:2]
+            if quota == "max":
+                return None
+            return int(quota) / int(period)
+
+        if CGROUP_V1_CPU_QUOTA.exists():
+            quota = int(CGROUP_V1_CPU_QUOTA.read_text())
+            if quota <= 0:
+                return None
+            return quota / int(CGROUP_V1_CPU_PERIOD.read_text())
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+class WorkerConfig:
+    """
+    워커 프로세스 수와 워커당 DB 커넥션 풀 크기
+    - WEB_CONCURRENCY: 워커 수 (기본 1, "auto" 면 cgroup CPU 제한을 올림한 값, 제한이 없으면 1)
+    - WEB_CONCURRENCY_MAX: 자동 계산 시 최대 워커 수
+    - 워커가 2개 이상이면 아래 상태가 워커 프로세스마다 따로 있어 같은 워커로 온 요청 사이에서만 보장됨
+      (공유 CacheBackend/저장소가 생기기 전까지 기본값을 1로 둠)
+      - read-your-writes: 다른 워커로 간 조회는 복제본을 읽어 최대 복제 지연만큼 이전 상태를 볼 수 있음
+      - 예약 목록 캐시: 다른 워커의 캐시는 무효화되지 않아 최대 RESERVATION_LIST_CACHE_TTL 동안 이전 페이지 응답
+      - 공간 예약 현황 비트맵: 최대 SPACE_AVAILABILITY_CACHE_TTL 동안 이전 현황 응답
+    - RESERVATION_DB_CONNECTION_BUDGET: 파드(모든 워커 합계)가 DB 엔드포인트 하나에 여는 최대 커넥션 수
+      설정하면 워커당 pool_size + max_overflow 가 budget // 워커 수 를 넘지 않도록 줄임
+      단, pool_size 는 MIN_POOL_SIZE 아래로 줄이지 않음 (budget 이 워커 수 * MIN_POOL_SIZE 보다 작으면 budget 을 넘을 수 있음)
+    - RESERVATION_DB_POOL_SIZE / RESERVATION_DB_MAX_OVERFLOW: 워커당 기본 풀 크기
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(WorkerConfig, cls).__new__(cls)
+
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+
+        self.workers = self._resolve_workers()
+        self.pool_size, self.max_overflow = self._resolve_pool_limits(self.workers)
+        self._initialized = True
+
+    @staticmethod
+    def _resolve_workers() -> int:
+        configured = os.getenv('WEB_CONCURRENCY', '1')
+        if configured != 'auto':
+            return max(int(configured), 1)
+
+        cpu_limit = cgroup_cpu_limit()
+        if cpu_limit is None:
+            return 1
+        workers = max(math.ceil(cpu_limit), 1)
+        return min(workers, int(os.getenv('WEB_CONCURRENCY_MAX', '8')))
+
+    @staticmethod
+    def _resolve_pool_limits(workers: int):
+        pool_size = int(os.getenv('RESERVATION_DB_POOL_SIZE', '10'))
+        max_overflow = int(os.getenv('RESERVATION_DB_MAX_OVERFLOW', '20'))
+
+        budget = os.getenv('RESERVATION_DB_CONNECTION_BUDGET')
+        if not budget:
+            return pool_size, max_overflow
+
+        per_worker = int(budget) // workers
+        pool_size = max(min(pool_size, per_worker), MIN_POOL_SIZE)
+        max_overflow = max(min(max_overflow, per_worker - pool_size), 0)
+        return pool_size, max_overflow
+
+    @property
+    def is_multiprocess(self) -> bool:
+        return self.workers > 1
+
+
+def get_worker_config() -> WorkerConfig:
+    return WorkerConfig()
+
+
+if __name__ == "__main__":
+    # entry_point.sh 에서 uvicorn --workers 값으로 사용
+    print(get_worker_config().workers)